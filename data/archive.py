@@ -0,0 +1,194 @@
+"""
+Packed graphics archive.
+
+Decoding PNG and JPG files and converting them to the display format is
+most of what it costs to load a graphic. build writes the already
+converted pixels of every graphic prepare.GFX knows about into a single
+file, resources/graphics.pack, with an index of where each one is. At
+runtime the file is opened with mmap and surfaces are made straight from
+it with pg.image.frombuffer, without decoding anything.
+
+Each entry records the modification time and CRC of the file it was made
+from. If the file has changed since the archive was built the entry is
+ignored and the file is loaded as usual. Sheets that are cut into parts
+(cards, neon buttons) are stored whole; their parts stay subsurfaces.
+
+Build or rebuild the archive from the top level folder with:
+
+    python -m data.archive
+"""
+import json
+import mmap
+import os
+import struct
+import zlib
+from timeit import default_timer
+
+import pygame as pg
+
+
+ARCHIVE_PATH = os.path.join("resources", "graphics.pack")
+MAGIC = b"PYRPACK1"
+HEADER = struct.Struct("<8sII")
+PIXEL_FORMAT = "BGRA"
+ALIGN = 16
+
+
+def file_crc(path):
+    """Return the CRC32 of the contents of the file at path."""
+    with open(path, "rb") as source:
+        return zlib.crc32(source.read()) & 0xffffffff
+
+
+def open_archive(path=ARCHIVE_PATH):
+    """Return the Archive at path, or None if there is no usable one."""
+    try:
+        return Archive(path)
+    except (IOError, OSError, ValueError):
+        return None
+
+
+class Archive(object):
+    """
+    A graphics archive opened for reading. load returns a surface for an
+    up to date entry, or None so the caller can fall back to the file.
+    """
+    def __init__(self, path=ARCHIVE_PATH):
+        self.path = path
+        self.hits = 0
+        self.stale = 0
+        with open(path, "rb") as archive_file:
+            self._map = mmap.mmap(archive_file.fileno(), 0,
+                                  access=mmap.ACCESS_COPY)
+        if len(self._map) < HEADER.size:
+            raise ValueError("{} is not a graphics archive".format(path))
+        magic, index_size, data_start = HEADER.unpack_from(self._map)
+        if magic != MAGIC:
+            raise ValueError("{} is not a graphics archive".format(path))
+        index = self._map[HEADER.size:HEADER.size+index_size]
+        self.index = json.loads(index.decode("utf-8"))
+        self._data = memoryview(self._map)[data_start:]
+        self._alpha_masks = None
+
+    def __contains__(self, name):
+        return name in self.index
+
+    def is_fresh(self, entry):
+        """
+        True if the source file of entry is unchanged. A different
+        modification time alone does not count if the contents match.
+        """
+        try:
+            mtime = os.path.getmtime(entry["source"])
+        except OSError:
+            return False
+        if mtime == entry["mtime"]:
+            return True
+        if file_crc(entry["source"]) == entry["crc"]:
+            entry["mtime"] = mtime
+            return True
+        return False
+
+    def load(self, name):
+        """
+        Return the surface stored as name, or None if there is no entry for
+        it or its source file has changed. Images with per pixel alpha use
+        the archive's memory directly when it is in the display format.
+        """
+        entry = self.index.get(name)
+        if entry is None:
+            return None
+        if not self.is_fresh(entry):
+            self.stale += 1
+            return None
+        start = entry["offset"]
+        pixels = self._data[start:start+entry["length"]]
+        image = pg.image.frombuffer(pixels, entry["size"], PIXEL_FORMAT)
+        if entry["alpha"]:
+            if image.get_masks() != self.alpha_masks:
+                image = image.convert_alpha()
+        else:
+            image = image.convert()
+            image.set_colorkey(entry["colorkey"])
+        self.hits += 1
+        return image
+
+    @property
+    def alpha_masks(self):
+        if self._alpha_masks is None:
+            display_alpha = pg.Surface((1, 1), pg.SRCALPHA).convert_alpha()
+            self._alpha_masks = display_alpha.get_masks()
+        return self._alpha_masks
+
+
+def build(sources, path=ARCHIVE_PATH, load=None):
+    """
+    Write an archive of sources, a dict of name: (file path, colorkey),
+    to path. load(file path, colorkey) gives the surface to store and
+    defaults to tools.load_gfx. The file is written under a temporary
+    name and renamed into place. Returns the number of bytes written.
+    """
+    if load is None:
+        from . import tools
+        load = tools.load_gfx
+    index = {}
+    blobs = []
+    offset = 0
+    for name in sorted(sources):
+        source, colorkey = sources[name]
+        image = load(source, colorkey)
+        pixels = pg.image.tostring(image, PIXEL_FORMAT)
+        key = image.get_colorkey()
+        index[name] = {"offset": offset,
+                       "length": len(pixels),
+                       "size": list(image.get_size()),
+                       "alpha": bool(image.get_flags() & pg.SRCALPHA),
+                       "colorkey": list(key) if key else None,
+                       "source": source,
+                       "mtime": os.path.getmtime(source),
+                       "crc": file_crc(source)}
+        padding = -len(pixels) % ALIGN
+        blobs.append(pixels + b"\0"*padding)
+        offset += len(pixels)+padding
+    index_data = json.dumps(index, sort_keys=True).encode("utf-8")
+    data_start = HEADER.size+len(index_data)
+    index_data += b" "*(-data_start % ALIGN)
+    data_start = HEADER.size+len(index_data)
+    temp_path = path+".tmp"
+    with open(temp_path, "wb") as archive_file:
+        archive_file.write(HEADER.pack(MAGIC, len(index_data), data_start))
+        archive_file.write(index_data)
+        for blob in blobs:
+            archive_file.write(blob)
+    replace = getattr(os, "replace", os.rename)
+    replace(temp_path, path)
+    return data_start+offset
+
+
+def benchmark(sources, archive):
+    """
+    Time loading every source from its file and from archive. Returns
+    (file_ms, archive_ms).
+    """
+    from . import tools
+    start = default_timer()
+    for source, colorkey in sources.values():
+        tools.load_gfx(source, colorkey)
+    from_files = (default_timer()-start)*1000.0
+    start = default_timer()
+    for name in sources:
+        archive.load(name)
+    from_archive = (default_timer()-start)*1000.0
+    return from_files, from_archive
+
+
+if __name__ == "__main__":
+    from data import prepare
+    sources = prepare.GFX.sources
+    size = build(sources)
+    print("Wrote {} graphics, {:.1f} MB, to {}".format(len(sources),
+                                                      size/2.**20,
+                                                      ARCHIVE_PATH))
+    from_files, from_archive = benchmark(sources, Archive())
+    print("Load all from files: {:.0f} ms, from archive: {:.0f} ms".format(
+        from_files, from_archive))
@@ -0,0 +1,297 @@
+"""
+On-demand asset registries.
+
+prepare.GFX and prepare.SFX are AssetRegistry instances. They behave like
+the dicts they replace but only hold the name of each file until it is
+first looked up, when it is decoded and kept. Names can be queued to be
+warmed a little at a time each frame (warm and warm_step) so a game's
+assets are ready before it is started, or decoded on worker threads by a
+loader.BackgroundLoader (load_in_background).
+
+Given a budget in bytes a registry drops its least recently used large
+assets (full surfaces and sounds of at least large bytes) once it holds
+more than the budget. They are decoded again if looked up later. Only the
+registry's reference is dropped, so anything still using an asset keeps
+it alive.
+"""
+import os
+import threading
+from collections import OrderedDict, deque
+from timeit import default_timer
+
+try:
+    from collections.abc import MutableMapping
+except ImportError:
+    from collections import MutableMapping
+
+import pygame as pg
+
+from . import tools
+
+
+def size_of(asset):
+    """
+    Return the number of bytes held by asset. Subsurfaces share their
+    parent's pixels and count as nothing.
+    """
+    if isinstance(asset, pg.Surface):
+        if asset.get_parent() is not None:
+            return 0
+        return asset.get_bytesize()*asset.get_width()*asset.get_height()
+    if isinstance(asset, pg.mixer.Sound):
+        frequency, size, channels = pg.mixer.get_init()
+        samples = asset.get_length()*frequency
+        return int(samples*channels*abs(size)//8)
+    return 0
+
+
+class AssetRegistry(MutableMapping):
+    """
+    A dict of assets that loads each entry the first time it is looked up.
+    Entries are added with register (a loader to call later), register_part
+    (a subsurface of another entry) or plain assignment (an asset that is
+    already loaded and is never evicted).
+    """
+    def __init__(self, budget=None, large=256*1024):
+        self.budget = budget
+        self.large = large
+        self.resident = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.load_time = 0.0
+        self.sources = {}
+        self._loaders = OrderedDict()
+        self._parts = {}
+        self._stages = {}
+        self._loaded = OrderedDict()
+        self._sizes = {}
+        self._warm_queue = deque()
+        self._urgent_queue = deque()
+        self._lock = threading.RLock()
+
+    def __repr__(self):
+        return "<AssetRegistry {} of {} loaded, {:.1f} MB>".format(
+            len(self._loaded), len(self._loaders), self.resident/2.**20)
+
+    def __getitem__(self, name):
+        with self._lock:
+            try:
+                asset = self._loaded.pop(name)
+            except KeyError:
+                self.misses += 1
+                return self._load(name)
+            self._loaded[name] = asset
+            self.hits += 1
+            return asset
+
+    def __setitem__(self, name, asset):
+        with self._lock:
+            self.discard(name)
+            self._loaders[name] = None
+            self._loaded[name] = asset
+
+    def __delitem__(self, name):
+        with self._lock:
+            self.discard(name)
+            del self._loaders[name]
+            self._loaded.pop(name, None)
+            self._parts.pop(name, None)
+
+    def __contains__(self, name):
+        return name in self._loaders
+
+    def __iter__(self):
+        return iter(list(self._loaders))
+
+    def __len__(self):
+        return len(self._loaders)
+
+    def register(self, name, loader, decode=None, finish=None):
+        """
+        Add name, to be loaded by calling loader() when first used. If the
+        work can be split into decode() (safe to run on another thread) and
+        finish(decoded) (run on the main thread), giving those lets
+        load_in_background use them.
+        """
+        with self._lock:
+            self.discard(name)
+            self._loaders[name] = loader
+            self._parts.pop(name, None)
+            self._stages.pop(name, None)
+            self.sources.pop(name, None)
+            if decode is not None:
+                self._stages[name] = (decode, finish)
+
+    def register_part(self, name, parent, rect):
+        """Add name as the rect area of the entry parent."""
+        def load_part():
+            return self[parent].subsurface(rect)
+        self.register(name, load_part)
+        self._parts[name] = parent
+
+    def is_loaded(self, name):
+        return name in self._loaded
+
+    def loaded_assets(self):
+        """Return a list of the assets currently loaded."""
+        with self._lock:
+            return list(self._loaded.values())
+
+    def discard(self, name):
+        """
+        Drop the loaded asset for name, and any parts cut from it, so it
+        will be loaded again when next used.
+        """
+        with self._lock:
+            if self._loaders.get(name) is None:
+                return
+            if self._loaded.pop(name, None) is not None:
+                self.resident -= self._sizes.pop(name, 0)
+            for part, parent in self._parts.items():
+                if parent == name:
+                    self._loaded.pop(part, None)
+
+    def _load(self, name):
+        loader = self._loaders[name]
+        start = default_timer()
+        asset = loader()
+        self.load_time += default_timer()-start
+        return self._store(name, asset)
+
+    def put(self, name, asset):
+        """
+        Keep asset as the loaded value of the registered name, unless it
+        was loaded meanwhile. Returns the asset the registry holds.
+        """
+        with self._lock:
+            if name in self._loaded:
+                return self._loaded[name]
+            return self._store(name, asset)
+
+    def _store(self, name, asset):
+        self._loaded[name] = asset
+        size = size_of(asset)
+        if size >= self.large:
+            self._sizes[name] = size
+            self.resident += size
+            self._evict(keep=name)
+        return asset
+
+    def _evict(self, keep):
+        if self.budget is None:
+            return
+        for name in list(self._loaded):
+            if self.resident <= self.budget:
+                break
+            if name != keep and name in self._sizes:
+                self.discard(name)
+                self.evictions += 1
+
+    def preload(self, names):
+        """Load every name in names now."""
+        for name in names:
+            self[name]
+
+    def warm(self, names, urgent=False):
+        """
+        Queue names to be loaded by warm_step. Urgent names are loaded
+        first and may evict other assets; the rest are only loaded while
+        the registry is within its budget.
+        """
+        with self._lock:
+            names = [n for n in names if n in self and not self.is_loaded(n)]
+            if urgent:
+                self._urgent_queue.extendleft(reversed(names))
+            else:
+                self._warm_queue.extend(names)
+
+    def warm_step(self, time_limit):
+        """
+        Load queued names until time_limit milliseconds have passed.
+        Returns the number still queued that can be loaded.
+        """
+        end = default_timer()+time_limit/1000.0
+        while default_timer() < end:
+            if self._urgent_queue:
+                name = self._urgent_queue.popleft()
+            elif self._warm_queue and not self.full:
+                name = self._warm_queue.popleft()
+            else:
+                break
+            if name in self and not self.is_loaded(name):
+                self[name]
+        if self.full:
+            return len(self._urgent_queue)
+        return len(self._urgent_queue)+len(self._warm_queue)
+
+    def load_in_background(self, names, loader, group=None):
+        """
+        Add jobs to loader (a loader.BackgroundLoader) for every name in
+        names that is not loaded yet. Names registered with decode and
+        finish are decoded on a worker thread.
+        """
+        for name in names:
+            if name not in self or self.is_loaded(name):
+                continue
+            if name in self._stages:
+                decode, finish = self._stages[name]
+                def store(decoded, name=name, finish=finish):
+                    self.put(name, finish(decoded))
+                loader.add(decode, store, group)
+            else:
+                loader.add(None, lambda _, name=name: self[name], group)
+
+    @property
+    def full(self):
+        return self.budget is not None and self.resident >= self.budget
+
+
+def register_gfx(registry, name, path, colorkey=(0, 0, 0), archive=None):
+    """
+    Register the graphic at path as name, loaded as tools.load_gfx would.
+    If archive holds an up to date copy it is used instead of the file.
+    """
+    def decode():
+        if archive is not None and name in archive:
+            return None
+        return pg.image.load(path)
+
+    def finish(image):
+        if image is None:
+            image = archive.load(name)
+            if image is not None:
+                return image
+            image = pg.image.load(path)
+        return tools.convert_gfx(image, colorkey)
+
+    registry.register(name, lambda: finish(decode()), decode, finish)
+    registry.sources[name] = (path, colorkey)
+
+
+def gfx_registry(directory, colorkey=(0, 0, 0),
+                 accept=(".png", ".jpg", ".bmp"), budget=None, archive=None):
+    """
+    Return an AssetRegistry of the graphics in directory with extensions in
+    accept. See register_gfx.
+    """
+    registry = AssetRegistry(budget)
+    for pic in sorted(os.listdir(directory)):
+        name, ext = os.path.splitext(pic)
+        if ext.lower() in accept:
+            path = os.path.join(directory, pic)
+            register_gfx(registry, name, path, colorkey, archive)
+    return registry
+
+
+def sfx_registry(directory, accept=(".wav", ".mp3", ".ogg", ".mdi"),
+                 budget=None):
+    """Return an AssetRegistry of the sounds in directory."""
+    registry = AssetRegistry(budget)
+    for fx in sorted(os.listdir(directory)):
+        name, ext = os.path.splitext(fx)
+        if ext.lower() in accept:
+            path = os.path.join(directory, fx)
+            decode = lambda p=path: pg.mixer.Sound(p)
+            registry.register(name, decode, decode, lambda sound: sound)
+    return registry
@@ -0,0 +1,195 @@
+"""
+Journaled autosave of the player's stats.
+
+Once a session has started the CasinoPlayer tells its AutoSaver about
+every stat and cash change. Each change is one line of JSON, [game, stat,
+value] with game None for cash and the account balance, which a worker
+thread appends to resources/save_game.json.journal. Every compact_every
+lines, and when the saver is closed, the worker writes all the stats to a
+snapshot, save_game.json, and empties the journal. The snapshot is written
+with savefile.write, under a temporary name and renamed over the old one,
+so a crash leaves either the old or the new file and never a partial one.
+
+Changes record the new value rather than the difference, so replaying a
+line twice does no harm. load_stats reads the snapshot and replays the
+journal on top of it, stopping at a line cut short by a crash.
+
+Only the worker thread touches the disk; the frame thread just queues
+the lines.
+"""
+import json
+import os
+import threading
+from collections import OrderedDict
+
+from . import savefile
+
+try:
+    import queue
+except ImportError:
+    import Queue as queue
+
+
+SAVE_PATH = os.path.join("resources", "save_game.json")
+
+
+def journal_path(path):
+    return path+".journal"
+
+
+def apply_change(stats, change):
+    """Apply a [game, stat, value] journal entry to stats."""
+    game, name, value = change
+    if game is None:
+        stats[name] = value
+    else:
+        game_stats = savefile.resolve(stats.get(game, OrderedDict()))
+        game_stats[name] = value
+        stats[game] = game_stats
+
+
+def load_stats(path=SAVE_PATH):
+    """
+    Return the saved stats with the journal replayed, or None if there is
+    no readable snapshot. Games the journal does not mention are left as
+    unparsed savefile.Sections.
+    """
+    stats = savefile.load(path)
+    if stats is None:
+        return None
+    try:
+        with open(journal_path(path)) as journal:
+            for line in journal:
+                try:
+                    apply_change(stats, json.loads(line))
+                except ValueError:
+                    # The last line was cut short when the game stopped
+                    break
+    except IOError:
+        pass
+    return stats
+
+
+class AutoSaver(object):
+    """
+    Writes stat changes to a journal and snapshot on a worker thread.
+    Call start with the stats of the session, record for each change and
+    close before exiting; save asks for a snapshot straight away. save and
+    close can be given a savefile.freeze of the stats as they are now, to
+    also catch stats a game wrote without going through record. written
+    and compactions count lines appended and snapshots made; failed counts
+    writes that raised an error.
+    """
+    def __init__(self, path=SAVE_PATH, compact_every=500):
+        self.path = path
+        self.journal_path = journal_path(path)
+        self.compact_every = compact_every
+        self.written = 0
+        self.compactions = 0
+        self.failed = 0
+        self._queue = queue.Queue()
+        self._thread = None
+        self._stats = None
+        self._journal = None
+        self._entries = 0
+
+    def start(self, stats):
+        """
+        Begin saving a session whose current stats are stats. Nothing is
+        written until the first change, so starting a new game does not
+        replace an existing save straight away.
+        """
+        self._queue.put(("start", savefile.freeze(stats)))
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._work, name="autosave")
+            self._thread.daemon = True
+            self._thread.start()
+
+    def record(self, game, name, value):
+        """Queue a change of stat name of game (None for the player's own)."""
+        self._queue.put(("change", json.dumps([game, name, value])))
+
+    def compact(self):
+        """Queue a snapshot of the stats if they have changed."""
+        self._queue.put(("compact", None))
+
+    def save(self, stats=None):
+        """
+        Queue a snapshot of the stats, or of frozen stats if given, whether
+        or not they have changed.
+        """
+        self._queue.put(("save", stats))
+
+    def close(self, stats=None):
+        """
+        Write a final snapshot, of frozen stats if given, and wait for the
+        worker to finish.
+        """
+        if self._thread is None:
+            return
+        self._queue.put(("close", stats))
+        self._thread.join()
+        self._thread = None
+
+    def _work(self):
+        while True:
+            batch = [self._queue.get()]
+            try:
+                while True:
+                    batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                pass
+            lines = []
+            for kind, data in batch:
+                if kind == "start":
+                    self._close_journal()
+                    self._stats = data
+                elif kind == "change" and self._stats is not None:
+                    if self._journal is None:
+                        # First change of the session: the snapshot is its base
+                        self._snapshot()
+                    apply_change(self._stats, json.loads(data))
+                    lines.append(data)
+                elif kind in ("compact", "save", "close"):
+                    self._append(lines)
+                    lines = []
+                    changed = self._journal is not None
+                    if data is not None and self._stats is not None:
+                        # Stats written straight into the dict are only in data
+                        changed = changed or savefile.dumps(data) != savefile.dumps(self._stats)
+                        self._stats = data
+                    if self._stats is not None and (changed or kind == "save"):
+                        self._snapshot()
+                    if kind == "close":
+                        self._close_journal()
+                        return
+            self._append(lines)
+            if self._entries >= self.compact_every:
+                self._snapshot()
+
+    def _append(self, lines):
+        if not lines or self._journal is None:
+            return
+        try:
+            self._journal.write("\n".join(lines)+"\n")
+            self._journal.flush()
+            os.fsync(self._journal.fileno())
+            self.written += len(lines)
+            self._entries += len(lines)
+        except (IOError, OSError):
+            self.failed += 1
+
+    def _snapshot(self):
+        try:
+            savefile.write(self._stats, self.path)
+            self._close_journal()
+            self._journal = open(self.journal_path, "w")
+            self._entries = 0
+            self.compactions += 1
+        except (IOError, OSError):
+            self.failed += 1
+
+    def _close_journal(self):
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None
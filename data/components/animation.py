@@ -1,9 +1,13 @@
 from .loggable import getLogger
+from . import tween
+from .scheduler import Scheduler
 from math import sqrt, cos, sin, pi
 import pygame
 import sys
+from collections import OrderedDict
 
-__all__ = ('Task', 'Animation', 'remove_animations_of')
+__all__ = ('Task', 'TaskGroup', 'Animation', 'AnimationGroup',
+           'remove_animations_of')
 
 logger = getLogger('animation')
 
@@ -54,6 +58,9 @@ class Task(pygame.sprite.Sprite):
         # chain tasks
         task = Task(call_later, 2500)
         task.chain(Task(something_else))
+
+    Tasks in a TaskGroup are called by its Scheduler when they are due
+    rather than counting down every frame.
     """
     def __init__(self, callback, interval=0, loops=1, args=None, kwargs=None):
         assert (callable(callback))
@@ -94,13 +101,22 @@ class Task(pygame.sprite.Sprite):
         self._timer += dt
         if self._timer >= self.interval:
             self._timer -= self.interval
-            self.callback(*self._args, **self._kwargs)
-            if not self._loops == -1:
-                self._loops -= 1
-                if self._loops <= 0:
-                    self._execute_chain()
-                    self._chain = None
-                    self.kill()
+            self.fire()
+
+    def fire(self):
+        """Call the callback, and finish the Task if it has no loops left
+
+        :return: True if the Task should be called again
+        """
+        self.callback(*self._args, **self._kwargs)
+        if not self._loops == -1:
+            self._loops -= 1
+            if self._loops <= 0:
+                self._execute_chain()
+                self._chain = None
+                self.kill()
+                return False
+        return self.alive()
 
     def _execute_chain(self):
         groups = self.groups()
@@ -129,7 +145,8 @@ class Animation(pygame.sprite.Sprite):
     Animations must be added to a sprite group in order for them
     to be updated.  If the sprite group that contains them is
     drawn, then an exception will be raised, so you should create
-    a sprite group only for containing Animations.
+    a sprite group only for containing Animations.  An AnimationGroup
+    is one that updates many Animations together.
 
     You can cancel the animation by calling Animation.kill().
 
@@ -297,6 +314,167 @@ class Animation(pygame.sprite.Sprite):
                 props[name] = initial, value
 
 
+class TaskGroup(pygame.sprite.Group):
+    """Group that calls its Tasks when they are due
+
+    The Tasks in the group are kept by a scheduler.Scheduler, on the time
+    passed to update, so only the ones that are due are looked at each
+    frame. Other sprites are updated as in any group.
+
+    cancel removes the Tasks that call a function.
+    """
+    def __init__(self, *sprites):
+        self.scheduler = Scheduler()
+        self._others = OrderedDict()
+        super(TaskGroup, self).__init__(*sprites)
+
+    def add_internal(self, sprite, *args):
+        super(TaskGroup, self).add_internal(sprite, *args)
+        self._start(sprite)
+
+    def remove_internal(self, sprite):
+        super(TaskGroup, self).remove_internal(sprite)
+        self._stop(sprite)
+
+    def _start(self, sprite):
+        """Arrange for a sprite added to the group to be updated"""
+        if isinstance(sprite, Task):
+            self.scheduler.schedule(sprite, sprite.interval - sprite._timer)
+        else:
+            self._others[sprite] = None
+
+    def _stop(self, sprite):
+        """Stop updating a sprite removed from the group"""
+        self._others.pop(sprite, None)
+        remaining = self.scheduler.cancel(sprite)
+        if remaining is not None:
+            # Hand the progress back in case the Task is updated elsewhere
+            sprite._timer = sprite.interval - remaining
+
+    def cancel(self, callback):
+        """Kill the Tasks that call callback
+
+        :param callback: function given to the Tasks
+        :return: number of Tasks killed
+        """
+        tasks = self.scheduler.tasks_for(callback)
+        for task in tasks:
+            task.kill()
+        return len(tasks)
+
+    def time_to_next(self):
+        """Return the time until the group has something to do
+
+        :return: 0 while sprites other than Tasks are updated, the time
+                 until the next Task is due, or None if there are none
+        """
+        if self._others:
+            return 0
+        return self.scheduler.time_to_next()
+
+    def update(self, *args, **kwargs):
+        """Call the Tasks that are due, then update the other sprites
+
+        :param dt: Time passed since last update.
+        """
+        others = list(self._others)
+        self.scheduler.update(args[0])
+        for sprite in others:
+            sprite.update(*args, **kwargs)
+
+
+class AnimationGroup(TaskGroup):
+    """Group that updates its Animations together
+
+    Once the group holds batch_size Animations they are run by a
+    tween.TweenEngine, which advances all of them in one step, until they
+    have all finished. Fewer are cheaper to update one at a time. Tasks
+    are called by the group's scheduler, see TaskGroup.
+
+    Use it in place of a plain group for animations. It behaves the same,
+    except that Animations in the engine have their delay read when they
+    are first run by it rather than on each update.
+
+    Without NumPy the Animations are always updated one at a time.
+    """
+    batch_size = 32
+
+    def __init__(self, *sprites):
+        self.engine = tween.TweenEngine() if tween.numpy is not None else None
+        self._waiting = []
+        self._watched = OrderedDict()
+        super(AnimationGroup, self).__init__(*sprites)
+
+    def _start(self, sprite):
+        if self.engine is not None and isinstance(sprite, Animation):
+            self._waiting.append(sprite)
+        else:
+            super(AnimationGroup, self)._start(sprite)
+
+    def _stop(self, sprite):
+        if self.engine is not None and sprite in self.engine:
+            elapsed = self.engine.remove(sprite)
+            # Hand the progress back in case the Animation is updated elsewhere
+            if sprite.delay > 0 and elapsed >= sprite.delay:
+                elapsed -= sprite.delay
+                sprite.delay = 0
+            sprite._elapsed = elapsed
+            self._watched.pop(sprite, None)
+        elif sprite in self._waiting:
+            self._waiting.remove(sprite)
+        else:
+            super(AnimationGroup, self)._stop(sprite)
+
+    def _start_waiting(self):
+        """Move the Animations that have been started into the engine"""
+        waiting, self._waiting = self._waiting, []
+        for animation in waiting:
+            if animation.targets is None:
+                self._waiting.append(animation)
+                continue
+            for target, props in animation.targets:
+                for name, (initial, final) in props.items():
+                    self.engine.add(animation, target, name, initial, final,
+                                    animation._duration, animation.delay,
+                                    animation._transition,
+                                    animation._round_values,
+                                    animation._elapsed)
+            if animation not in self.engine:
+                # Nothing to tween, so it is only waiting out its duration
+                self._others[animation] = None
+            elif hasattr(animation, 'update_callback'):
+                self._watched[animation] = None
+
+    def time_to_next(self):
+        if self._waiting or (self.engine is not None and self.engine):
+            return 0
+        return super(AnimationGroup, self).time_to_next()
+
+    def update(self, *args, **kwargs):
+        """Update the Animations, then the Tasks and other sprites
+
+        :param dt: Time passed since last update.
+        """
+        engine = self.engine
+        if engine is None:
+            pass
+        elif not engine and len(self._waiting) < self.batch_size:
+            for animation in list(self._waiting):
+                if animation in self._waiting:
+                    animation.update(*args, **kwargs)
+        else:
+            if self._waiting:
+                self._start_waiting()
+            finished = engine.step(args[0])
+            for animation in list(self._watched):
+                if animation in engine and engine.started(animation):
+                    animation.update_callback()
+            for animation in finished:
+                if animation.targets is not None:
+                    animation.finish()
+        super(AnimationGroup, self).update(*args, **kwargs)
+
+
 class AnimationTransition(object):
     """Collection of animation functions to be used with the Animation object.
     Easing Functions ported to Kivy from the Clutter Project
@@ -0,0 +1,203 @@
+"""Bitmap fonts for text that changes often
+
+Money counters show a new amount whenever a bet is made or won, and each
+new amount costs the font a full render of the string. A GlyphAtlas
+renders every character of a font in one color once, onto one surface,
+and BitmapText then puts a string together from glyphs of the atlas,
+blitting them all at once into a surface it keeps for the next string.
+
+Glyphs are placed side by side at their own widths, which matches how
+the game's fonts lay out text, as they are not kerned. A kerned font
+would be drawn a pixel or two wider than it renders. As they do not
+overlap they are copied rather than blended, which is much quicker and
+gives the same pixels as the font. An atlas with a background has its
+glyphs rendered onto it. Characters that are not in the atlas are
+rendered the first time they are wanted and counted in its missing.
+
+get_atlas keeps one atlas for each font, color and background.
+labels.BitmapLabel is a Label drawn this way, and BitmapTextMixin makes a
+sprite with a font, colors and text drawn this way.
+
+To compare a Label with a BitmapLabel counting up, run from the top level
+folder:
+
+    python -m data.components.bitmap_font -H
+
+"""
+
+from timeit import default_timer
+
+import pygame as pg
+
+
+CHARACTERS = ''.join(chr(code) for code in range(32, 127))
+
+ATLASES = {}
+
+
+class GlyphAtlas(object):
+    """The characters of a font in one color, rendered onto one surface"""
+
+    def __init__(self, font, color, bg=None, characters=CHARACTERS):
+        """Initialise the atlas"""
+        self.font = font
+        self.color = _color(color)
+        self.bg = None if bg is None else _color(bg)
+        self.height = font.get_height()
+        self.missing = 0
+        self.glyphs = {}
+        self.widths = {}
+        rendered = [(char, self._render(char)) for char in characters]
+        width = sum(image.get_width() for _, image in rendered)
+        if self.bg is None:
+            self.image = pg.Surface((max(width, 1), self.height), pg.SRCALPHA)
+        else:
+            self.image = pg.Surface((max(width, 1), self.height)).convert()
+        self.image.fill(self.clear_color)
+        x = 0
+        for char, image in rendered:
+            rect = self.image.blit(image, (x, 0))
+            rect.width = image.get_width()
+            self._add(char, self.image.subsurface(rect))
+            x += rect.width
+
+    @property
+    def clear_color(self):
+        """The background, or the color made transparent, to fill behind glyphs"""
+        if self.bg is not None:
+            return self.bg
+        return self.color.r, self.color.g, self.color.b, 0
+
+    def _render(self, char):
+        if self.bg is None:
+            return self.font.render(char, True, self.color)
+        return self.font.render(char, True, self.color, self.bg)
+
+    def _add(self, char, image):
+        """Keep the glyph for a character, copied rather than blended when drawn"""
+        image.set_alpha(None)
+        self.glyphs[char] = image
+        self.widths[char] = image.get_width()
+
+    def glyph(self, char):
+        """Return the surface for a character, rendering it if it is new"""
+        try:
+            return self.glyphs[char]
+        except KeyError:
+            image = self._render(char)
+            if self.bg is not None:
+                image = image.convert()
+            self._add(char, image)
+            self.missing += 1
+            return image
+
+    def size(self, text):
+        """Return the width and height of text"""
+        widths = self.widths
+        try:
+            return sum([widths[char] for char in text]), self.height
+        except KeyError:
+            return sum([self.glyph(char).get_width() for char in text]), self.height
+
+    def draw(self, surface, position, text):
+        """Blit the glyphs of text onto surface, from position"""
+        x, y = position
+        glyph = self.glyph
+        sequence = []
+        for char in text:
+            image = glyph(char)
+            sequence.append((image, (x, y)))
+            x += image.get_width()
+        surface.blits(sequence, False)
+
+
+def _color(color):
+    """Return a pygame Color for a color name, tuple or Color"""
+    try:
+        return pg.Color(color)
+    except (ValueError, TypeError):
+        return pg.Color(*color)
+
+
+def get_atlas(font, color, bg=None, key=None):
+    """Return the atlas for a font, known by key or itself, color and bg"""
+    color = tuple(_color(color))
+    bg = None if bg is None else tuple(_color(bg))
+    name = (font if key is None else key, color, bg)
+    try:
+        return ATLASES[name]
+    except KeyError:
+        atlas = ATLASES[name] = GlyphAtlas(font, color, bg)
+        return atlas
+
+
+class BitmapText(object):
+    """Strings drawn from an atlas into a surface kept between them
+
+    The surface returned by render is drawn over by the next call, so
+    blit it or copy it before rendering again.
+
+    """
+
+    def __init__(self, atlas):
+        """Initialise the text"""
+        self.atlas = atlas
+        self.buffer = None
+
+    def render(self, text):
+        """Return a surface showing text"""
+        width, height = self.atlas.size(text)
+        if self.buffer is None or self.buffer.get_width() < width:
+            size = (max(width, 2 * self.atlas.height), height)
+            if self.atlas.bg is None:
+                self.buffer = pg.Surface(size, pg.SRCALPHA)
+            else:
+                self.buffer = pg.Surface(size).convert()
+        # The glyphs are copied and as high as the text, so they cover
+        # whatever was there before without the area being cleared
+        self.atlas.draw(self.buffer, (0, 0), text)
+        return self.buffer.subsurface((0, 0, width, height))
+
+
+class BitmapTextMixin(object):
+    """Draws a sprite's text from a glyph atlas in update_image
+
+    Mix into a sprite class with _font, _fg, _bg and _text attributes and
+    an update_image method, like the TextSprites of baccarat and pachinko,
+    ahead of that class. The image is the BitmapText's surface, so it is
+    drawn over by the next update.
+
+    """
+
+    _bitmap = None
+
+    def update_image(self):
+        """Draw the text into the image and keep the rect's topleft"""
+        if self._bitmap is None:
+            atlas = get_atlas(self._font, self._fg, self._bg)
+            self._bitmap = BitmapText(atlas)
+        self.image = self._bitmap.render(self._text)
+        self.rect = self.image.get_rect(topleft=self.rect.topleft)
+        self.dirty = 1
+
+
+if __name__ == "__main__":
+    from data import prepare
+    from data.components import labels, text_cache
+
+    amounts = ['${0:,}'.format(amount) for amount in range(0, 250000, 25)]
+    path = prepare.FONTS["Saniretro"]
+    print('Showing {0} amounts, us per update'.format(len(amounts)))
+    print('size    Label  BitmapLabel')
+    for size in (24, 48, 64, 120):
+        results = []
+        for kind in (labels.Label, labels.BitmapLabel):
+            label = kind(path, size, '$0', 'gold3', {'topleft': (0, 0)})
+            start = default_timer()
+            for amount in amounts:
+                label.set_text(amount)
+            results.append((default_timer() - start) * 1e6 / len(amounts))
+            text_cache.CACHE.clear()
+        print('{0:4d} {1:8.1f} {2:12.1f}'.format(size, results[0], results[1]))
+    missing = sum(atlas.missing for atlas in ATLASES.values())
+    print('Glyphs rendered after the atlases were made: {0}'.format(missing))
@@ -0,0 +1,205 @@
+"""Card faces and backs shared by every card game
+
+Each card used to scale its own face and draw its own back, so dealing a
+new deck, or refilling an infinite one, prepared 52 faces and 52 backs
+again. The images here are made once for each card size, and turned
+image for each angle, and then given to every card of that size in
+every game.
+
+The surfaces are shared, so they must not be drawn on. Turning a card
+with Card.rotate swaps in the shared rotated images.
+
+A card flipping over is drawn squeezed to part of its width. flip_frame
+gives the squeezed image from a strip of FLIP_FRAMES widths made for
+each face or back, so a flip scales each width once rather than every
+frame. The frames of a strip are made when they are first wanted, and
+the least recently used strips are dropped when they use more than
+STRIP_BUDGET bytes. strips reports the memory used by each.
+
+To time making decks and flipping cards, and see the memory used, run
+from the top level folder:
+
+    python -m data.components.card_images -H
+
+"""
+
+from collections import OrderedDict
+from timeit import default_timer
+
+import pygame as pg
+
+from .. import prepare
+
+
+SUITS = ("Clubs", "Hearts", "Diamonds", "Spades")
+NAMES = {1: "Ace", 11: "Jack", 12: "Queen", 13: "King"}
+
+FLIP_FRAMES = 32
+STRIP_BUDGET = 16 * 2**20
+
+IMAGES = OrderedDict()
+MADE = OrderedDict()
+STRIPS = OrderedDict()
+_strip_bytes = 0
+
+
+def card_name(value, suit):
+    """Return the name of the image for a card, like ace_of_spades"""
+    return "{}_of_{}".format(NAMES.get(value, value), suit).lower()
+
+
+def _key(name):
+    return name.lower().replace(" ", "_")
+
+
+def _made(size, image):
+    """Add the bytes of an image made here to those for its card size"""
+    MADE[size] = MADE.get(size, 0) + image.get_pitch() * image.get_height()
+    return image
+
+
+def face(name, size, angle=0):
+    """Return the face of the card called name, like 'Ace of Spades'"""
+    size, angle = tuple(size), angle % 360
+    key = (_key(name), size, angle)
+    try:
+        return IMAGES[key]
+    except KeyError:
+        pass
+    if angle:
+        image = _made(size, pg.transform.rotate(face(name, size), angle))
+    else:
+        image = prepare.GFX[_key(name)]
+        if image.get_size() != size:
+            image = _made(size, pg.transform.smoothscale(image, size).convert_alpha())
+    IMAGES[key] = image
+    return image
+
+
+def back(size, angle=0):
+    """Return the back of a card"""
+    size, angle = tuple(size), angle % 360
+    key = ("back", size, angle)
+    try:
+        return IMAGES[key]
+    except KeyError:
+        pass
+    if angle:
+        image = _made(size, pg.transform.rotate(back(size), angle))
+    else:
+        image = pg.Surface(size).convert()
+        rect = image.get_rect()
+        image.fill(pg.Color("dodgerblue"))
+        snake = prepare.GFX["pysnakeicon"]
+        s_rect = snake.get_rect().fit(rect)
+        s_rect.midbottom = rect.midbottom
+        snake = pg.transform.smoothscale(snake, s_rect.size)
+        image.blit(snake, s_rect)
+        pg.draw.rect(image, pg.Color("gray95"), rect, 4)
+        pg.draw.rect(image, pg.Color("gray20"), rect, 1)
+        _made(size, image)
+    IMAGES[key] = image
+    return image
+
+
+def prepare_deck(size, angle=0):
+    """Make the faces and back of a whole deck of one size ahead of time"""
+    for suit in SUITS:
+        for value in range(1, 14):
+            face(card_name(value, suit), size, angle)
+    back(size, angle)
+
+
+def flip_frame(image, fraction):
+    """Return image squeezed to a fraction of its width, from its strip"""
+    global _strip_bytes
+    fraction = max(0.0, min(1.0, fraction))
+    index = int(round(fraction * (FLIP_FRAMES - 1)))
+    if index == FLIP_FRAMES - 1:
+        return image
+    strip = STRIPS.pop(image, None)
+    if strip is None:
+        strip = [[None] * FLIP_FRAMES, 0]
+    STRIPS[image] = strip
+    frame = strip[0][index]
+    if frame is None:
+        width, height = image.get_size()
+        width = max(1, int(round(width * index / (FLIP_FRAMES - 1.0))))
+        frame = strip[0][index] = pg.transform.smoothscale(image, (width, height))
+        size = frame.get_pitch() * height
+        strip[1] += size
+        _strip_bytes += size
+        while _strip_bytes > STRIP_BUDGET and len(STRIPS) > 1:
+            _, dropped = STRIPS.popitem(last=False)
+            _strip_bytes -= dropped[1]
+    return frame
+
+
+def strips():
+    """Return (name, size, frames made, bytes) for each flip strip"""
+    names = dict((id(image), key) for key, image in IMAGES.items())
+    report = []
+    for image, (frames, used) in STRIPS.items():
+        name, size, _ = names.get(id(image), ("?", image.get_size(), 0))
+        made = len([frame for frame in frames if frame is not None])
+        report.append((name, size, made, used))
+    return report
+
+
+def memory():
+    """Return the bytes used by the images made for each card size
+
+    Faces that are used at the size they were drawn are not counted, as
+    they are the graphics themselves.
+    """
+    return MADE.copy()
+
+
+def clear():
+    """Forget all the images"""
+    global _strip_bytes
+    IMAGES.clear()
+    MADE.clear()
+    STRIPS.clear()
+    _strip_bytes = 0
+
+
+if __name__ == "__main__":
+    from data.components.cards import Deck
+    from data.states.baccarat.cards import make_cards
+    # The images the cards use, not this module's copy run as __main__
+    from data.components.card_images import prepare_deck, memory, strips
+
+    for size in ((125, 181), (187, 271)):
+        start = default_timer()
+        Deck((0, 0), card_size=size)
+        first = default_timer() - start
+        start = default_timer()
+        for _ in range(10):
+            Deck((0, 0), card_size=size)
+        print("Deck of {}: {:.1f} ms for the first, {:.2f} ms after".format(
+            size, first * 1e3, (default_timer() - start) * 1e2))
+    start = default_timer()
+    for _ in range(10):
+        make_cards(8, (125, 181))
+    print("baccarat shoe of 8 decks: {:.2f} ms".format((default_timer() - start) * 1e2))
+    prepare_deck((125, 181), 90)
+    prepare_deck((125, 181), -90)
+    print("Memory used by images for each size, including turned ones:")
+    for size, used in memory().items():
+        print("  {}: {:.1f} MB".format(size, used / 2.0**20))
+
+    # Flip six cards face up, as baccarat deals them, each frame of 400 ms
+    frames = 24
+    for label in ("first deal", "next deal"):
+        hand = make_cards(1, (125, 181))[:6]
+        start = default_timer()
+        for frame in range(frames + 1):
+            for card in hand:
+                card.rotation = 180 - 180.0 * frame / frames
+                card.image
+        print("Flipping 6 cards, {}: {:.0f} us per frame".format(
+            label, (default_timer() - start) * 1e6 / (frames + 1)))
+    print("Memory used by each flip strip:")
+    for name, size, made, used in strips():
+        print("  {} {}: {} frames, {:.0f} KB".format(name, size, made, used / 1024.0))
@@ -1,8 +1,9 @@
 import os
-from random import shuffle
 import pygame as pg
 from .. import prepare
 from ..components.angles import get_angle, project
+from . import card_images
+from .shoe import Shoe, card_code, card_suit, card_value
 
 
 class Card(pg.sprite.Sprite):
@@ -34,6 +35,7 @@ class Card(pg.sprite.Sprite):
         else:
             self.name = self.long_name
             self.short_name = "{}{}".format(self.card_names[self.value][0], self.suit[0])
+        self.angle = 0
         self.load_images()
         self.rect = self.image.get_rect()
         self.pos = self.rect.center
@@ -42,18 +44,14 @@ class Card(pg.sprite.Sprite):
         
 
     def load_images(self):
-        img_name = self.name.lower().replace(" ", "_")
-        image = prepare.GFX[img_name]
-        self.image = pg.transform.scale(image, self.card_size)
-        self.back_image = pg.Surface(self.card_size).convert()
-        self.back_image.fill(pg.Color("dodgerblue"))
-        snake = prepare.GFX["pysnakeicon"]
-        s_rect = snake.get_rect().fit(self.back_image.get_rect())
-        s_rect.midbottom = self.back_image.get_rect().midbottom
-        snake = pg.transform.scale(snake, s_rect.size)
-        self.back_image.blit(snake, s_rect)
-        pg.draw.rect(self.back_image, pg.Color("gray95"), self.back_image.get_rect(), 4)
-        pg.draw.rect(self.back_image, pg.Color("gray20"), self.back_image.get_rect(), 1)
+        """Use the shared images for this card's size and angle."""
+        self.image = card_images.face(self.name, self.card_size, self.angle)
+        self.back_image = card_images.back(self.card_size, self.angle)
+
+    def rotate(self, angle):
+        """Turn the card's images by angle degrees counterclockwise."""
+        self.angle = (self.angle + angle) % 360
+        self.load_images()
 
     def draw(self, surface):
         if self.face_up:
@@ -74,9 +72,13 @@ class Deck(object):
     discard pile will replenish the deck on exhaustion. If infinite is True, the
     deck will replenish itself with a new deck upon exhaustion. Reusing
     discards supersedes infinite replenishment.
+
+    The cards still in the deck are kept as numbers in a shoe.Shoe and a
+    Card is only made for a card when it is drawn.
     """
     def __init__(self, topleft, card_size=prepare.CARD_SIZE, card_speed=16.0,
-                        default_shuffle=True, reuse_discards=True, infinite=False):
+                        default_shuffle=True, reuse_discards=True, infinite=False,
+                        num_decks=1, rng=None):
         self.topleft = topleft
         self.card_size = card_size
         self.card_speed = card_speed
@@ -85,25 +87,17 @@ class Deck(object):
         self.default_shuffle = default_shuffle
         self.reuse_discards= reuse_discards
         self.infinite = infinite
-        self.num_decks = 1
-        self.cards = self.make_cards()
+        self.num_decks = num_decks
+        self.cards = Shoe(num_decks, rng, shuffle=default_shuffle)
         self.discards = []
 
 
     def __len__(self):
         return len(self.cards)
 
-    def make_cards(self):
-        """Return a list of Cards."""
-        suits = ("Clubs", "Hearts", "Diamonds", "Spades")
-        cards = [Card(i, suit, self.card_size, self.card_speed)
-                     for suit in suits for i in range(1, 14)]
-        for _ in range(self.num_decks - 1):
-            cards.extend([Card(i, suit, self.card_size, self.card_speed)
-                                 for suit in suits for i in range(1, 14)])
-        if self.default_shuffle:
-            shuffle(cards)
-        return cards
+    def make_card(self, code):
+        """Return a Card for the card with code in the shoe."""
+        return Card(card_value(code), card_suit(code), self.card_size, self.card_speed)
 
     def discard(self, card):
         """Add card to deck's discards."""
@@ -111,29 +105,28 @@ class Deck(object):
 
     def burn(self):
         """Add top card of deck to discards."""
-        self.discards.append(self.cards.pop())
+        card = self.draw_card()
+        if card is not None:
+            self.discards.append(card)
 
     def draw_card(self):
         """
         Draw top card from deck. If deck is exhausted
         deck will be replenished according to deck options.
         """
-        try:
-            return self.cards.pop()
-        except IndexError:
+        code = self.cards.deal()
+        if code is None:
             if self.reuse_discards and self.discards:
-                self.cards = self.discards
-                for card in self.cards:
-                    card.face_up = False
-                if self.default_shuffle:
-                    shuffle(self.cards)
+                self.cards.discard(*(card_code(card.value, card.suit)
+                                     for card in self.discards))
                 self.discards = []
-                return self.cards.pop()
+                self.cards.return_discards(self.default_shuffle)
             elif self.infinite:
-                self.cards = self.make_cards()
-                return self.cards.pop()
-            else:
+                self.cards.reshuffle(self.default_shuffle)
+            code = self.cards.deal()
+            if code is None:
                 return None
+        return self.make_card(code)
 
     def make_hand(self, num_cards=5):
         """Create a hand of cards."""
@@ -155,22 +148,30 @@ class Deck(object):
                 left += x_offset
                 top += y_offset
 
+    def draw_backs(self, surface, count, lefttop, x_offset=2,
+                            y_offset=-1, toggle_num=4):
+        """Draw count card backs to surface, stacked like draw_pile."""
+        back = card_images.back(self.card_size)
+        left, top = lefttop
+        positions = []
+        for i in range(1, count + 1):
+            positions.append((back, (left, top)))
+            if not i % toggle_num:
+                left += x_offset
+                top += y_offset
+        surface.blits(positions, False)
+
     def draw(self, surface):
         """Draw deck and discard pile to surface."""
         self.draw_pile(surface, self.discards, self.discard_rect.topleft)
-        self.draw_pile(surface, self.cards, self.topleft)
+        self.draw_backs(surface, len(self.cards), self.topleft)
 
 
 class MultiDeck(Deck):
     """A class to represent a deck of cards composed of multiple
     individual decks."""
-    def __init__(self, num_decks, card_size=prepare.CARD_SIZE, card_speed=20.0,
-                        default_shuffle=True, reuse_discards=True, shuffle_discards=True,
-                        infinite=False):
-        super(MultiDeck, self).__init__(card_size, card_speed, default_shuffle,
-                                                      reuse_discards, infinite)
-        self.num_decks = num_decks
-        for _ in range(num_decks - 1):
-            self.cards.extend(self.make_cards())
-        if self.default_shuffle:
-            shuffle(self.cards)
+    def __init__(self, num_decks, topleft=(0, 0), card_size=prepare.CARD_SIZE,
+                        card_speed=20.0, default_shuffle=True, reuse_discards=True,
+                        infinite=False, rng=None):
+        super(MultiDeck, self).__init__(topleft, card_size, card_speed, default_shuffle,
+                                                      reuse_discards, infinite, num_decks, rng)
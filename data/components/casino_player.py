@@ -3,6 +3,7 @@ import inspect
 import datetime
 from collections import OrderedDict
 from .. import prepare
+from ..savefile import Section
 from . import loggable
 
 
@@ -77,11 +78,14 @@ class CasinoPlayer(loggable.Loggable):
     CasinoPlayer will be instantiated each time the
     program launches. Passing a stats dict to __init__
     allows persistence of player statistics between
-    sessions."""
+    sessions. A game's stats given as a savefile.Section are only
+    parsed when first used. Changes are passed to journal, an
+    autosave.AutoSaver, if one is set."""
 
     def __init__(self, stats_init=None):
         self.addLogger()
         self._current_game = None
+        self.journal = None
 
         self._stats = OrderedDict([("cash", prepare.MONEY),
                                    ("account balance", 0)])
@@ -90,6 +94,9 @@ class CasinoPlayer(loggable.Loggable):
             self.cash = stats_init.pop("cash")
             self.account_balance = stats_init.pop("account balance")
             for game_name, game_stats in stats_init.items():
+                if isinstance(game_stats, Section):
+                    self._stats[game_name] = game_stats
+                    continue
                 self._stats[game_name] = OrderedDict()
                 self.current_game = game_name
                 for stat_name, value in game_stats.items():
@@ -110,8 +117,17 @@ class CasinoPlayer(loggable.Loggable):
             'Direct access to stats is deprecated - please use helper methods: game {0}, file {1}:{3} - {2}'.format(
                 component, filename, function_name, line_number))
         #
+        for name in list(self._stats):
+            self._game_stats(name)
         return self._stats
 
+    def _game_stats(self, game):
+        """Return the stats of a game, parsing them on first use"""
+        stats = self._stats[game]
+        if isinstance(stats, Section):
+            stats = self._stats[game] = stats.load()
+        return stats
+
     @property
     def cash(self):
         """The current cash for the player"""
@@ -120,6 +136,7 @@ class CasinoPlayer(loggable.Loggable):
     @cash.setter
     def cash(self, value):
         """Set the cash value"""
+        self._record(None, 'cash', value)
         self._stats['cash'] = value
 
     @property
@@ -130,6 +147,7 @@ class CasinoPlayer(loggable.Loggable):
     @account_balance.setter
     def account_balance(self, value):
         """Set the cash value"""
+        self._record(None, 'account balance', value)
         self._stats['account balance'] = value
 
     @property
@@ -175,14 +193,30 @@ class CasinoPlayer(loggable.Loggable):
         if self.current_game is None:
             raise NoGameSet('No current game has been set (when trying to access stat "{0}")'.format(name))
         #
-        self._stats[self.current_game][name] = value
+        self._record(self.current_game, name, value)
+        self._game_stats(self.current_game)[name] = value
+
+    def _record(self, game, name, value):
+        """Pass a change to the journal, unless the value is the same"""
+        if self.journal is None:
+            return
+        stats = self._stats if game is None else self._game_stats(game)
+        if name not in stats or stats[name] != value or isinstance(value, (list, dict)):
+            self.journal.record(game, name, value)
+
+    def get_all_stats(self):
+        """Return the stats of every game, cash and account balance
+
+        Games whose stats have not been used yet are savefile.Sections.
+        """
+        return self._stats
 
     def get(self, name, default=0):
         """Return the value of a stat"""
         if self.current_game is None:
             raise NoGameSet('No current game has been set (when trying to access stat "{0}")'.format(name))
         #
-        return self._stats[self.current_game].get(name, default)
+        return self._game_stats(self.current_game).get(name, default)
 
     def game_names(self):
         """Return the names of all the stats"""
@@ -193,7 +227,7 @@ class CasinoPlayer(loggable.Loggable):
         if not game and self.current_game is None:
             raise NoGameSet('No current game has been set')
         #
-        return list(self._stats[game if game else self.current_game].keys())
+        return list(self._game_stats(game if game else self.current_game).keys())
 
     def get_visible_stat_names(self, game=None):
         """Return the names of the stats that should be visible to the player"""
@@ -156,7 +156,13 @@ class BetPile(object):
 
 
 class ChipPile(object):
-    """Represents a player's pile of chips."""
+    """Represents a player's pile of chips.
+
+    The pile keeps counts, the number of chips of each color, rather
+    than a Chip for every chip, so a large bankroll costs no more to
+    hold, bet from or add to than a small one. Chips are only made for
+    the stacks drawn in the pile's frame.
+    """
 
     def __init__(self, bottomleft, chip_size, cash=0, chips=None,
                          stack_height=10, num_rows=5, columns_per_color=2,
@@ -190,69 +196,75 @@ class ChipPile(object):
         self.frame.set_alpha(75)            
         
         
-        chips = [] if chips is None else chips
+        self.shown_chips = OrderedDict((color, []) for color in Chip.chip_values)
+        self.counts = chips_to_counts([] if chips is None else chips)
         if cash:
-            chips.extend(cash_to_chips(cash, self.chip_size))
-        self.chips = OrderedDict()
-        for color in Chip.chip_values:
-            self.chips[color] = [x for x in chips if x.color == color]
-        self.stacks = self.make_stacks()
+            self.add_counts(cash_to_counts(cash))
+        else:
+            self.stacks = self.make_stacks()
         names = ["chipsstack{}".format(x) for x in (3, 5, 6)]
 
     def get_chip_total(self):
-        """"Returns total cash value of self.chips."""
-        total = 0
-        for color in self.chips:
-            total += Chip.chip_values[color] * len(self.chips[color])
-        return total
+        """Returns cash total of all chips in pile."""
+        return counts_to_cash(self.counts)
+
+    def add_counts(self, counts):
+        """Adds the number of chips of each color in counts and adjusts stacks."""
+        for color in counts:
+            self.counts[color] += counts[color]
+        self.stacks = self.make_stacks()
 
     def add_chips(self, chips):
         """Adds chips and adjusts stacks."""
-        for chip in chips:
-            self.chips[chip.color].append(chip)
-        self.stacks = self.make_stacks()
-        
+        self.add_counts(chips_to_counts(chips))
+
     def all_chips(self):
         all_chips = []
-        for color in self.chips:
-            all_chips.extend(self.chips[color])
+        for color in self.counts:
+            all_chips.extend([Chip(color, self.chip_size) for _ in range(self.counts[color])])
         return all_chips
-        
+
     def draw_stacks(self, surface):
         """Draw stacks to surface."""
         for stack in self.stacks:
             stack.draw(surface)
 
     def withdraw_chips(self, amount):
-        """Withdraw chips totalling amount and adjust stacks."""
-        if self.get_chip_total() < amount:
+        """Withdraw chips totalling amount and adjust stacks.
+
+        If there are not enough chips of the right colors the rest
+        of the pile is changed into the fewest chips.
+        """
+        total = self.get_chip_total()
+        if total < amount:
             return
-        total_withdrawal = cash_to_chips(amount, self.chip_size)[::-1]
-        withdrawal = []
-        for chip in total_withdrawal:
-            try:
-                withdrawal.append(self.chips[chip.color].pop())
-            except IndexError:
-                withdrawal = total_withdrawal
-                chips = cash_to_chips(self.get_chip_total() - amount, self.chip_size)
-                for color in self.chips:
-                    self.chips[color] = [x for x in chips if x.color == color]
-                break
-        self.stacks = self.make_stacks()            
-        return withdrawal
+        withdrawal = cash_to_counts(amount)
+        if all(self.counts[color] >= withdrawal[color] for color in withdrawal):
+            for color in withdrawal:
+                self.counts[color] -= withdrawal[color]
+        else:
+            self.counts = cash_to_counts(total - amount)
+        self.stacks = self.make_stacks()
+        return counts_to_chips(withdrawal, self.chip_size)[::-1]
 
     def make_stacks(self):
-        """Returns a list of ChipStacks sorted by y-position."""
+        """Returns a list of ChipStacks sorted by y-position.
+
+        Chips are only made for the stacks there is room to show, and
+        kept in shown_chips to be used again.
+        """
         w, h = self.chip_size
         left = self.rect.left
         bottom = self.rect.top + h
+        limit = self.columns_per_color * self.num_rows
         stacks = []
-        for color in self.chips:
-            chips = self.chips[color]
+        for color in self.counts:
+            num = min(self.counts[color], limit * self.stack_height)
+            chips = self.shown_chips[color]
+            if len(chips) < num:
+                chips.extend([Chip(color, self.chip_size) for _ in range(num - len(chips))])
+            chips = chips[:num]
             stackers = [chips[i: i + self.stack_height] for i in range(0, len(chips), self.stack_height)]
-            limit = self.columns_per_color * self.num_rows
-            if len(stackers) >  limit:
-                stackers = stackers[:limit]
             left2 = left + w + self.horiz_space
             bottom_ = bottom
             for i, stacker in enumerate(stackers):
@@ -274,18 +286,12 @@ class ChipPile(object):
             bet_stack = stack.grab_chips(click_pos)
             if bet_stack is not None:
                 color = bet_stack.chips[0].color
-                for chip in bet_stack.chips:
-                    self.chips[color].remove(chip)
+                self.counts[color] -= len(bet_stack.chips)
+                self.shown_chips[color] = [chip for chip in self.shown_chips[color]
+                                           if chip not in bet_stack.chips]
                 self.stacks = self.make_stacks()
                 return bet_stack
 
-    def get_chip_total(self):
-        """Returns cash total of all chips in pile."""
-        total = 0
-        for color in self.chips:
-            total += Chip.chip_values[color] * len(self.chips[color])
-        return total
-        
     def draw(self, surface):
         surface.blit(self.frame, self.rect)
         self.draw_stacks(surface)
@@ -371,20 +377,39 @@ class ChipRack(object):
             left += self.chip_size[0] + self.horiz_spacer
         surface.blit(self.front, self.front_rect)
 
-def cash_to_chips(cash, chip_size=None):
-    """Returns a list of Chips equal to the cash amount."""
+def cash_to_counts(cash):
+    """Returns an OrderedDict of the fewest chips of each color
+    equal to the cash amount."""
     vals = Chip.chip_values
-    chips_ = []
-    cash_ = cash
+    counts = OrderedDict()
     for color in vals:
-        num, cash_ = divmod(cash_, vals[color])
-        chips_.append((color, num))
+        counts[color], cash = divmod(cash, vals[color])
+    return counts
+
+def counts_to_cash(counts):
+    """Returns the cash value of a number of chips of each color."""
+    vals = Chip.chip_values
+    return sum([vals[color] * counts[color] for color in counts])
+
+def chips_to_counts(chips):
+    """Takes in a list of Chip instances and returns an OrderedDict
+    of the number of each color."""
+    counts = OrderedDict((color, 0) for color in Chip.chip_values)
+    for chip in chips:
+        counts[chip.color] += 1
+    return counts
+
+def counts_to_chips(counts, chip_size=None):
+    """Returns a list of Chips with the number of each color in counts."""
     chips = []
-    for color, num in chips_:
-        chips.extend([Chip(color, chip_size) for _ in range(num)])
+    for color in counts:
+        chips.extend([Chip(color, chip_size) for _ in range(counts[color])])
     return chips
 
+def cash_to_chips(cash, chip_size=None):
+    """Returns a list of Chips equal to the cash amount."""
+    return counts_to_chips(cash_to_counts(cash), chip_size)
+
 def chips_to_cash(chips):
     """Takes in a list of Chip instances and returns cash value."""
     return sum([chip.value for chip in chips])
-
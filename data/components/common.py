@@ -11,6 +11,7 @@ from .. import tools
 from ..events import EventAware
 
 from . import loggable
+from . import spatial
 
 
 # Events for the components
@@ -21,9 +22,9 @@ E_MOUSE_MOVE = 'mouse-move'
 E_MOUSE_LEAVE = 'mouse-leave'
 
 
-def getLabel(name, position, text, settings):
+def getLabel(name, position, text, settings, label_class=labels.Label):
     """Return a label using properties defined in the settings dictionary"""
-    return labels.Label(
+    return label_class(
         path=settings["{}-font".format(name)],
         color=settings["{}-font-color".format(name)],
         size=settings["{}-font-size".format(name)],
@@ -91,18 +92,60 @@ class Clickable(EventAware, loggable.Loggable):
 
 
 class ClickableGroup(list, EventAware):
-    """A list of clickable items"""
+    """A list of clickable items
+
+    Mouse events are only passed to the Clickables under the mouse, found with a
+    spatial.GridIndex, and to those that were under it so they can see it leave.
+    Items that handle events themselves, like nested groups, are passed every event.
+    The index is rebuilt when items are added or removed, and items whose rect has
+    moved are re-indexed before each lookup.
+
+    """
+
+    use_index = True
 
     def __init__(self, items=None):
         """Initialise the group"""
         super(ClickableGroup, self).__init__(items if items else [])
         #
         self.initEvents()
+        self._index = None
 
     def process_events(self, event, scale=(1, 1)):
         """Process all the events"""
-        for item in self:
+        if not self.use_index or event.type not in (pg.MOUSEMOTION, pg.MOUSEBUTTONDOWN):
+            for item in self:
+                item.process_events(event, scale)
+            return
+        #
+        if self._index is None or len(self) != self._indexed_length:
+            self._build_index()
+        else:
+            self._index.refresh()
+        pos = tools.scaled_mouse_pos(scale, event.pos)
+        targets = dict((id(item), item) for item in self._always)
+        targets.update((id(item), item) for item in self._hovered)
+        targets.update((id(item), item) for item in self._index.at(pos))
+        positions = self._positions
+        for item in sorted(targets.values(), key=lambda item: positions[id(item)]):
             item.process_events(event, scale)
+        self._hovered = [item for item in targets.values()
+                         if item in self._index and item.mouse_over]
+
+    def _build_index(self):
+        """Index the items that only respond to events inside their rect"""
+        self._index = spatial.GridIndex()
+        self._always = []
+        self._positions = {}
+        for position, item in enumerate(self):
+            self._positions[id(item)] = position
+            if (isinstance(item, Clickable) and item.rect is not None and
+                    type(item).process_events == Clickable.process_events):
+                self._index.add(item)
+            else:
+                self._always.append(item)
+        self._hovered = [item for item in self if item in self._index and item.mouse_over]
+        self._indexed_length = len(self)
 
     def clear(self):
         """Remove all the items from the group
@@ -110,12 +153,28 @@ class ClickableGroup(list, EventAware):
         Compatibility method for python2, where lists don't have a clear method
 
         """
+        self._index = None
         try:
             super(ClickableGroup, self).clear()
         except AttributeError:
             self[:] = []
 
 
+def _rebuilds_index(method):
+    """Wrap a list method so that it makes the group rebuild its index"""
+    def changed(self, *args, **kwargs):
+        self._index = None
+        return method(self, *args, **kwargs)
+    changed.__name__ = method.__name__
+    changed.__doc__ = method.__doc__
+    return changed
+
+
+for _name in ('append', 'extend', 'insert', 'remove', 'pop', 'sort', 'reverse',
+              '__setitem__', '__delitem__', '__iadd__'):
+    setattr(ClickableGroup, _name, _rebuilds_index(getattr(list, _name)))
+
+
 class Drawable(object):
     """Simple base class for all screen objects"""
 
@@ -0,0 +1,214 @@
+"""Running generators over many frames
+
+A generator started with CoroutineScheduler.add is resumed until it
+finishes. Each time it yields a number of milliseconds it sleeps for that
+long; a bare yield, or yielding 0, resumes it on the next update. The
+sleeping generators are kept by a scheduler.Scheduler, so each update
+only resumes the ones that are due, however many are running.
+
+A Coroutine can be paused, told to move to its next step straight away,
+or have the time it is waiting for changed with update_interval. They
+are also found by name, and stop(name) stops the first one with it.
+
+The time spent running each generator is added to its cpu_time and, by
+name, to the scheduler's cpu_times. report gives a summary.
+
+bingo's StateMachine runs its generators with a CoroutineScheduler. Any
+other state can do the same by calling update with the frame time.
+
+"""
+
+from collections import OrderedDict
+from timeit import default_timer
+
+from .scheduler import Scheduler
+
+
+class NotFound(Exception):
+    """Generator was not found"""
+
+
+class Coroutine(object):
+    """A generator run by a CoroutineScheduler"""
+
+    def __init__(self, name, generator, coroutines):
+        """Initialise the coroutine"""
+        self.name = name
+        self.generator = generator
+        self.callback = generator
+        self.interval = 0
+        self.last_delay = 0
+        self.done = False
+        self.verbose = False
+        self.cpu_time = 0.0
+        self.steps = 0
+        self._coroutines = coroutines
+        self._paused = False
+        self._left = 0
+
+    @property
+    def delay(self):
+        """The time until the next step"""
+        if self._paused or self.done:
+            return self._left
+        left = self._coroutines.scheduler.time_left(self)
+        return self.interval if left is None else left
+
+    @delay.setter
+    def delay(self, value):
+        if self.done:
+            return
+        if self._paused:
+            self._left = value
+        else:
+            self._coroutines.scheduler.schedule(self, value)
+
+    @property
+    def paused(self):
+        """True while the coroutine is not counting down to its next step"""
+        return self._paused
+
+    @paused.setter
+    def paused(self, value):
+        value = bool(value)
+        if value == self._paused or self.done:
+            self._paused = value
+            return
+        if value:
+            self._left = self.delay
+            self._coroutines.scheduler.cancel(self)
+            self._paused = True
+        else:
+            self._paused = False
+            self._coroutines.scheduler.schedule(self, self._left)
+
+    def fire(self):
+        """Run the generator to its next yield and schedule the next step
+
+        The delay it yields is counted from now, not from when this step was
+        due, so a late step does not shorten the next wait.
+
+        :return: False, as the coroutine schedules itself
+        """
+        start = default_timer()
+        try:
+            value = next(self.generator)
+        except StopIteration:
+            self.done = True
+        finally:
+            elapsed = default_timer() - start
+            self.cpu_time += elapsed
+            self.steps += 1
+            self._coroutines.add_cpu_time(self.name, elapsed)
+        if self.done:
+            self._coroutines.forget(self)
+            return False
+        self.interval = self.last_delay = value or 0
+        if self._paused:
+            self._left = self.interval
+        else:
+            self._coroutines.scheduler.schedule(self, self.interval)
+        return False
+
+    def next_step(self):
+        """Immediately make the generator go to the next step"""
+        self.delay = 0
+
+    def update_interval(self, interval):
+        """Update the interval we are waiting for
+
+        This behaves as though the last delay requested is
+        immediately changed to the specified value.
+
+        If we have already waited for the specified time
+        then immediately go to the next step
+
+        """
+        time_elapsed = self.last_delay - self.delay
+        self.delay = interval - time_elapsed
+
+    def stop(self):
+        """Stop this coroutine"""
+        if not self.done:
+            self._left = self.delay
+            self.done = True
+            self._coroutines.scheduler.cancel(self)
+            self._coroutines.forget(self)
+
+    def get_fraction_to_go(self):
+        """Return the fraction of our time to go"""
+        if self.last_delay == 0:
+            return 1
+        else:
+            return max(0, min(1, self.delay / self.last_delay))
+
+
+class CoroutineScheduler(object):
+    """Generators waiting to run, resumed when they are due"""
+
+    def __init__(self):
+        """Initialise the scheduler"""
+        self.scheduler = Scheduler()
+        self.cpu_times = OrderedDict()
+        self._names = OrderedDict()
+        self._count = 0
+
+    def __len__(self):
+        return self._count
+
+    def add(self, name, generator, delay=0):
+        """Start running generator, first resuming it after delay
+
+        :return: the Coroutine running it
+        """
+        coroutine = Coroutine(name, generator, self)
+        self._names.setdefault(name, OrderedDict())[coroutine] = None
+        self._count += 1
+        self.scheduler.schedule(coroutine, delay)
+        return coroutine
+
+    def find(self, name):
+        """Return the running coroutines called name"""
+        return list(self._names.get(name, ()))
+
+    def stop(self, name):
+        """Stop the first coroutine called name
+
+        :raises NotFound: if there is none running
+        """
+        for coroutine in self._names.get(name, ()):
+            coroutine.stop()
+            return coroutine
+        raise NotFound('A generator named {0} was not found'.format(name))
+
+    def forget(self, coroutine):
+        """Remove a finished or stopped coroutine from the names"""
+        coroutines = self._names.get(coroutine.name)
+        if coroutines is not None and coroutine in coroutines:
+            del coroutines[coroutine]
+            self._count -= 1
+            if not coroutines:
+                del self._names[coroutine.name]
+
+    def add_cpu_time(self, name, elapsed):
+        self.cpu_times[name] = self.cpu_times.get(name, 0.0) + elapsed
+
+    def clear(self):
+        """Stop all the coroutines"""
+        for coroutines in list(self._names.values()):
+            for coroutine in list(coroutines):
+                coroutine.stop()
+
+    def update(self, dt):
+        """Resume the generators that are due
+
+        :param dt: Time passed since last update.
+        """
+        self.scheduler.update(dt)
+
+    def report(self):
+        """Return the CPU time used by the generators of each name"""
+        lines = ['Generator CPU time (ms)']
+        for name, elapsed in sorted(self.cpu_times.items(), key=lambda item: -item[1]):
+            lines.append('{0:>10.2f}  {1}'.format(elapsed * 1000.0, name))
+        return '\n'.join(lines)
@@ -0,0 +1,171 @@
+"""
+Per-phase frame timing.
+
+Control marks the end of each phase of a frame (event handling, fixed
+simulation steps, state update, asset warming, music handler, render and
+display flip) with FrameTimer.lap and closes the frame with
+FrameTimer.end. Samples are kept in rolling histograms per state name so
+percentiles show where time is going and which game was running. The
+results can be drawn as an overlay or written to a CSV file.
+"""
+from collections import OrderedDict, deque
+from timeit import default_timer
+
+import pygame as pg
+
+
+PHASES = ("event_loop", "state_change", "simulate", "update", "broadcast",
+          "assets", "music", "render", "display", "frame")
+
+
+class RollingHistogram(object):
+    """
+    Fixed-width histogram over the last window samples. Adding a sample
+    and reading a percentile do not depend on the number of samples kept.
+    """
+    def __init__(self, window=600, bucket_ms=0.1, max_ms=100.0):
+        self.bucket_ms = bucket_ms
+        self.counts = [0]*(int(max_ms/bucket_ms)+1)
+        self.samples = deque()
+        self.window = window
+        self.max_seen = 0.0
+
+    def __len__(self):
+        return len(self.samples)
+
+    def add(self, value):
+        """Add a sample in milliseconds, dropping the oldest if full."""
+        bucket = min(int(value/self.bucket_ms), len(self.counts)-1)
+        self.samples.append(bucket)
+        self.counts[bucket] += 1
+        if len(self.samples) > self.window:
+            self.counts[self.samples.popleft()] -= 1
+        self.max_seen = max(self.max_seen, value)
+
+    def percentile(self, percent):
+        """
+        Return the upper edge in ms of the bucket holding percent. Samples
+        past the last bucket report the largest value seen.
+        """
+        if not self.samples:
+            return 0.0
+        target = len(self.samples)*percent/100.0
+        total = 0
+        for bucket, count in enumerate(self.counts):
+            total += count
+            if total >= target:
+                break
+        if bucket == len(self.counts)-1:
+            return self.max_seen
+        return min((bucket+1)*self.bucket_ms, self.max_seen)
+
+
+class FrameTimer(object):
+    """Collects timings of each phase of a frame, grouped by state name."""
+    percentiles = (50, 95, 99)
+
+    def __init__(self, window=600):
+        self.window = window
+        self.histograms = OrderedDict()
+        self.show_overlay = False
+        self.overlay_interval = 500.0
+        self.rect = pg.Rect(10, 10, 0, 0)
+        self._pending = OrderedDict()
+        self._frame_start = self._last = default_timer()
+        self._overlay = None
+        self._overlay_state = None
+        self._overlay_elapsed = 0.0
+
+    def begin(self):
+        """Start timing a new frame."""
+        self._pending.clear()
+        self._frame_start = self._last = default_timer()
+
+    def lap(self, phase):
+        """Record the time since the previous lap as phase."""
+        now = default_timer()
+        ms = (now-self._last)*1000.0
+        self._pending[phase] = self._pending.get(phase, 0.0)+ms
+        self._last = now
+
+    def end(self, state_name):
+        """Finish the frame and file its timings under state_name."""
+        frame = (default_timer()-self._frame_start)*1000.0
+        self._pending["frame"] = frame
+        histograms = self.histograms.setdefault(state_name, OrderedDict())
+        for phase, ms in self._pending.items():
+            if phase not in histograms:
+                histograms[phase] = RollingHistogram(self.window)
+            histograms[phase].add(ms)
+        self._pending.clear()
+
+    def summary(self, state_name):
+        """
+        Return list of (phase, samples, p50, p95, p99, max) for state_name
+        in PHASES order.
+        """
+        histograms = self.histograms.get(state_name, {})
+        rows = []
+        for phase in PHASES:
+            if phase in histograms:
+                hist = histograms[phase]
+                values = [hist.percentile(p) for p in self.percentiles]
+                rows.append([phase, len(hist)]+values+[hist.max_seen])
+        return rows
+
+    def toggle_overlay(self):
+        """Turn the overlay on or off."""
+        self.show_overlay = not self.show_overlay
+        self._overlay = None
+
+    def draw(self, surface, state_name, dt):
+        """
+        Draw the overlay for state_name if it is on. The text is only
+        rerendered every overlay_interval milliseconds. Returns the rect
+        drawn or None.
+        """
+        if not self.show_overlay:
+            return None
+        self._overlay_elapsed += dt
+        stale = self._overlay_elapsed >= self.overlay_interval
+        if self._overlay is None or stale or state_name != self._overlay_state:
+            self._overlay = self.make_overlay(state_name)
+            self._overlay_state = state_name
+            self._overlay_elapsed = 0.0
+            self.rect.size = self._overlay.get_size()
+        surface.blit(self._overlay, self.rect)
+        return self.rect
+
+    def make_overlay(self, state_name):
+        """Render a table of percentiles for state_name."""
+        font = pg.font.Font(None, 24)
+        label_width, column_width = 120, 64
+        rows = [[state_name or ""], ["ms", "p50", "p95", "p99", "max"]]
+        for row in self.summary(state_name):
+            phase, count = row[:2]
+            rows.append([phase]+["{:.1f}".format(v) for v in row[2:]])
+        line_height = font.get_linesize()
+        width = label_width+column_width*5+16
+        height = line_height*len(rows)+16
+        image = pg.Surface((width, height)).convert()
+        image.fill(pg.Color("gray10"))
+        for j, row in enumerate(rows):
+            y = 8+j*line_height
+            for i, text in enumerate(row):
+                rendered = font.render(text, True, pg.Color("white"))
+                if i == 0:
+                    image.blit(rendered, (8, y))
+                else:
+                    right = 8+label_width+column_width*i
+                    image.blit(rendered, rendered.get_rect(topright=(right, y)))
+        return image
+
+    def write_csv(self, path):
+        """Write percentiles for every state and phase to path."""
+        lines = ["state,phase,samples,p50_ms,p95_ms,p99_ms,max_ms"]
+        for state_name in self.histograms:
+            for row in self.summary(state_name):
+                values = ["{:.2f}".format(v) for v in row[2:]]
+                lines.append(",".join([state_name, row[0], str(row[1])]+values))
+        with open(path, "w") as csv_file:
+            csv_file.write("\n".join(lines)+"\n")
@@ -4,6 +4,7 @@ from itertools import cycle
 
 import pygame as pg
 from .. import prepare, tools
+from . import bitmap_font, text_cache
 
 
 
@@ -28,6 +29,7 @@ BUTTON_DEFAULTS = {"call"               : None,
                    "disable_image"      : None,
                    "hover_sound"        : None,
                    "click_sound"        : None,
+                   "hover_call"         : None,
                    "visible"            : True,
                    "active"             : True,
                    "bindings"           : ()}
@@ -71,6 +73,10 @@ class Label(object):
     Creates a surface with text blitted to it (self.image) and an associated
     rectangle (self.rect). Label will have a transparent bg if
     bg is not passed to __init__.
+
+    The text is rendered through text_cache.CACHE, so self.image shares its
+    pixels with other labels showing the same text. Its alpha and colorkey
+    can be set, but copy it before drawing on it.
     """
     def __init__(self, path, size, text, color, rect_attr, bg=None):
         self.path, self.size = path, size
@@ -89,11 +95,9 @@ class Label(object):
 
     def update_text(self):
         """Update the surface using the current properties and text."""
-        if self.bg:
-            render_args = (self.text, True, self.color, self.bg)
-        else:
-            render_args = (self.text, True, self.color)
-        self.image = self.font.render(*render_args)
+        self.image = text_cache.CACHE.render(self.font, self.text, self.color,
+                                             self.bg or None, path=self.path,
+                                             size=self.size)
         self.rect = self.image.get_rect(**self.rect_attr)
 
     def draw(self, surface):
@@ -101,6 +105,30 @@ class Label(object):
         surface.blit(self.image, self.rect)
 
 
+class BitmapLabel(Label):
+    """
+    A Label drawn from a glyph atlas of its font, for text that changes
+    often, like money counters. Setting new text only blits glyphs, so the
+    font does not render anything once the atlas is made.
+
+    self.image is drawn over when the text changes, so copy it to keep it.
+    """
+    def set_text(self, text):
+        """Set the text to display, if it has changed."""
+        if text != getattr(self, "text", None):
+            self.text = text
+            self.update_text()
+
+    def update_text(self):
+        """Update the surface using the current properties and text."""
+        if getattr(self, "_bitmap", None) is None:
+            atlas = bitmap_font.get_atlas(self.font, self.color, self.bg or None,
+                                          (self.path, self.size))
+            self._bitmap = bitmap_font.BitmapText(atlas)
+        self.image = self._bitmap.render(self.text)
+        self.rect = self.image.get_rect(**self.rect_attr)
+
+
 # Should probably be depracated with Labels turned into sprites so that
 # They can use standard sprite groups.
 class GroupLabel(Label):
@@ -307,6 +335,7 @@ class Button(pg.sprite.Sprite, tools._KwargMixin):
             self.image = (hover and self.hover_image) or self.idle_image
             if not self.hover and hover:
                 self.hover_sound and self.hover_sound.play()
+                self.hover_call and self.hover_call(self.args or self.text)
             self.hover = hover
         else:
             self.image = self.disable_image or self.idle_image
@@ -354,9 +383,14 @@ class GameButton(Button):
 
     def __init__(self, pos, game, call, *groups, **kwargs):
         path = os.path.join(".", "data", "states", game)
-        try:
-            image = pg.image.load(os.path.join(path, "image.png")).convert()
-        except pg.error:
+        icon = kwargs.pop("icon", "image.png")
+        image = None
+        if icon is not None:
+            try:
+                image = pg.image.load(os.path.join(path, icon)).convert()
+            except pg.error:
+                pass
+        if image is None:
             image = prepare.GFX["default_image"]
         idle, highlight = self.make_images(game, image)
         rect = idle.get_rect(topleft=pos)
@@ -398,14 +432,18 @@ class MoneyIcon(object):
         dollar = prepare.GFX["dollar_bill_yall"]
         self.dollar_image = pg.transform.smoothscale(dollar, size).convert_alpha()
         self.rect = self.dollar_image.get_rect(topleft=topleft)
+        self.surf = pg.Surface(self.rect.size).convert()
+        self.money_labels = {}
         
     def update(self, amount):
         text = "${0:,.0f}".format(amount)
         font_size = int((64 - ((len(text) - 4) * 4)) * self.font_scale)
-        self.surf = pg.Surface(self.rect.size).convert()
         dollar_rect = pg.Rect((0,0), self.rect.size)
-        money_label = Label(self.font, font_size, text, "gray10",
-                                       {"center": dollar_rect.center})
+        if font_size not in self.money_labels:
+            self.money_labels[font_size] = BitmapLabel(self.font, font_size, text,
+                                                "gray10", {"center": dollar_rect.center})
+        money_label = self.money_labels[font_size]
+        money_label.set_text(text)
         self.surf.blit(self.dollar_image, (0,0))
         money_label.draw(self.surf)
         self.surf.set_alpha(140)
@@ -113,7 +113,7 @@ class MusicHandler(object):
 
     def get_event(self, event, scale=(1,1)):
         if event.type == pg.MOUSEBUTTONDOWN:
-            pos = tools.scaled_mouse_pos(event.pos, scale)
+            pos = tools.scaled_mouse_pos(scale, event.pos)
             if self.music_on:
                 for icon in self.volume_icons:
                     if icon.rect.collidepoint(pos):
@@ -129,7 +129,7 @@ class MusicHandler(object):
         pg.mixer.music.play() if self.music_on else pg.mixer.music.stop()
 
     def update(self, scale):
-        pos = tools.scaled_mouse_pos(pg.mouse.get_pos(), scale)
+        pos = tools.scaled_mouse_pos(scale)
         self.buttons.update(pos)
         if self.music_on:
             if not pg.mixer.music.get_busy():
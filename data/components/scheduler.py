@@ -0,0 +1,188 @@
+"""Scheduler for calling tasks at a later time
+
+A Task updated on its own adds the frame time to its timer every frame,
+however far off it is due. Scheduler keeps its tasks in a heap ordered by
+the game time they are due, so each frame only looks at the tasks that
+are due. Scheduling and cancelling a task take O(log n) time; cancelled
+tasks are left in the heap, marked dead, until it is tidied.
+
+A task is any object with interval and callback attributes and a fire
+method, like animation.Task. fire is called when the task is due and
+returns True if it should be called again interval later. Each task is
+fired at most once per update, and tasks scheduled by a task that fires
+are not fired until the next one, like Tasks updated on their own.
+
+animation.TaskGroup runs its Tasks with a Scheduler.
+
+To compare a plain group of Tasks with a TaskGroup, run from the top
+level folder:
+
+    python -m data.components.scheduler
+
+"""
+
+import heapq
+import itertools
+import random
+from collections import OrderedDict
+from timeit import default_timer
+
+
+class Scheduler(object):
+    """Tasks ordered by when they are due"""
+
+    def __init__(self):
+        """Initialise the scheduler"""
+        self.now = 0.0
+        self.fired = 0
+        self._heap = []
+        self._entries = {}
+        self._callbacks = {}
+        self._dead = 0
+        self._order = itertools.count()
+        self._pending = None
+        self._firing = None
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, task):
+        return task in self._entries
+
+    def _add(self, task, due):
+        """Add an entry for task, returning it"""
+        entry = [due, next(self._order), task]
+        self._entries[task] = entry
+        self._callbacks.setdefault(task.callback, OrderedDict())[task] = None
+        return entry
+
+    def _forget(self, task):
+        """Remove the entry for task, returning it"""
+        entry = self._entries.pop(task)
+        tasks = self._callbacks[task.callback]
+        del tasks[task]
+        if not tasks:
+            del self._callbacks[task.callback]
+        return entry
+
+    def schedule(self, task, delay=None):
+        """Call task after delay, by default its interval"""
+        if task in self._entries:
+            self.cancel(task)
+        delay = task.interval if delay is None else delay
+        entry = self._add(task, self.now + delay)
+        if self._pending is None:
+            heapq.heappush(self._heap, entry)
+        else:
+            self._pending.append(entry)
+
+    def cancel(self, task):
+        """Stop a task, returning the time it had left or None if not scheduled"""
+        if task not in self._entries:
+            return None
+        entry = self._forget(task)
+        entry[2] = None
+        self._dead += 1
+        if self._dead > 64 and self._dead > len(self._heap) // 2:
+            # In place, as update may be working through the heap
+            self._heap[:] = [entry for entry in self._heap if entry[2] is not None]
+            heapq.heapify(self._heap)
+            self._dead = 0
+        return entry[0] - self.now
+
+    def time_left(self, task):
+        """Return the time until task is due, or None if it is not scheduled"""
+        entry = self._entries.get(task)
+        return None if entry is None else entry[0] - self.now
+
+    def time_to_next(self):
+        """Return the time until the next task is due, or None if there are none"""
+        if self._pending is not None:
+            # Asked by a task that is firing, while the heap is being worked through
+            dues = [entry[0] for entry in self._entries.values()]
+            return max(0.0, min(dues) - self.now) if dues else None
+        heap = self._heap
+        while heap and heap[0][2] is None:
+            heapq.heappop(heap)
+            self._dead -= 1
+        return max(0.0, heap[0][0] - self.now) if heap else None
+
+    def tasks_for(self, callback):
+        """Return the scheduled tasks, and the one firing, that call callback"""
+        tasks = list(self._callbacks.get(callback, ()))
+        firing = self._firing
+        if firing is not None and firing.callback == callback and firing not in tasks:
+            tasks.append(firing)
+        return tasks
+
+    def clear(self):
+        """Cancel all the tasks"""
+        del self._heap[:]
+        self._entries.clear()
+        self._callbacks.clear()
+        self._dead = 0
+
+    def update(self, dt):
+        """Advance the time by dt and fire the tasks that are due
+
+        :param dt: Time passed since last update.
+        """
+        self.now += dt
+        heap = self._heap
+        self._pending = pending = []
+        try:
+            while heap and heap[0][0] <= self.now:
+                due, _, task = heapq.heappop(heap)
+                if task is None:
+                    self._dead -= 1
+                    continue
+                self._forget(task)
+                self.fired += 1
+                self._firing = task
+                if task.fire() and task not in self._entries:
+                    pending.append(self._add(task, due + task.interval))
+                self._firing = None
+        finally:
+            self._pending = self._firing = None
+            for entry in pending:
+                heapq.heappush(heap, entry)
+
+
+def benchmark(group, frames=120, dt=16.0):
+    """Return the microseconds per frame to update group"""
+    start = default_timer()
+    for _ in range(frames):
+        group.update(dt)
+    return (default_timer() - start) * 1e6 / frames
+
+
+if __name__ == "__main__":
+    import pygame
+    from data.components.animation import Task, TaskGroup
+
+    def nothing():
+        pass
+
+    def make_group(group, tasks):
+        random.seed(0)
+        for _ in range(tasks):
+            group.add(Task(nothing, random.uniform(100, 10000), random.choice((1, -1))))
+        return group
+
+    print("tasks  plain group  TaskGroup  (us per frame)")
+    for tasks in (10, 1000, 10000):
+        plain = benchmark(make_group(pygame.sprite.Group(), tasks))
+        scheduled = benchmark(make_group(TaskGroup(), tasks))
+        print("{:5d} {:12.1f} {:10.1f}".format(tasks, plain, scheduled))
+
+    scheduler = Scheduler()
+    tasks = [Task(nothing, random.uniform(100, 10000)) for _ in range(10000)]
+    start = default_timer()
+    for task in tasks:
+        scheduler.schedule(task)
+    middle = default_timer()
+    for task in tasks:
+        scheduler.cancel(task)
+    end = default_timer()
+    print("10000 tasks: {:.2f} us to schedule, {:.2f} us to cancel".format(
+        (middle - start) * 1e6 / len(tasks), (end - middle) * 1e6 / len(tasks)))
@@ -0,0 +1,160 @@
+"""Shoe of cards kept as small numbers
+
+A deck used to make a Card sprite for every card it held, so a baccarat
+shoe of eight decks made 416 sprites before the first hand. Shoe keeps
+its cards as numbers from 0 to 51 in a bytearray instead: the suit is
+code // 13, in the order of SUITS, and the value is code % 13 + 1. The
+decks make a Card sprite only for a card that is dealt.
+
+Cards are dealt from the front. A cut card is placed at penetration of
+the way into the cards after each shuffle, and cut_card_reached tells a
+game when it is time for a new shoe. Burnt cards go to the discards.
+
+Shuffling uses rng, any object with a shuffle method like random.Random,
+so a game can be replayed from a seed.
+
+To time shuffling and dealing, run from the top level folder:
+
+    python -m data.components.shoe -H
+
+"""
+
+import random
+from timeit import default_timer
+
+from .card_images import SUITS
+
+
+def card_code(value, suit):
+    """Return the code for a card with value 1 to 13 and a suit in SUITS"""
+    return SUITS.index(suit) * 13 + value - 1
+
+
+def card_value(code):
+    """Return the value, from 1 for an ace to 13 for a king, of a code"""
+    return code % 13 + 1
+
+
+def card_suit(code):
+    """Return the suit of a code"""
+    return SUITS[code // 13]
+
+
+class Shoe(object):
+    """Cards of one or more decks, dealt in order"""
+
+    def __init__(self, decks=1, rng=None, penetration=1.0, shuffle=True):
+        """Initialise the shoe
+
+        :param decks: number of decks of 52 cards
+        :param rng: object with a shuffle method, by default a random.Random
+        :param penetration: fraction of the cards dealt before the cut card
+        :param shuffle: True to shuffle the cards, False to keep them in order
+        """
+        self.decks = decks
+        self.rng = random.Random() if rng is None else rng
+        self.penetration = penetration
+        self.cards = bytearray()
+        self.discards = bytearray()
+        self.position = 0
+        self.cut = 0
+        self.burned = 0
+        self.reshuffle(shuffle)
+
+    def __len__(self):
+        return len(self.cards) - self.position
+
+    def __iter__(self):
+        """Iterate over the codes of the cards still to be dealt"""
+        return iter(self.cards[self.position:])
+
+    @property
+    def cut_card_reached(self):
+        """True once the cards up to the cut card have been dealt"""
+        return self.position >= self.cut
+
+    def _place_cut_card(self):
+        self.cut = self.position + int(round(len(self) * self.penetration))
+
+    def reshuffle(self, shuffle=True):
+        """Put every card of the decks back and shuffle them"""
+        self.cards = bytearray(range(52)) * self.decks
+        self.discards = bytearray()
+        self.position = 0
+        if shuffle:
+            self.rng.shuffle(self.cards)
+        self._place_cut_card()
+
+    def shuffle(self):
+        """Shuffle the cards still to be dealt"""
+        cards = self.cards[self.position:]
+        self.rng.shuffle(cards)
+        self.cards = cards
+        self.position = 0
+        self._place_cut_card()
+
+    def return_discards(self, shuffle=True):
+        """Add the discards to the cards still to be dealt and shuffle them"""
+        self.cards = self.cards[self.position:] + self.discards
+        self.discards = bytearray()
+        self.position = 0
+        if shuffle:
+            self.shuffle()
+        else:
+            self._place_cut_card()
+
+    def deal(self):
+        """Return the code of the next card, or None if the shoe is empty"""
+        if self.position >= len(self.cards):
+            return None
+        code = self.cards[self.position]
+        self.position += 1
+        return code
+
+    def burn(self, count=1):
+        """Move the next count cards to the discards without showing them"""
+        for _ in range(count):
+            code = self.deal()
+            if code is None:
+                break
+            self.discards.append(code)
+            self.burned += 1
+
+    def discard(self, *codes):
+        """Add the codes of cards that have been played to the discards"""
+        self.discards.extend(codes)
+
+
+if __name__ == "__main__":
+    from data.components.cards import Card
+    from data.states.baccarat.cards import make_cards
+
+    decks = 8
+    rounds = 200
+    shoe = Shoe(decks, random.Random(0))
+    start = default_timer()
+    for _ in range(rounds):
+        shoe.reshuffle()
+    shuffled = (default_timer() - start) / rounds
+    start = default_timer()
+    dealt = 0
+    for _ in range(rounds):
+        shoe.reshuffle(False)
+        while shoe.deal() is not None:
+            dealt += 1
+    dealing = (default_timer() - start) / dealt
+    start = default_timer()
+    for _ in range(rounds // 10):
+        make_cards(decks, (125, 181), True)
+    sprites = (default_timer() - start) / (rounds // 10)
+    start = default_timer()
+    for _ in range(rounds):
+        code = shoe.cards[0]
+        Card(card_value(code), card_suit(code), (125, 181), 16.0)
+    sprite = (default_timer() - start) / rounds
+    print("{} decks: shuffling a shoe {:.0f} us, {:.0f} shoes/sec".format(
+        decks, shuffled * 1e6, 1 / shuffled))
+    print("dealing {:.2f} us per card, {:.0f} cards/sec".format(dealing * 1e6, 1 / dealing))
+    print("a Card sprite for a dealt card {:.1f} us".format(sprite * 1e6))
+    print("making and shuffling {} baccarat Card sprites instead {:.2f} ms".format(
+        decks * 52, sprites * 1e3))
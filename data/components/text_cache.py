@@ -0,0 +1,180 @@
+"""Cache of rendered text surfaces
+
+Labels are often made again with text they have shown before: a bet
+amount that goes back and forth, the same caption on each screen or a
+score that only changes now and then. CACHE keeps the surfaces rendered
+for each (font path, size, text, color, bg, antialias) in least recently
+used order, dropping the oldest ones once they use more than its budget
+of bytes.
+
+The cached surfaces are shared, so render returns a view of one (a
+subsurface of the whole of it). A view has its own alpha and colorkey,
+which many states set to fade their labels, but it draws the cached
+pixels, so nothing should be drawn onto it. Copy it first to do that.
+
+The cache counts its hits and misses, in total and for each section,
+which Control sets to the name of the state being started. report
+gives a summary, shown on exit with the timing option.
+
+To see how many renders the cache saves in each game, run from the top
+level folder:
+
+    python -m data.components.text_cache -H
+
+"""
+
+from collections import OrderedDict
+
+import pygame as pg
+
+
+def view(surface):
+    """Return a surface sharing the pixels of surface, but not its alpha"""
+    return surface.subsurface(surface.get_rect())
+
+
+def color_key(color):
+    """Return a color as an (r, g, b, a) tuple, however it was given"""
+    if color is None:
+        return None
+    try:
+        return tuple(pg.Color(color))
+    except (ValueError, TypeError):
+        return tuple(pg.Color(*color))
+
+
+class TextCache(object):
+    """Rendered text surfaces in least recently used order"""
+
+    def __init__(self, budget=4*2**20):
+        """Initialise the cache
+
+        :param budget: most bytes of surfaces to keep, 0 to keep none
+        """
+        self.budget = budget
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.section = None
+        self.sections = OrderedDict()
+        self._surfaces = OrderedDict()
+
+    def __len__(self):
+        return len(self._surfaces)
+
+    def __contains__(self, key):
+        return key in self._surfaces
+
+    def _count(self, hit):
+        """Add a hit or miss to the totals and the current section"""
+        if hit:
+            self.hits += 1
+        else:
+            self.misses += 1
+        counts = self.sections.get(self.section)
+        if counts is None:
+            counts = self.sections[self.section] = [0, 0]
+        counts[not hit] += 1
+
+    def fetch(self, key, make):
+        """Return the surface cached for key, calling make to create it if needed"""
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self._surfaces.pop(key)
+            self._surfaces[key] = surface
+            self._count(True)
+            return surface
+        self._count(False)
+        surface = make()
+        self.put(key, surface)
+        return surface
+
+    def put(self, key, surface):
+        """Cache surface for key, dropping the oldest surfaces if over budget"""
+        old = self._surfaces.pop(key, None)
+        if old is not None:
+            self.size -= surface_bytes(old)
+        size = surface_bytes(surface)
+        if size > self.budget:
+            return
+        self._surfaces[key] = surface
+        self.size += size
+        while self.size > self.budget:
+            _, dropped = self._surfaces.popitem(last=False)
+            self.size -= surface_bytes(dropped)
+
+    def render(self, font, text, color, bg=None, antialias=True, path=None, size=None):
+        """Return a view of text rendered with font
+
+        The font is known by path and size in the key, or by the font
+        itself if path is not given.
+        """
+        color, bg = color_key(color), color_key(bg)
+        key = (font if path is None else path, size, text, color, bg, antialias)
+
+        def make():
+            if bg is None:
+                return font.render(text, antialias, color)
+            return font.render(text, antialias, color, bg)
+        return view(self.fetch(key, make))
+
+    def clear(self):
+        """Drop all the surfaces"""
+        self._surfaces.clear()
+        self.size = 0
+
+    def reset_counts(self):
+        """Set the hits and misses back to zero"""
+        self.hits = self.misses = 0
+        self.sections.clear()
+
+    def report(self):
+        """Return the hits and misses, in total and for each section"""
+        lines = ['Text cache: {0} surfaces, {1:.1f} KB'.format(len(self), self.size / 1024.0),
+                 '      hits    renders  saved  section']
+        rows = list(self.sections.items()) + [('total', [self.hits, self.misses])]
+        for section, (hits, misses) in rows:
+            requests = hits + misses
+            saved = 100.0 * hits / requests if requests else 0.0
+            lines.append('{0:>10d} {1:>10d} {2:>5.1f}%  {3}'.format(hits, misses, saved, section))
+        return '\n'.join(lines)
+
+
+def surface_bytes(surface):
+    """Return the bytes used by the pixels of surface"""
+    return surface.get_pitch() * surface.get_height()
+
+
+CACHE = TextCache()
+
+
+if __name__ == "__main__":
+    import sys
+    from data import prepare
+    from data.control import Control
+    # The cache the game uses, not this module's copy run as __main__
+    from data.components.text_cache import CACHE
+
+    frames = 600
+    names = sys.argv[2:] or ['lobby', 'stats_menu', 'craps', 'keno', 'blackjack',
+                             'baccarat', 'guts', 'video_poker', 'bingo']
+    print('Renders needed in {0} frames of each state, with and without the cache'.format(frames))
+    print('      without   with  saved  state')
+    for name in names:
+        counts = []
+        for budget in (0, 4*2**20):
+            CACHE.budget = budget
+            CACHE.clear()
+            CACHE.reset_counts()
+            control = Control(prepare.CAPTION, prepare.RENDER_SIZE, prepare.RESOLUTIONS)
+            control.max_iterations = frames
+            control.fixed_dt = 1000.0/control.fps
+            control.idle_pacing = False
+            control.auto_discovery()
+            control.start_state(name)
+            control.main()
+            control.close()
+            counts.append(CACHE.misses)
+        without, with_cache = counts
+        saved = 100.0 * (without - with_cache) / without if without else 0.0
+        print('{0:>12d} {1:>6d} {2:>5.1f}%  {3}'.format(without, with_cache, saved, name))
@@ -0,0 +1,266 @@
+"""Batch engine for animations
+
+An Animation updated on its own works out its transition and sets its
+target's values in Python, one property at a time. TweenEngine keeps one
+row for each animated property of many animations in NumPy arrays (start
+and end values, elapsed time, delay, duration and transition) and
+advances them all in one vectorised step each frame, leaving only the
+writes to the targets to Python.
+
+animation.AnimationGroup runs its Animations with an engine, so the
+Animation and Task API is unchanged. Transitions in VECTOR_TRANSITIONS
+are worked out on whole arrays; any other is called once per row.
+
+NumPy is optional. Without it AnimationGroup updates each Animation
+itself, like any other group.
+
+To compare a plain group of animations with an AnimationGroup for a
+number of tweens, run from the top level folder:
+
+    python -m data.components.tween
+
+"""
+
+from collections import OrderedDict
+from timeit import default_timer
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def _in_out(ease_in):
+    """Return the in_out transition made from an in transition"""
+    def in_out(progress):
+        p = progress * 2.0
+        first = 0.5 * ease_in(p)
+        second = 1.0 - 0.5 * ease_in(2.0 - p)
+        return numpy.where(p < 1.0, first, second)
+    return in_out
+
+
+def _out(ease_in):
+    """Return the out transition made from an in transition"""
+    def out(progress):
+        return 1.0 - ease_in(1.0 - progress)
+    return out
+
+
+def _in_power(power):
+    def ease_in(progress):
+        return progress ** power
+    return ease_in
+
+
+def _in_sine(progress):
+    return 1.0 - numpy.cos(progress * (numpy.pi / 2.0))
+
+
+VECTOR_TRANSITIONS = {'linear': lambda progress: progress}
+if numpy is not None:
+    for _name, _ease_in in (('quad', _in_power(2)), ('cubic', _in_power(3)),
+                            ('quart', _in_power(4)), ('quint', _in_power(5)),
+                            ('sine', _in_sine)):
+        VECTOR_TRANSITIONS['in_' + _name] = _ease_in
+        VECTOR_TRANSITIONS['out_' + _name] = _out(_ease_in)
+        VECTOR_TRANSITIONS['in_out_' + _name] = _in_out(_ease_in)
+
+
+def _per_row(transition):
+    """Return a vector version of a transition that takes one value"""
+    def vector(progress):
+        return numpy.array([transition(p) for p in progress.tolist()])
+    return vector
+
+
+class TweenEngine(object):
+    """Rows of tweened values, advanced together
+
+    Each row belongs to an owner, normally an Animation, and is removed with
+    it. step returns the owners that have finished.
+
+    """
+
+    def __init__(self, capacity=64):
+        """Initialise the engine"""
+        self._size = 0
+        self._free = []
+        self._setters = []
+        self._owners = []
+        self._rows = {}
+        self._transitions = []
+        self._transition_ids = {}
+        self._active_rows = None
+        self._allocate(capacity)
+
+    def __len__(self):
+        return len(self._rows)
+
+    def __contains__(self, owner):
+        return owner in self._rows
+
+    def _allocate(self, capacity):
+        """Make the arrays hold capacity rows, keeping the existing ones"""
+        arrays = {}
+        for name, kind in (('start', float), ('end', float), ('elapsed', float),
+                           ('delay', float), ('duration', float),
+                           ('transition', int), ('round', bool), ('active', bool)):
+            array = numpy.zeros(capacity, dtype=kind)
+            old = getattr(self, '_' + name, None)
+            if old is not None:
+                array[:len(old)] = old
+            arrays['_' + name] = array
+        self.__dict__.update(arrays)
+        self._capacity = capacity
+
+    def _transition_id(self, transition):
+        """Return the id of the vector version of a transition"""
+        try:
+            return self._transition_ids[transition]
+        except KeyError:
+            pass
+        name = getattr(transition, '__name__', None)
+        vector = VECTOR_TRANSITIONS.get(name)
+        if vector is None:
+            vector = _per_row(transition)
+        self._transition_ids[transition] = len(self._transitions)
+        self._transitions.append(vector)
+        return self._transition_ids[transition]
+
+    def add(self, owner, target, name, start, end, duration, delay=0.0,
+            transition=None, round_values=False, elapsed=0.0):
+        """Add a row tweening target's name from start to end
+
+        If the attribute is callable it is called with each value instead of
+        being set. transition is a function of progress from 0 to 1, by
+        default linear.
+
+        """
+        if self._free:
+            row = self._free.pop()
+        else:
+            if self._size == self._capacity:
+                self._allocate(self._capacity * 2)
+            row = self._size
+            self._size += 1
+            self._setters.append(None)
+            self._owners.append(None)
+        attr = getattr(target, name)
+        self._setters[row] = (attr if callable(attr) else None, target, name)
+        self._owners[row] = owner
+        self._rows.setdefault(owner, []).append(row)
+        self._start[row] = start
+        self._end[row] = end
+        self._elapsed[row] = elapsed
+        self._delay[row] = delay
+        self._duration[row] = duration
+        self._transition[row] = self._transition_id(transition or VECTOR_TRANSITIONS['linear'])
+        self._round[row] = round_values
+        self._active[row] = True
+        self._active_rows = None
+        return row
+
+    def remove(self, owner):
+        """Remove the rows of owner, returning their elapsed time or None"""
+        rows = self._rows.pop(owner, None)
+        if rows is None:
+            return None
+        elapsed = float(self._elapsed[rows[0]])
+        for row in rows:
+            self._active[row] = False
+            self._setters[row] = None
+            self._owners[row] = None
+            self._free.append(row)
+        self._active_rows = None
+        return elapsed
+
+    def clear(self):
+        """Remove all the rows"""
+        for owner in list(self._rows):
+            self.remove(owner)
+
+    def started(self, owner):
+        """Return True if the delay of owner's rows has passed"""
+        row = self._rows[owner][0]
+        return self._elapsed[row] >= self._delay[row]
+
+    def step(self, dt):
+        """Advance every row by dt and set the new values on the targets
+
+        Returns the owners that have finished.
+
+        """
+        if self._active_rows is None:
+            self._active_rows = numpy.flatnonzero(self._active[:self._size])
+        rows = self._active_rows
+        if not rows.size:
+            return []
+        self._elapsed[rows] += dt
+        delay = self._delay[rows]
+        elapsed = self._elapsed[rows]
+        started = elapsed >= delay
+        if not started.all():
+            rows, delay, elapsed = rows[started], delay[started], elapsed[started]
+            if not rows.size:
+                return []
+        progress = numpy.minimum(1.0, (elapsed - delay) / self._duration[rows])
+        #
+        # Ease the progress of the rows with each transition
+        transitions = self._transition[rows]
+        first = transitions[0]
+        if (transitions == first).all():
+            eased = self._transitions[first](progress)
+        else:
+            eased = numpy.empty_like(progress)
+            for transition in numpy.unique(transitions).tolist():
+                matching = transitions == transition
+                eased[matching] = self._transitions[transition](progress[matching])
+        values = self._start[rows] * (1.0 - eased) + self._end[rows] * eased
+        #
+        # Rounded values are set as ints
+        rounded = self._round[rows]
+        if rounded.any():
+            values = values.astype(object)
+            values[rounded] = numpy.rint(values[rounded].astype(float)).astype(int).astype(object)
+        setters = self._setters
+        for row, value in zip(rows.tolist(), values.tolist()):
+            function, target, name = setters[row]
+            if function is None:
+                setattr(target, name, value)
+            else:
+                function(value)
+        #
+        finished = rows[progress >= 1.0].tolist()
+        owners = self._owners
+        return list(OrderedDict.fromkeys(owners[row] for row in finished))
+
+
+def benchmark(group, frames=60, dt=16.0):
+    """Return the microseconds per frame to update group"""
+    start = default_timer()
+    for _ in range(frames):
+        group.update(dt)
+    return (default_timer() - start) * 1e6 / frames
+
+
+if __name__ == "__main__":
+    import pygame
+    from data.components.animation import Animation, AnimationGroup
+
+    class Target(object):
+        x = 0
+
+    def make_group(group, tweens):
+        for index in range(tweens):
+            animation = Animation(x=1000, duration=60000, round_values=index % 2,
+                                  transition='out_quint')
+            animation.start(Target())
+            group.add(animation)
+        return group
+
+    print("tweens  plain group  AnimationGroup  (us per frame)")
+    for tweens in (1, 100, 5000):
+        plain = benchmark(make_group(pygame.sprite.Group(), tweens))
+        batched = benchmark(make_group(AnimationGroup(), tweens))
+        print("{:6d} {:12.1f} {:15.1f}".format(tweens, plain, batched))
@@ -1,10 +1,19 @@
 from collections import OrderedDict
 from importlib import import_module
+from timeit import default_timer
 import os
 import json
 import pygame as pg
 from data.components.casino_player import CasinoPlayer
-from . import prepare
+from data.components.frame_timer import FrameTimer
+from data.components import text_cache
+from . import prepare, tools
+from .autosave import AutoSaver, load_stats, SAVE_PATH
+from .savefile import freeze, read_header, VERSION
+from .manifest import LazyState, read_manifest, prefetch
+from .loader import BackgroundLoader
+from .scaling import Scaler
+from .state_pool import StatePool, instance_size
 
 
 
@@ -20,6 +29,7 @@ class Control(object):
         self.render_size = render_size
         self.render_surf = pg.Surface(self.render_size).convert()
         self.resolutions = resolutions
+        self.scaler = Scaler(self.render_size, self.screen_rect.size)
         self.set_scale()
         self.caption = caption
         self.done = False
@@ -29,17 +39,45 @@ class Control(object):
         self.now = 0.0
         self.keys = pg.key.get_pressed()
         self.state_dict = OrderedDict()
+        self.state_pool = StatePool(budget=64*2**20)
+        self.entry_times = []
+        self._entry = None
+        self.lazy_states = True
+        self.prefetch = False
+        self.asset_warm_time = 2.0
+        self.loader = None
+        self.loader_time = 8.0
         self.state_name = None
         self.state = None
         self.music_handler = None
         self.max_iterations = None
         self.iterations = 0
+        self.fixed_dt = None
+        self.busy_time = 0.0
+        self.dirty_rects = None
+        self.frame_dt = 0.0
+        self.frame_timer = FrameTimer()
+        self.idle_pacing = True
+        self.idle_fps = 10.0
+        self.max_idle_wait = 1000.0
+        self.idle_wait = None
+        self.accumulator = 0.0
+        self.fixed_steps = 0
+        self._waiting_events = []
+        self.coalesced_events = 0
+        self.max_dirty_fraction = 0.5
+        self._full_redraw = True
 
         self._disk_stats_available = False
+        self.autosave = None
+        self.autosave_player = None
 
     def auto_discovery(self, scene_folder=None):
         """ Scan a folder, load states found in it, and register them
 
+        States with a manifest are registered as LazyStates and are not
+        imported until they are started, unless lazy_states is False.
+
         :param scene_folder:
         :return:
         """
@@ -49,9 +87,94 @@ class Control(object):
         for folder in os.listdir(scene_folder):
             if any(folder.endswith(end) for end in exclude_endings):
                 continue
-            state = self.load_state_from_path(folder)
+            manifest = None
+            if self.lazy_states:
+                manifest = read_manifest(os.path.join(scene_folder, folder))
+            if manifest is not None:
+                state = LazyState("data.states." + folder, manifest)
+            else:
+                state = self.load_state_from_path(folder)
             self.register_state(state, folder)
 
+    def warm_state_assets(self, state_name, urgent=False):
+        """ Queue the assets in a state's preload list to be loaded
+
+        A few are loaded each frame, see warm_assets. Urgent ones go ahead
+        of those already queued.
+
+        :param state_name: name of state whose assets are wanted
+        :param urgent: True to load them before other queued assets
+        :return: None
+        """
+        preload = getattr(self.state_dict.get(state_name), "preload", None)
+        if preload:
+            prepare.GFX.warm(preload.get("gfx", ()), urgent)
+            prepare.SFX.warm(preload.get("sfx", ()), urgent)
+
+    def warm_assets(self):
+        """
+        Spend up to asset_warm_time milliseconds loading queued assets, and
+        up to loader_time finishing what the background loader has done.
+        """
+        if prepare.GFX.warm_step(self.asset_warm_time) == 0:
+            prepare.SFX.warm_step(self.asset_warm_time)
+        if self.loader is not None and self.loader.update(self.loader_time) == 0:
+            self.loader = None
+
+    def start_loading(self, first=("title_screen", "lobby")):
+        """ Import states and load assets in the background
+
+        The states in first are imported and their preload lists loaded as
+        the group "first", which the splash screen waits for. The other
+        states are then imported, after the first ones, as the group
+        "rest"; their assets are warmed from the lobby as usual.
+
+        Importing a state makes surfaces and renders text, so the imports
+        are done on the main thread, one state at a time in warm_assets;
+        only the asset files are read and decoded on the workers.
+
+        :param first: names of the states needed first
+        :return: None
+        """
+        loader = BackgroundLoader()
+        first = [name for name in first if name in self.state_dict]
+        rest = [name for name in self.state_dict if name not in first]
+
+        def import_state(state):
+            if isinstance(state, LazyState):
+                state.load()
+
+        def add_imports(names, group):
+            for name in names:
+                loader.add(None, lambda _, state=self.state_dict[name]: import_state(state),
+                           group)
+
+        add_imports(first, "first")
+        loader.add(None, lambda _: add_imports(rest, "rest"), "first")
+        for name in first:
+            preload = getattr(self.state_dict[name], "preload", None) or {}
+            prepare.GFX.load_in_background(preload.get("gfx", ()), loader,
+                                           "first")
+            prepare.SFX.load_in_background(preload.get("sfx", ()), loader,
+                                           "first")
+        self.loader = loader
+
+    def prefetch_states(self):
+        """ Queue the import of states that are not loaded yet
+
+        Does nothing unless prefetch is set or while a prefetch is queued.
+        The imports are done on the main thread in warm_assets.
+
+        :return: None
+        """
+        if not self.prefetch:
+            return
+        if self.loader is None:
+            self.loader = BackgroundLoader()
+        elif self.loader.remaining("prefetch"):
+            return
+        prefetch(self.state_dict.values(), self.loader)
+
     def register_state(self, state, folder):
         if folder in self.state_dict:
             print('Duplicate state detected: {}'.format(folder))
@@ -63,11 +186,13 @@ class Control(object):
         return self._disk_stats_available
 
     def check_for_saved_stats(self):
-        """ TODO: this needs to not load the stats
+        """ Check for a save game by reading only its header
 
-        :return: bool
+        :return: None
         """
-        self._disk_stats_available = self.read_games_stats_from_disk() is not None
+        header = read_header(SAVE_PATH)
+        self._disk_stats_available = (header is not None and
+                                      header["version"] <= VERSION)
 
     @staticmethod
     def load_state_from_path(folder):
@@ -90,18 +215,42 @@ class Control(object):
 
     @staticmethod
     def read_games_stats_from_disk():
-        """ Load stats saved in JSON format
+        """ Load stats saved in JSON format, with autosaved changes
 
         :return: stats dict
         """
-        try:
-            path = os.path.join("resources", "save_game.json")
-            with open(path) as saved_file:
-                stats = json.load(saved_file)
-        except (IOError, ValueError):
-            stats = None
+        return load_stats()
 
-        return stats
+    def start_autosave(self, casino_player):
+        """ Save the player's stats in the background as they change
+
+        :param casino_player: CasinoPlayer of the session
+        :return: None
+        """
+        if self.autosave is None:
+            self.autosave = AutoSaver()
+        self.autosave.start(casino_player.get_all_stats())
+        casino_player.journal = self.autosave
+        self.autosave_player = casino_player
+
+    def save_stats(self, casino_player):
+        """ Save all of the player's stats now, in the background
+
+        :param casino_player: CasinoPlayer of the session
+        :return: None
+        """
+        if casino_player.journal is None:
+            self.start_autosave(casino_player)
+        casino_player.journal.save(freeze(casino_player.get_all_stats()))
+
+    def close(self):
+        """ Finish saving stats before the program exits
+
+        :return: None
+        """
+        if self.autosave is not None:
+            stats = freeze(self.autosave_player.get_all_stats())
+            self.autosave.close(stats)
 
     def create_new_games_stats(self):
         """ Create new dict suitable for use when creating CasinoPlayer
@@ -164,12 +313,24 @@ class Control(object):
             print('Cannot find state: {}'.format(state_name))
             raise RuntimeError
 
-        instance = state()
+        start = default_timer()
+        text_cache.CACHE.section = state_name
+        instance = None
+        if getattr(state, "reusable", False):
+            instance = self.state_pool.take(state_name)
+        pooled = instance is not None
+        if pooled:
+            instance.reset()
+        else:
+            instance = state()
         instance.controller = self
         instance.startup(self.now, persist)
+        self._entry = (state_name, pooled, start)
 
         self.state = instance
         self.state_name = state_name
+        self.accumulator = 0.0
+        self._full_redraw = True
 
     def query_all_states(self):
         """ Return a dictionary of all loaded states
@@ -184,28 +345,142 @@ class Control(object):
         """
         Checks if a state is done or has called for a game quit.
         State is flipped if neccessary and State.update is called.
+        The rects returned by State.update (if any) are stored in
+        self.dirty_rects for render to present.
         """
         self.screen = pg.display.get_surface()
-        self.now = pg.time.get_ticks()
+        if self.fixed_dt is None:
+            self.now = pg.time.get_ticks()
+        else:
+            self.now += dt
         if self.state.quit:
             self.done = True
         elif self.state.done:
             self.flip_state()
-        self.state.update(self.render_surf,self.keys,self.now,dt,self.scale)
+        self.frame_timer.lap("state_change")
+        if self.state.fixed_timestep:
+            self.step_simulation(dt)
+            self.frame_timer.lap("simulate")
+        dirty = self.state.update(self.render_surf, self.keys, self.now, dt,
+                                  self.scale)
+        self.frame_timer.lap("update")
+        prepare.BROADCASTER.flush()
+        self.frame_timer.lap("broadcast")
+        self.warm_assets()
+        self.frame_timer.lap("assets")
+        self.idle_wait = self.get_idle_wait(dirty)
         if self.music_handler and self.state.use_music_handler:
             self.music_handler.update(self.scale)
             self.music_handler.draw(self.render_surf)
+            if dirty is not None:
+                dirty = list(dirty) + [self.music_handler.rect]
+            self.frame_timer.lap("music")
+        self.frame_dt = dt
+        self.dirty_rects = self.check_dirty_rects(dirty)
+
+    def step_simulation(self, dt):
+        """
+        Run as many fixed_update steps of the current state as the time
+        accumulated so far allows. If the state falls more than
+        max_fixed_steps behind the backlog is dropped so a slow frame
+        cannot make the next one slower still. The leftover fraction of a
+        step is given to the state as alpha.
+        """
+        step = self.state.fixed_timestep
+        self.accumulator += dt
+        steps = 0
+        while self.accumulator >= step:
+            if steps >= self.state.max_fixed_steps:
+                self.accumulator %= step
+                break
+            self.state.fixed_update(self.keys, self.now, step)
+            self.accumulator -= step
+            steps += 1
+        self.fixed_steps = steps
+        self.state.alpha = self.accumulator/step
+
+    def get_idle_wait(self, dirty):
+        """
+        Return how long main may block waiting for input before the next
+        frame, or None to keep running at the normal frame rate. A state is
+        idle if its idle_timeout says so or if it reported no dirty rects,
+        in which case the frame rate drops to idle_fps. The wait ends in
+        time for the state's next timed work, see time_to_next_update, and
+        there is none once the state is done or quitting.
+        """
+        if not self.idle_pacing or self.fixed_dt is not None:
+            return None
+        if self.state.done or self.state.quit:
+            # The next state, or quitting, comes on the next update
+            return None
+        timeout = self.state.idle_timeout()
+        if timeout is None and dirty is not None and not dirty:
+            timeout = 1000.0/self.idle_fps
+        if timeout is None:
+            return None
+        pending = self.state.time_to_next_update()
+        if pending is not None:
+            if pending <= 0:
+                return None
+            timeout = min(timeout, pending)
+        return min(timeout, self.max_idle_wait)
+
+    def wait_for_input(self, timeout):
+        """
+        Block until an event arrives or timeout milliseconds pass. The event
+        is kept for the next call to event_loop.
+        """
+        if self._waiting_events or pg.event.peek():
+            return
+        try:
+            event = pg.event.wait(int(timeout))
+        except TypeError:
+            # pygame 1.9 has no timeout, so just drop to a low frame rate
+            self.clock.tick(1000.0/timeout)
+            return
+        if event.type != pg.NOEVENT:
+            self._waiting_events.append(event)
+
+    def check_dirty_rects(self, dirty):
+        """
+        Return a list of rects clipped to the render surface or None if the
+        whole frame should be presented. Full frames are used after a state
+        change or resize, and when the rects cover too much of the surface
+        for partial updates to be worth it. The scaler skips unchanged full
+        frames of states that report no dirty rects, except when a full
+        redraw was asked for.
+        """
+        # A state that draws whole frames may still draw the same one again
+        self.scaler.skip_unchanged = dirty is None and not self._full_redraw
+        if self._full_redraw or dirty is None:
+            self._full_redraw = False
+            return None
+        render_rect = self.render_surf.get_rect()
+        rects = [render_rect.clip(rect) for rect in dirty]
+        rects = [rect for rect in rects if rect.w and rect.h]
+        limit = render_rect.w*render_rect.h*self.max_dirty_fraction
+        if sum(rect.w*rect.h for rect in rects) > limit:
+            return None
+        return rects
 
     def render(self):
         """
         Scale the render surface if not the same size as the display surface.
         The render surface is then drawn to the screen.
+
+        If the state reported dirty rects only those regions are drawn and
+        the list of changed screen rects is returned. Otherwise the whole
+        surface is drawn and None is returned. The frame timing overlay is
+        drawn over the scaled frame; turning it off redraws the frame.
         """
-        if self.render_size != self.screen_rect.size:
-            scale_args = (self.render_surf, self.screen_rect.size, self.screen)
-            pg.transform.smoothscale(*scale_args)
-        else:
-            self.screen.blit(self.render_surf, (0, 0))
+        updated = self.scaler.present(self.render_surf, self.screen,
+                                      self.dirty_rects)
+        # The overlay goes on the screen, so the state's frame is left clean
+        overlay = self.frame_timer.draw(self.screen, self.state_name,
+                                        self.frame_dt)
+        if overlay and updated is not None:
+            updated = list(updated) + [overlay]
+        return updated
 
     def flip_state(self):
         """
@@ -214,18 +489,53 @@ class Control(object):
         """
         previous, self.state_name = self.state_name, self.state.next
         persist = self.state.cleanup()
+        if self.state.reusable:
+            self.pool_state(previous, self.state)
         self.start_state(self.state_name, persist)
         self.state.previous = previous
 
+    def pool_state(self, state_name, instance):
+        """
+        Keep a reusable state instance in state_pool to be started again
+        later. Surfaces held by prepare.GFX are not counted against the
+        pool's budget.
+        """
+        shared = set(id(image) for image in prepare.GFX.loaded_assets())
+        size = instance_size(instance, shared)
+        self.state_pool.put(state_name, instance, size)
+
+    def record_entry_time(self):
+        """
+        After the first frame of a newly started state has been shown, add
+        (state name, reused from the pool, milliseconds since start_state)
+        to entry_times.
+        """
+        if self._entry is not None:
+            state_name, pooled, start = self._entry
+            elapsed = (default_timer()-start)*1000.0
+            self.entry_times.append((state_name, pooled, elapsed))
+            self._entry = None
+
     def event_loop(self):
         """
         Process all events and pass them down to current State.
         The f5 key globally turns on/off the display of FPS in the caption
+        and f6 the frame timing overlay.
+        Mouse motion events are merged, see tools.coalesce_motion, unless
+        the State sets coalesce_motion to False. coalesced_events counts
+        the events dropped this way.
         """
-        for event in pg.event.get():
+        events = self._waiting_events + pg.event.get()
+        self._waiting_events = []
+        if getattr(self.state, "coalesce_motion", True):
+            count = len(events)
+            events = tools.coalesce_motion(events)
+            self.coalesced_events += count-len(events)
+        for event in events:
             if event.type == pg.KEYDOWN:
                 self.keys = pg.key.get_pressed()
                 self.toggle_show_fps(event.key)
+                self.toggle_timing_overlay(event.key)
                 if event.key == pg.K_PRINT:
                     #Print screen for full render-sized screencaps.
                     pg.image.save(self.render_surf, "screenshot.png")
@@ -234,6 +544,8 @@ class Control(object):
             elif event.type == pg.VIDEORESIZE:
                 self.on_resize(event.size)
                 pg.event.clear(pg.VIDEORESIZE)
+            elif event.type == pg.VIDEOEXPOSE:
+                self._full_redraw = True
             self.state.get_event(event, self.scale)
             if self.music_handler and self.state.use_music_handler:
                 self.music_handler.get_event(event, self.scale)
@@ -254,15 +566,23 @@ class Control(object):
         self.screen = pg.display.set_mode(new_size, pg.RESIZABLE)
         self.screen_rect.size = new_size
         self.set_scale()
+        self._full_redraw = True
 
     def set_scale(self):
         """
         Reset the ratio of render size to window size.
         Used to make sure that mouse clicks are accurate on all resolutions.
+        If the scaling mode leaves a border the offset of the rendered
+        image is appended to the ratios.
         """
-        w_ratio = self.render_size[0]/float(self.screen_rect.w)
-        h_ratio = self.render_size[1]/float(self.screen_rect.h)
-        self.scale = (w_ratio, h_ratio)
+        self.scaler.resize(self.render_size, self.screen_rect.size)
+        self.scale = self.scaler.scale
+
+    def set_scaling_mode(self, mode):
+        """Change how the render surface is fitted to the window."""
+        self.scaler.set_mode(mode)
+        self.set_scale()
+        self._full_redraw = True
 
     def toggle_show_fps(self, key):
         """Press f5 to turn on/off displaying the framerate in the caption."""
@@ -271,24 +591,58 @@ class Control(object):
             if not self.show_fps:
                 pg.display.set_caption(self.caption)
 
+    def toggle_timing_overlay(self, key):
+        """Press f6 to turn on/off the frame timing overlay."""
+        if key == pg.K_F6:
+            self.frame_timer.toggle_overlay()
+            self._full_redraw = True
+
     def main(self):
         """Main loop for entire program."""
 
         self.check_for_saved_stats()
 
         self.iterations = 0
+        self.busy_time = 0.0
         while not self.is_complete():
-            time_delta = self.clock.tick(self.fps)
+            if self.fixed_dt is not None:
+                self.clock.tick()
+                time_delta = self.fixed_dt
+            else:
+                if self.idle_wait is not None:
+                    self.wait_for_input(self.idle_wait)
+                time_delta = self.clock.tick(self.fps)
+            start = default_timer()
+            self.frame_timer.begin()
             self.event_loop()
+            self.frame_timer.lap("event_loop")
             self.update(time_delta)
-            self.render()
-            pg.display.update()
+            updated = self.render()
+            self.frame_timer.lap("render")
+            if updated is None:
+                pg.display.update()
+            else:
+                pg.display.update(updated)
+            self.frame_timer.lap("display")
+            self.record_entry_time()
+            self.frame_timer.end(self.state_name)
+            self.busy_time += default_timer() - start
             if self.show_fps:
                 fps = self.clock.get_fps()
                 with_fps = "{} - {:.2f} FPS".format(self.caption, fps)
                 pg.display.set_caption(with_fps)
             self.iterations += 1
 
+    def throughput(self):
+        """
+        Return frames per second of time actually spent processing frames
+        during the last call to main. Time spent waiting on the clock is
+        not counted.
+        """
+        if not self.busy_time:
+            return 0.0
+        return self.iterations/self.busy_time
+
     def is_complete(self):
         """Return True if the control is complete and should stop running"""
         if self.max_iterations is None:
@@ -109,7 +109,80 @@ class OtherComponent2:
         if the_player_did_well:
             Broadcaster.processEvent((E_DID_WELL, +20))
 
+A Broadcaster differs from other EventAware objects in a few ways:
+
+- it keeps only weak references to listeners that are bound methods, so
+linking an object's method does not keep the object alive and the link is
+dropped when the object goes away (pass weak=False to keep it alive)
+
+- event names are interned to integer ids by event_id. Using the id, eg
+E_DID_WELL = event_id('player-did-well'), avoids looking the name up each
+time an event is processed
+
+- events can be queued with post instead of processed straight away.
+Control calls flush once a frame to process the queue, which is useful for
+events detected in the middle of something, like a physics step
+
+- setting instrument counts how often each event is processed and how long
+its listeners take, see report
+
 """
+import threading
+import weakref
+from collections import deque
+from timeit import default_timer
+
+_event_ids = {}
+_event_names = []
+_event_lock = threading.Lock()
+
+
+def event_id(name):
+    """Return the integer id of an event name, giving it one if it is new"""
+    if isinstance(name, int):
+        return name
+    try:
+        return _event_ids[name]
+    except KeyError:
+        with _event_lock:
+            if name not in _event_ids:
+                _event_ids[name] = len(_event_names)
+                _event_names.append(name)
+            return _event_ids[name]
+
+
+def event_name(event):
+    """Return the name of an event id"""
+    if isinstance(event, int) and 0 <= event < len(_event_names):
+        return _event_names[event]
+    return event
+
+
+def _make_link(callback, arg, weak):
+    """Return a link (target, function, arg) for a callback
+
+    For a weakly linked method target is a weak reference to its object and
+    function is the plain function. Otherwise target is None and function is
+    the callback.
+
+    """
+    target = getattr(callback, '__self__', None)
+    if weak and target is not None and hasattr(callback, '__func__'):
+        return weakref.ref(target), callback.__func__, arg
+    return None, callback, arg
+
+
+def _is_alive(link):
+    return link[0] is None or link[0]() is not None
+
+
+def _links_to(link, callback):
+    """Return True if link calls callback"""
+    target, function, arg = link
+    if target is None:
+        return function == callback
+    return (target() is getattr(callback, '__self__', None) and
+            function is getattr(callback, '__func__', None))
 
 
 class EventNotLinked(Exception):
@@ -220,8 +293,131 @@ class Broadcaster(EventAware):
     occurring within the application without having to explicitly link the components
     together.
 
+    Listeners are kept in lists indexed by event id. A list is replaced rather than
+    changed when links are added or removed, so a listener can link or unlink
+    while the event is being processed.
+
     """
 
     def __init__(self):
         """Initialise the broadcaster"""
-        self.initEvents()
\ No newline at end of file
+        self.initEvents()
+        self._links = []
+        self._queue = deque()
+        self.instrument = False
+        self.dispatches = {}
+
+    def _get_links(self, event):
+        """Return the links for an event id"""
+        if 0 <= event < len(self._links):
+            return self._links[event]
+        return ()
+
+    def _set_links(self, event, links):
+        """Set the links for an event id"""
+        if event >= len(self._links):
+            self._links.extend([()] * (event + 1 - len(self._links)))
+        self._links[event] = links
+
+    def processEvent(self, event):
+        """Process an incoming event straight away
+
+        Listeners that have gone away are dropped.
+
+        """
+        name, obj = event
+        event = name if isinstance(name, int) else event_id(name)
+        links = self._links[event] if event < len(self._links) else ()
+        inhibits = set()
+        if not links:
+            new_inhibits = self.handleEvent((name, obj))
+            if new_inhibits:
+                inhibits.add(new_inhibits)
+            return inhibits
+        #
+        start = default_timer() if self.instrument else None
+        dead = False
+        for target, function, arg in links:
+            if target is None:
+                new_inhibits = function(obj, arg)
+            else:
+                listener = target()
+                if listener is None:
+                    dead = True
+                    continue
+                new_inhibits = function(listener, obj, arg)
+            # Watch for new events to inhibit
+            if new_inhibits:
+                inhibits.add(new_inhibits)
+        #
+        if dead:
+            self._set_links(event, tuple(
+                link for link in self._get_links(event) if _is_alive(link)))
+        if start is not None:
+            counts = self.dispatches.setdefault(event, [0, 0.0])
+            counts[0] += 1
+            counts[1] += default_timer() - start
+        return inhibits
+
+    def post(self, event):
+        """Queue an event to be processed at the next flush"""
+        self._queue.append(event)
+
+    def flush(self):
+        """Process the events queued so far
+
+        Events posted while doing this wait for the next flush. Returns the
+        number of events processed.
+
+        """
+        count = len(self._queue)
+        for _ in range(count):
+            self.processEvent(self._queue.popleft())
+        return count
+
+    def linkEvent(self, name, callback, arg=None, weak=True):
+        """Link an event to a callback
+
+        As for EventAware.linkEvent but a bound method is only weakly referenced
+        unless weak is False.
+
+        """
+        event = event_id(name)
+        link = _make_link(callback, arg, weak)
+        self._set_links(event, self._get_links(event) + (link,))
+
+    def unlinkEvent(self, name, callback=None):
+        """Unlink an event from a callback"""
+        event = event_id(name)
+        old_items = self._get_links(event)
+        if not old_items:
+            raise EventNotLinked('No links to event "%s"' % event_name(name))
+        if callback is None:
+            self._set_links(event, ())
+            return
+        #
+        new_items = tuple(
+            link for link in old_items
+            if _is_alive(link) and not _links_to(link, callback))
+        if not any(_links_to(link, callback) for link in old_items):
+            raise EventNotLinked('No links for event "%s" with callback "%s"' % (event_name(name), callback))
+        self._set_links(event, new_items)
+
+    def listener_count(self, name):
+        """Return the number of live listeners for an event"""
+        return sum(1 for link in self._get_links(event_id(name))
+                   if _is_alive(link))
+
+    def report(self):
+        """Return lines giving the listeners and dispatch time of each event"""
+        lines = ['{0:<28} {1:>9} {2:>10} {3:>9} {4:>9}'.format(
+            'event', 'listeners', 'processed', 'total ms', 'mean us')]
+        for event in range(len(self._links)):
+            count, seconds = self.dispatches.get(event, (0, 0.0))
+            listeners = self.listener_count(event)
+            if not (count or listeners):
+                continue
+            lines.append('{0:<28} {1:>9} {2:>10} {3:>9.2f} {4:>9.1f}'.format(
+                event_name(event), listeners, count, seconds * 1000.0,
+                seconds * 1e6 / count if count else 0.0))
+        return '\n'.join(lines)
@@ -0,0 +1,94 @@
+"""
+Background loading.
+
+BackgroundLoader runs jobs on a small pool of worker threads. A job is a
+work function, run on a worker, and a finish function which is given the
+result on the main thread when Control calls update. Work such as
+reading and decoding files goes to the workers; anything that has to
+happen on the main thread, like converting surfaces to the display format
+or importing a state, which makes surfaces and renders text, goes in
+finish and is done a few milliseconds' worth per frame.
+
+Jobs can be put in named groups so a screen can show the progress of the
+ones it is waiting for.
+"""
+import threading
+from collections import deque
+from timeit import default_timer
+
+try:
+    import queue
+except ImportError:
+    import Queue as queue
+
+
+class BackgroundLoader(object):
+    """Runs jobs on worker threads and finishes them on the main thread."""
+    def __init__(self, workers=2):
+        self.workers = workers
+        self.failed = 0
+        self._jobs = queue.Queue()
+        self._results = deque()
+        self._groups = {}
+        self._threads = []
+
+    def add(self, work, finish=None, group=None):
+        """
+        Queue a job. work() runs on a worker thread, or not at all if work
+        is None, and finish(result) runs on the main thread during update.
+        """
+        self._groups.setdefault(group, [0, 0])[0] += 1
+        if work is None:
+            self._results.append((finish, None, group, None))
+            return
+        self._jobs.put((work, finish, group))
+        if len(self._threads) < self.workers:
+            thread = threading.Thread(target=self._work, name="loader")
+            thread.daemon = True
+            thread.start()
+            self._threads.append(thread)
+
+    def _work(self):
+        while True:
+            work, finish, group = self._jobs.get()
+            try:
+                result, error = work(), None
+            except Exception as e:
+                result, error = None, e
+            self._results.append((finish, result, group, error))
+
+    def update(self, time_limit):
+        """
+        Finish completed jobs until time_limit milliseconds have passed.
+        A job that fails is counted in failed and otherwise ignored; the
+        same work is simply done again when it is needed. Returns the
+        number of jobs not yet finished.
+        """
+        end = default_timer()+time_limit/1000.0
+        while self._results and default_timer() < end:
+            finish, result, group, error = self._results.popleft()
+            if error is None and finish is not None:
+                try:
+                    finish(result)
+                except Exception:
+                    error = True
+            if error is not None:
+                self.failed += 1
+            self._groups[group][1] += 1
+        return self.remaining()
+
+    def remaining(self, group=None):
+        """Number of jobs not finished, in group if given."""
+        if group is not None:
+            total, finished = self._groups.get(group, (0, 0))
+            return total-finished
+        return sum(total-finished for total, finished in self._groups.values())
+
+    def progress(self, group=None):
+        """Fraction of jobs finished, in group if given."""
+        if group is not None:
+            total, finished = self._groups.get(group, (0, 0))
+        else:
+            total = sum(count[0] for count in self._groups.values())
+            finished = sum(count[1] for count in self._groups.values())
+        return finished/float(total) if total else 1.0
@@ -9,7 +9,7 @@ import cProfile
 import pstats
 
 from . import prepare, tools
-from .components import music_handler
+from .components import music_handler, text_cache
 import data.control
 
 
@@ -17,7 +17,19 @@ def main():
     args = (prepare.CAPTION, prepare.RENDER_SIZE, prepare.RESOLUTIONS)
     run_it = data.control.Control(*args)
     run_it.show_fps = prepare.ARGS["FPS"]
+    run_it.set_scaling_mode(prepare.ARGS["scaling"])
     run_it.max_iterations = prepare.ARGS["iterations"]
+    run_it.idle_pacing = not prepare.ARGS["no_idle"]
+    run_it.fixed_dt = prepare.ARGS["dt"]
+    if prepare.ARGS["headless"] and run_it.fixed_dt is None:
+        run_it.fixed_dt = 1000.0/run_it.fps
+    run_it.lazy_states = not prepare.ARGS["eager"]
+    run_it.prefetch = prepare.ARGS["prefetch"]
+    prepare.BROADCASTER.instrument = bool(prepare.ARGS["timing"])
+    if prepare.ARGS["pool_budget"] is not None:
+        run_it.state_pool.budget = int(prepare.ARGS["pool_budget"]*2**20)
+    if prepare.ARGS["text_budget"] is not None:
+        text_cache.CACHE.budget = int(prepare.ARGS["text_budget"]*2**20)
     run_it.music_handler = music_handler.MusicHandler()
     run_it.auto_discovery()
 
@@ -26,6 +38,8 @@ def main():
 
     straight = prepare.ARGS['straight']
     state = straight if straight else default_state
+    if state == default_state:
+        run_it.start_loading()
     run_it.start_state(state)
 
     # Start the main state
@@ -38,3 +52,17 @@ def main():
         cProfile.runctx('run_it.main()', globals(), locals(), 'profile')
         p = pstats.Stats('profile')
         print(p.sort_stats('cumulative').print_stats(100))
+    run_it.close()
+
+    if prepare.ARGS["timing"]:
+        run_it.frame_timer.write_csv(prepare.ARGS["timing"])
+        print(prepare.BROADCASTER.report())
+        coroutines = getattr(run_it.state, "coroutines", None)
+        if coroutines is not None:
+            print(coroutines.report())
+        print(text_cache.CACHE.report())
+
+    if prepare.ARGS["headless"]:
+        report = "{} frames of {} in {:.2f}s: {:.1f} frames/sec"
+        print(report.format(run_it.iterations, state, run_it.busy_time,
+                            run_it.throughput()))
@@ -0,0 +1,108 @@
+"""
+State manifests and lazily imported states.
+
+Every folder under data/states may hold a manifest.json giving what the
+rest of the game needs to know about a state before it is run:
+
+    name          - the folder name the state is registered under
+    show_in_lobby - whether the lobby offers a button for it
+    stats         - the stats initialize_stats would return, or null
+    icon          - lobby image relative to the folder, or null
+    preload       - {"gfx": [...], "sfx": [...]} names of prepare.GFX and
+                    prepare.SFX entries to warm before the state is started
+
+Control.auto_discovery wraps states with a manifest in a LazyState so
+their packages (and everything they import) are only loaded when the
+state is first started, or earlier by prefetch, a state a frame while the
+lobby is shown.
+"""
+import copy
+import json
+import os
+import threading
+from collections import OrderedDict
+from importlib import import_module
+from timeit import default_timer
+
+
+MANIFEST_NAME = "manifest.json"
+
+
+def read_manifest(folder):
+    """
+    Return the manifest in folder as an OrderedDict, or None if there is
+    no manifest.
+    """
+    path = os.path.join(folder, MANIFEST_NAME)
+    try:
+        with open(path) as manifest_file:
+            return json.load(manifest_file, object_pairs_hook=OrderedDict)
+    except IOError:
+        return None
+
+
+class LazyState(object):
+    """
+    Stands in for a State class until the class is needed. The manifest
+    answers show_in_lobby and initialize_stats; calling the LazyState or
+    reading any other attribute imports the package and uses its Scene.
+    Like a State class, show_in_lobby and initialize_stats are only present
+    when the state has them.
+    """
+    def __init__(self, package, manifest):
+        self.package = package
+        self.name = manifest["name"]
+        self.icon = manifest.get("icon")
+        self.preload = manifest.get("preload")
+        if manifest.get("show_in_lobby"):
+            self.show_in_lobby = True
+        if manifest.get("stats") is not None:
+            self._stats = manifest["stats"]
+            self.initialize_stats = self._initialize_stats
+        self.load_time = None
+        self._scene = None
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return "<LazyState {} ({})>".format(self.name,
+                                            "loaded" if self.loaded else "not loaded")
+
+    def __call__(self, *args, **kwargs):
+        return self.load()(*args, **kwargs)
+
+    def __getattr__(self, name):
+        if name.startswith("_") or name in ("show_in_lobby", "initialize_stats"):
+            raise AttributeError(name)
+        return getattr(self.load(), name)
+
+    @property
+    def loaded(self):
+        return self._scene is not None
+
+    def load(self):
+        """Import the package if it has not been, and return its Scene."""
+        with self._lock:
+            if self._scene is None:
+                start = default_timer()
+                self._scene = import_module(self.package).Scene
+                self.load_time = default_timer()-start
+        return self._scene
+
+    def _initialize_stats(self):
+        return copy.deepcopy(self._stats)
+
+
+def prefetch(states, loader, group="prefetch"):
+    """
+    Queue the import of every LazyState in states that is not loaded yet
+    on loader, a loader.BackgroundLoader, as finish-only jobs in group.
+    Importing a state makes surfaces and renders text, so the imports are
+    done on the main thread, one a job, when the loader is updated.
+    Failures are counted by the loader and left for the real start to
+    report. Returns the number of states queued.
+    """
+    pending = [state for state in states
+               if isinstance(state, LazyState) and not state.loaded]
+    for state in pending:
+        loader.add(None, lambda _, state=state: state.load(), group)
+    return len(pending)
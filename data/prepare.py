@@ -5,6 +5,8 @@ import os
 import pygame as pg
 from . import tools
 from . import events
+from . import assets
+from . import archive
 
 
 CAPTION = "Py Rollers Casino"
@@ -27,6 +29,11 @@ FELT_GREEN = (0, 153, 51) #Use this if making a standard table-style game.
 #Pre-initialize the mixer for less delay before a sound plays
 pg.mixer.pre_init(44100, -16, 1, 512)
 
+#Headless runs use SDL's dummy drivers so no window or sound device is needed
+if ARGS['headless']:
+    os.environ['SDL_VIDEODRIVER'] = "dummy"
+    os.environ['SDL_AUDIODRIVER'] = "dummy"
+
 #Initialization
 pg.init()
 if ARGS['center']:
@@ -41,13 +48,23 @@ else:
     pg.event.clear(pg.VIDEORESIZE)
 
 
-def _load_graphics():
+def _load_graphics(budget=None):
     """
-    Load all graphics into a dictionary; then cut up the card sprite sheet
-    so each card can be accessed individually. Also strips buttons from
-    button sheet.
+    Register all graphics in an asset registry, along with the images some
+    games keep in their own resource folders; then register the cards of
+    the card sprite sheet so each card can be accessed individually. Also
+    strips buttons from button sheet. Nothing is loaded until it is used,
+    and then from the packed archive if it has been built.
     """
-    gfx = tools.load_all_gfx(os.path.join("resources", "graphics"))
+    packed = archive.open_archive()
+    gfx = assets.gfx_registry(os.path.join("resources", "graphics"),
+                              budget=budget, archive=packed)
+    assets.register_gfx(gfx, "pachinko_playfield",
+                        os.path.join("resources", "pachinko", "playfield.jpg"),
+                        None, packed)
+    assets.register_gfx(gfx, "keno_balls",
+                        os.path.join("resources", "keno", "balls", "64x64",
+                                     "sheet.png"), archive=packed)
     _get_cards(gfx)
     _get_neon_buttons(gfx)
     return gfx
@@ -56,13 +73,12 @@ def _load_graphics():
 def _get_cards(gfx):
     """Cut cards into subsurfaces."""
     c_width, c_height = CARD_SIZE
-    sheet = gfx["cardsheet"]
     card_names = ["ace", 2, 3, 4, 5, 6, 7, 8, 9, 10, "jack", "queen", "king"]
     for j,suit in enumerate(["clubs", "hearts", "diamonds", "spades"]):
         for i,name in enumerate(card_names):
             rect = pg.Rect(i*c_width, j*c_height, c_width, c_height)
             key = "{}_of_{}".format(name, suit)
-            gfx[key] = sheet.subsurface(rect)
+            gfx.register_part(key, "cardsheet", rect)
 
 
 def _get_neon_buttons(gfx):
@@ -75,21 +91,24 @@ def _get_neon_buttons(gfx):
                              "Double", "Roll", "Ride", "Change",
                              "Tutorial", "Stay", "Pass", "Ante Up"]}
     for category in b_texts:
-        sheet = gfx["neon_button_{}".format(category)]
+        sheet = "neon_button_{}".format(category)
         for i,text in enumerate(b_texts[category]):
             off_rect = pg.Rect(0, i*b_height, b_width, b_height)
             on_rect = off_rect.move(b_width, 0)
             off_key = "neon_button_off_{}".format(text.lower())
             on_key = "neon_button_on_{}".format(text.lower())
-            gfx[off_key] = sheet.subsurface(off_rect)
-            gfx[on_key] = sheet.subsurface(on_rect)
+            gfx.register_part(off_key, sheet, off_rect)
+            gfx.register_part(on_key, sheet, on_rect)
 
 
-#Resource loading (Fonts and music just contain path names).
+#Resource loading (Fonts and music just contain path names; graphics and
+#sounds are loaded when first used).
 FONTS = tools.load_all_fonts(os.path.join("resources", "fonts"))
 MUSIC = tools.load_all_music(os.path.join("resources", "music"))
-SFX   = tools.load_all_sfx(os.path.join("resources", "sound"))
-GFX   = _load_graphics()
+ASSET_BUDGET = ARGS['asset_budget'] and int(ARGS['asset_budget']*2**20)
+SFX   = assets.sfx_registry(os.path.join("resources", "sound"),
+                            budget=ASSET_BUDGET)
+GFX   = _load_graphics(ASSET_BUDGET)
 
 
 #It's time to start the music, it's time to light the lights
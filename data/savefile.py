@@ -0,0 +1,154 @@
+"""
+Save file format.
+
+A save is a header line followed by the stats of each game. The header is
+a JSON object giving the format and version, a summary of the player
+(cash and account balance) and where each game's section is in the rest
+of the file, so whether there is a save, and what is in it, can be found
+without reading any further. Each section is the JSON of one game's stats.
+
+load reads a save into an OrderedDict of the player's values and a
+Section for each game, which is only parsed when the game's stats are
+first used (see CasinoPlayer). Saves from before this format, a single
+JSON object, are rewritten in it the first time they are loaded.
+"""
+import json
+import os
+from collections import OrderedDict
+
+
+FORMAT = "pyroller save"
+VERSION = 2
+
+
+class Section(object):
+    """The JSON text of one game's stats, parsed by load."""
+    __slots__ = ("text",)
+
+    def __init__(self, text):
+        self.text = text
+
+    def load(self):
+        return json.loads(self.text, object_pairs_hook=OrderedDict)
+
+
+def resolve(value):
+    """Return value, parsing it first if it is a Section."""
+    if isinstance(value, Section):
+        return value.load()
+    return value
+
+
+def freeze(stats):
+    """
+    Return a copy of stats with each game's stats, parsed or not, as a
+    Section. The copy can be handed to another thread.
+    """
+    frozen = OrderedDict()
+    for name, value in stats.items():
+        if isinstance(value, dict):
+            value = Section(json.dumps(value))
+        frozen[name] = value
+    return frozen
+
+
+def dumps(stats):
+    """Return stats, as given by load or freeze, in the save format."""
+    player = OrderedDict()
+    sections = OrderedDict()
+    body = []
+    offset = 0
+    for name, value in stats.items():
+        if isinstance(value, Section):
+            text = value.text
+        elif isinstance(value, dict):
+            text = json.dumps(value)
+        else:
+            player[name] = value
+            continue
+        sections[name] = [offset, len(text)]
+        body.append(text)
+        offset += len(text)
+    header = OrderedDict([("format", FORMAT),
+                          ("version", VERSION),
+                          ("player", player),
+                          ("sections", sections)])
+    return json.dumps(header)+"\n"+"".join(body)
+
+
+def write(stats, path):
+    """
+    Write stats to path under a temporary name and rename it into place,
+    so there is always either the old or the new save and never a part.
+    """
+    temp_path = path+".tmp"
+    with open(temp_path, "w") as temp_file:
+        temp_file.write(dumps(stats))
+        temp_file.flush()
+        os.fsync(temp_file.fileno())
+    replace = getattr(os, "replace", os.rename)
+    replace(temp_path, path)
+
+
+def parse_header(line):
+    """Return the header in line, or None if it is not one."""
+    try:
+        header = json.loads(line, object_pairs_hook=OrderedDict)
+    except ValueError:
+        return None
+    if not isinstance(header, dict) or header.get("format") != FORMAT:
+        return None
+    return header
+
+
+def read_header(path):
+    """
+    Return the header of the save at path, or None if there is none.
+    An old style save, which has no header, gives one with version 1.
+    """
+    try:
+        with open(path) as save_file:
+            line = save_file.readline()
+    except IOError:
+        return None
+    header = parse_header(line)
+    if header is None and line.startswith("{"):
+        header = OrderedDict([("format", FORMAT), ("version", 1)])
+    return header
+
+
+def load(path):
+    """
+    Return the stats saved at path, with each game's as a Section, or None
+    if there is no readable save. An old style save is rewritten in the
+    current format.
+    """
+    try:
+        with open(path) as save_file:
+            header = parse_header(save_file.readline())
+            if header is not None:
+                body = save_file.read()
+            else:
+                save_file.seek(0)
+                stats = json.load(save_file, object_pairs_hook=OrderedDict)
+    except (IOError, ValueError):
+        return None
+    if header is None:
+        return migrate(stats, path)
+    if header["version"] > VERSION:
+        return None
+    stats = OrderedDict(header["player"])
+    for name, (offset, length) in header["sections"].items():
+        stats[name] = Section(body[offset:offset+length])
+    return stats
+
+
+def migrate(stats, path):
+    """Rewrite an old style save of stats at path in the current format."""
+    if not isinstance(stats, dict):
+        return None
+    try:
+        write(stats, path)
+    except (IOError, OSError):
+        pass
+    return freeze(stats)
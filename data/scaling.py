@@ -0,0 +1,231 @@
+"""
+Scaling of the render surface onto the display surface.
+
+The whole game is drawn to a surface of prepare.RENDER_SIZE which then has
+to be fitted to the window. Scaler does that with one of several modes:
+
+    smooth  - pygame.transform.smoothscale; best looking, slowest.
+    fast    - pygame.transform.scale (nearest neighbour); much cheaper.
+    integer - scale by a whole number ratio (or its inverse) and centre the
+              result in the window. Pixels map exactly, so partial updates
+              never leave seams, at the cost of a border when the window is
+              not a multiple of the render size.
+
+Only the regions a state reports as dirty are rescaled when they are
+given, and an empty list of dirty rects skips scaling entirely. For states
+that draw whole frames, Control sets skip_unchanged, and a frame with the
+same checksum as the one before is not scaled again. The checksum costs a
+few milliseconds, so after miss_limit changed frames in a row only two
+frames in every check_every are checked until one is found unchanged.
+"""
+import math
+import zlib
+from timeit import default_timer
+
+import pygame as pg
+
+
+MODES = ("smooth", "fast", "integer")
+
+
+class Scaler(object):
+    """
+    Fits a render-sized surface onto the screen using the selected mode.
+    Call resize whenever either size changes; present draws a frame.
+    """
+    def __init__(self, render_size, screen_size, mode="smooth"):
+        if mode not in MODES:
+            raise ValueError("Unknown scaling mode: {}".format(mode))
+        self.mode = mode
+        self.skip_unchanged = False
+        self.miss_limit = 4
+        self.check_every = 8
+        self.frames_scaled = 0
+        self.frames_skipped = 0
+        self._checksum = None
+        self._misses = 0
+        self.resize(render_size, screen_size)
+
+    def set_mode(self, mode):
+        """Change scaling mode. The next frame will be drawn in full."""
+        if mode not in MODES:
+            raise ValueError("Unknown scaling mode: {}".format(mode))
+        self.mode = mode
+        self.resize(self.render_size, self.screen_size)
+
+    def resize(self, render_size, screen_size):
+        """
+        Work out the area of the screen the render surface is drawn into
+        and the matching ratios and offset for mouse positions.
+        """
+        self.render_size = tuple(render_size)
+        self.screen_size = tuple(screen_size)
+        self.factor = None
+        if self.mode == "integer":
+            self.factor = self.get_integer_factor(render_size, screen_size)
+            w = int(render_size[0]*self.factor)
+            h = int(render_size[1]*self.factor)
+            self.image_rect = pg.Rect(0, 0, w, h)
+            self.image_rect.center = (screen_size[0]//2, screen_size[1]//2)
+        else:
+            self.image_rect = pg.Rect((0, 0), screen_size)
+        w_ratio = render_size[0]/float(self.image_rect.w)
+        h_ratio = render_size[1]/float(self.image_rect.h)
+        if self.image_rect.topleft == (0, 0):
+            self.scale = (w_ratio, h_ratio)
+        else:
+            self.scale = (w_ratio, h_ratio) + self.image_rect.topleft
+        self._checksum = None
+        self._needs_border = self.image_rect.size != tuple(screen_size)
+
+    @staticmethod
+    def get_integer_factor(render_size, screen_size):
+        """
+        Return the largest whole number ratio (n or 1/n) at which render_size
+        fits inside screen_size.
+        """
+        fit = min(screen_size[0]/float(render_size[0]),
+                  screen_size[1]/float(render_size[1]))
+        if fit >= 1:
+            return float(int(fit))
+        return 1.0/int(math.ceil(1.0/fit))
+
+    def present(self, source, screen, dirty=None):
+        """
+        Draw source onto screen. If dirty is a list of rects only those
+        areas of source are drawn and the changed screen rects are returned.
+        If dirty is None the whole surface is drawn and None is returned.
+        """
+        if source.get_size() != self.render_size:
+            self.resize(source.get_size(), self.screen_size)
+        if dirty is not None:
+            if not dirty:
+                self.frames_skipped += 1
+                return []
+            self.frames_scaled += 1
+            return self.present_rects(source, screen, dirty)
+        if self.skip_unchanged and self._worth_checking():
+            checksum = zlib.adler32(source.get_view("1"))
+            if checksum == self._checksum:
+                self._misses = 0
+                self.frames_skipped += 1
+                return []
+            self._checksum = checksum
+        else:
+            self._checksum = None
+        self._misses += 1
+        if self._needs_border:
+            screen.fill(pg.Color("black"))
+            self._needs_border = False
+        self.frames_scaled += 1
+        self.scale_surface(source, screen.subsurface(self.image_rect))
+        return None
+
+    def _worth_checking(self):
+        """
+        True if the frame should be checksummed: the screen is scaled, which
+        costs more than the checksum, and frames have not kept changing.
+        """
+        if self.image_rect.size == self.render_size:
+            return False
+        if self._misses < self.miss_limit:
+            return True
+        # Check two frames in a row, so the second has one to compare with
+        return (self._misses-self.miss_limit) % self.check_every < 2
+
+    def present_rects(self, source, screen, dirty):
+        """Scale only the regions of source in dirty onto screen."""
+        self._checksum = None
+        if self.image_rect.size == self.render_size:
+            offset = self.image_rect.topleft
+            updated = []
+            for rect in dirty:
+                dest = screen.blit(source, rect.move(offset), rect)
+                updated.append(dest)
+            return updated
+        updated = []
+        for rect in dirty:
+            area, dest = self.scale_rect(rect)
+            if dest.w and dest.h and area.w and area.h:
+                target = screen.subsurface(dest)
+                self.scale_surface(source.subsurface(area), target)
+                updated.append(dest)
+        return updated
+
+    def scale_surface(self, source, target):
+        """Scale source to exactly fill target using the current mode."""
+        size = target.get_size()
+        if source.get_size() == size:
+            target.blit(source, (0, 0))
+        elif self.mode == "fast":
+            pg.transform.scale(source, size, target)
+        elif self.mode == "integer" and self.factor > 1:
+            pg.transform.scale(source, size, target)
+        else:
+            pg.transform.smoothscale(source, size, target)
+
+    def scale_rect(self, rect):
+        """
+        Return (area, dest) where dest is the screen rect covering rect on
+        the render surface, expanded to whole pixels, and area is the part
+        of the render surface that maps onto dest. In integer mode both are
+        snapped to the scaling grid so they correspond exactly.
+        """
+        x_ratio = self.image_rect.w/float(self.render_size[0])
+        y_ratio = self.image_rect.h/float(self.render_size[1])
+        if self.mode == "integer" and self.factor < 1:
+            step = int(round(1.0/self.factor))
+            left = (rect.left//step)*step
+            top = (rect.top//step)*step
+            right = -(-rect.right//step)*step
+            bottom = -(-rect.bottom//step)*step
+            rect = pg.Rect(left, top, right-left, bottom-top)
+        left = int(rect.left*x_ratio)
+        top = int(rect.top*y_ratio)
+        right = int(math.ceil(rect.right*x_ratio))
+        bottom = int(math.ceil(rect.bottom*y_ratio))
+        dest = pg.Rect(left, top, right-left, bottom-top)
+        dest = dest.clip(pg.Rect((0, 0), self.image_rect.size))
+        area = pg.Rect(int(dest.left/x_ratio), int(dest.top/y_ratio), 0, 0)
+        area.w = int(math.ceil(dest.right/x_ratio))-area.x
+        area.h = int(math.ceil(dest.bottom/y_ratio))-area.y
+        area = area.clip(pg.Rect((0, 0), self.render_size))
+        return area, dest.move(self.image_rect.topleft)
+
+
+def benchmark(render_size, resolutions, frames=60, modes=MODES):
+    """
+    Time full-frame and 5% dirty-region presentation for every mode at
+    every resolution. Returns a list of (mode, size, full_ms, partial_ms).
+    """
+    source = pg.Surface(render_size).convert()
+    for y in range(0, render_size[1], 16):
+        source.fill(((y*7) % 255, (y*3) % 255, (y*5) % 255),
+                    (0, y, render_size[0], 8))
+    dirty_rect = pg.Rect(0, 0, render_size[0]//5, render_size[1]//4)
+    results = []
+    for mode in modes:
+        for size in resolutions:
+            screen = pg.Surface(size).convert()
+            scaler = Scaler(render_size, size, mode)
+            start = default_timer()
+            for _ in range(frames):
+                scaler.present(source, screen)
+            full = (default_timer()-start)*1000.0/frames
+            start = default_timer()
+            for _ in range(frames):
+                scaler.present(source, screen, [dirty_rect])
+            partial = (default_timer()-start)*1000.0/frames
+            results.append((mode, size, full, partial))
+    return results
+
+
+if __name__ == "__main__":
+    from data import prepare
+    print("{:8} {:>11} {:>10} {:>12}".format("mode", "size",
+                                             "full ms", "5% dirty ms"))
+    for result in benchmark(prepare.RENDER_SIZE, prepare.RESOLUTIONS):
+        mode, size, full, partial = result
+        size = "{}x{}".format(*size)
+        print("{:8} {:>11} {:>10.2f} {:>12.2f}".format(mode, size,
+                                                       full, partial))
@@ -1,11 +1,34 @@
+#Returned from State.idle_timeout by states that only change on input.
+WAIT_FOR_INPUT = float("inf")
+
+
 class State(object):
     """
     This is a prototype class for States.  All states should inherit from it.
     No direct instances of this class should be created. get_event and update
     must be overloaded in the childclass.  startup and cleanup need to be
     overloaded when there is data that must persist between States.
+
+    States that want a deterministic simulation set fixed_timestep to a
+    step length in milliseconds and overload fixed_update. Control then
+    calls fixed_update as many times as the elapsed time allows (at most
+    max_fixed_steps per frame) before each update, and sets alpha to the
+    fraction of a step left over for interpolating what is drawn.
+
+    States that are expensive to build can set reusable. Control then keeps
+    the instance in its state pool when the state is left and, the next
+    time the state is started, calls reset followed by startup on it
+    instead of creating a new one.
+
+    Control merges the mouse motion events that arrive together in a frame
+    into one, with the final pos and the total rel. States that need every
+    motion event, for example to draw a path, set coalesce_motion to False.
     """
     name = 'State Name'
+    fixed_timestep = None
+    max_fixed_steps = 10
+    reusable = False
+    coalesce_motion = True
 
     def __init__(self, persistant={}):
         self.start_time = 0.0
@@ -16,6 +39,7 @@ class State(object):
         self.previous = None
         self.persist = persistant
         self.use_music_handler = True
+        self.alpha = 1.0
 
     def get_event(self, event, scale=(1,1)):
         """
@@ -40,10 +64,49 @@ class State(object):
         self.done = False
         return self.persist
 
+    def reset(self):
+        """
+        Return a pooled instance to the condition of a newly created one,
+        ready for startup. Overload in reusable states to reset whatever
+        __init__ sets up that play changes.
+        """
+        self.done = False
+        self.quit = False
+        self.next = None
+
+    def fixed_update(self, keys, now, step):
+        """
+        Advance the simulation by exactly step milliseconds. Only called
+        for states that set fixed_timestep.
+        """
+        pass
+
     def update(self, surface, keys, now, dt, scale):
-        """Update function for state.  Must be overloaded in children."""
+        """
+        Update function for state.  Must be overloaded in children.
+        States that only redraw part of surface may return a list of the
+        rects they changed so that only those areas are sent to the display.
+        Returning None (the default) presents the whole frame.
+        """
         pass
 
+    def idle_timeout(self):
+        """
+        Return how many milliseconds the state can go without an update if
+        no input arrives, or None if it must be updated every frame. States
+        whose screen only changes in response to input can return
+        WAIT_FOR_INPUT. Control caps the wait and wakes early on any event.
+        """
+        return None
+
+    def time_to_next_update(self):
+        """
+        Return how many milliseconds until the state has timed work to do,
+        like a delayed Task, 0 if it is animating, or None if nothing is
+        pending. Control never waits for input longer than this.
+        """
+        return None
+
     def render_font(self, font, msg, color, center):
         """Return the rendered font surface and its rect centered on center."""
         msg = font.render(msg, 1, color)
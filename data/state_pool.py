@@ -0,0 +1,116 @@
+"""
+Pool of state instances kept for reuse.
+
+Building a game state (Keno's 80 spots, Craps' scaled table, Bingo's cards
+and buttons) costs far more than restarting one. States that set reusable
+are put in the pool when they are left and Control.start_state takes them
+back out, calling their reset method before startup instead of building a
+new instance.
+
+The pool holds at most max_states instances and, given a budget in bytes,
+no more than that much surface memory. Once it holds more than either the
+least recently left states are dropped first. The memory of an instance
+is estimated with instance_size from the surfaces reachable from its
+attributes, not counting surfaces shared with others such as those in
+prepare.GFX.
+"""
+import types
+from collections import OrderedDict
+
+import pygame as pg
+
+from .state import State
+
+
+#Attributes that refer to objects a state shares rather than owns.
+SHARED_ATTRIBUTES = ("persist", "controller", "casino_player")
+SKIP_TYPES = (types.ModuleType, type, types.FunctionType, types.MethodType,
+              types.BuiltinFunctionType, types.GeneratorType)
+
+
+def instance_size(instance, shared=(), limit=50000):
+    """
+    Return the bytes of surface memory owned by instance: every surface
+    reachable from its attributes, counting subsurfaces as their parent
+    and skipping any whose id is in shared. At most limit objects are
+    looked at.
+    """
+    seen = set()
+    counted = set(shared)
+    total = 0
+    todo = [value for name, value in vars(instance).items()
+            if name not in SHARED_ATTRIBUTES]
+    while todo and len(seen) < limit:
+        obj = todo.pop()
+        if id(obj) in seen or isinstance(obj, SKIP_TYPES):
+            continue
+        seen.add(id(obj))
+        if isinstance(obj, pg.Surface):
+            root = obj.get_abs_parent()
+            if id(root) not in counted:
+                counted.add(id(root))
+                total += root.get_bytesize()*root.get_width()*root.get_height()
+        elif isinstance(obj, dict):
+            todo.extend(obj.keys())
+            todo.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            todo.extend(obj)
+        elif hasattr(obj, "__dict__") and not isinstance(obj, State):
+            todo.extend(vars(obj).values())
+    return total
+
+
+class StatePool(object):
+    """
+    Least recently used pool of state instances, keyed by state name.
+    hits and misses count how often take found an instance.
+    """
+    def __init__(self, max_states=4, budget=None):
+        self.max_states = max_states
+        self.budget = budget
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.resident = 0
+        self._states = OrderedDict()
+
+    def __contains__(self, name):
+        return name in self._states
+
+    def __len__(self):
+        return len(self._states)
+
+    def take(self, name):
+        """Remove and return the pooled instance of name, or None."""
+        instance, size = self._states.pop(name, (None, 0))
+        if instance is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.resident -= size
+        return instance
+
+    def put(self, name, instance, size=0):
+        """
+        Keep instance, which owns size bytes, for reuse as name and evict
+        the least recently pooled states until within the limits.
+        """
+        self.discard(name)
+        self._states[name] = (instance, size)
+        self.resident += size
+        while self._states and (len(self._states) > self.max_states or
+                                self.budget is not None and
+                                self.resident > self.budget):
+            _, (_, evicted_size) = self._states.popitem(last=False)
+            self.resident -= evicted_size
+            self.evictions += 1
+
+    def discard(self, name):
+        """Drop the pooled instance of name, if any."""
+        if name in self._states:
+            _, size = self._states.pop(name)
+            self.resident -= size
+
+    def clear(self):
+        self._states.clear()
+        self.resident = 0
@@ -5,6 +5,7 @@ import pygame as pg
 from data import tools, prepare
 from data.components.labels import Label, ButtonGroup, Button, TextBox, MoneyIcon
 import data.state
+from data.state import WAIT_FOR_INPUT
 
 
 class ATMScreen(data.state.State):
@@ -32,6 +33,7 @@ class ATMScreen(data.state.State):
                             }
         self.state_name = "MAINMENU"
         self.state = self.states[self.state_name]
+        self.switched = False
         self.frame = prepare.GFX["atm_frame"]
         topleft = self.screen_rect.left, self.screen_rect.bottom - 88
         self.cash_icon = MoneyIcon(topleft, (195, 88))
@@ -46,6 +48,7 @@ class ATMScreen(data.state.State):
     def update(self, surface, keys, current, dt, scale):
         self.player.account.update(current)
         self.cash_icon.update(self.player.cash)
+        self.switched = False
         if self.state.quit:
             self.state.quit = False
             self.done = True
@@ -57,12 +60,19 @@ class ATMScreen(data.state.State):
             self.state_name = next_state
             self.state = self.states[self.state_name]
             self.state.startup(persistent)
+            self.switched = True
         else:
             self.state.update(surface, keys, current, dt, scale, self.player)
 
         surface.blit(self.frame, (0, 0))
         self.cash_icon.draw(surface)
 
+    def idle_timeout(self):
+        # A new screen is only drawn on the update after switching to it
+        if self.switched:
+            return None
+        return self.state.idle_timeout()
+
 
 class ATMState(object):
     """Base class for different ATM screen states."""
@@ -91,6 +101,9 @@ class ATMState(object):
     def draw(self, surface):
         pass
 
+    def idle_timeout(self):
+        return WAIT_FOR_INPUT
+
 
 class MessageScreen(ATMState):
     """
@@ -230,6 +243,10 @@ class DepositScreen(ATMState):
         self.next = "MAINMENU"
         self.done = True
 
+    def idle_timeout(self):
+        # Keep the text box cursor blinking
+        return 200
+
     def get_event(self, event, scale):
         self.textbox.get_event(event, tools.scaled_mouse_pos(scale))
         self.buttons.get_event(event)
@@ -311,6 +328,10 @@ class WithdrawalScreen(ATMState):
         self.next = "MAINMENU"
         self.done = True
 
+    def idle_timeout(self):
+        # Keep the text box cursor blinking
+        return 200
+
     def get_event(self, event, scale):
         self.textbox.get_event(event, tools.scaled_mouse_pos(scale))
         self.buttons.get_event(event)
@@ -399,6 +420,10 @@ class AdvanceScreen(ATMState):
         self.next = "MAINMENU"
         self.done = True
 
+    def idle_timeout(self):
+        # Keep the text box cursor blinking
+        return 200
+
     def get_event(self, event, scale):
         self.textbox.get_event(event, tools.scaled_mouse_pos(scale))
         self.buttons.get_event(event)
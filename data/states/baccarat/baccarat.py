@@ -127,6 +127,7 @@ class Baccarat(TableGame):
         Also:
               forcibly clears card hands in case animations bugged out
               refills the house's chip rack
+              shuffles a new shoe once the cut card has come out
         """
 
         def force_empty():
@@ -145,6 +146,8 @@ class Baccarat(TableGame):
         self.house_chips.normalize()
         self.clear_table()
         self.delay(500, force_empty)
+        if self.shoe.cut_card_reached:
+            self.shoe.reshuffle()
 
     def goto_lobby(self, *args):
         if not self._allow_exit:
@@ -155,7 +158,7 @@ class Baccarat(TableGame):
             self.do_quit()
 
     def deal_cards(self):
-        self.stats['Hands Dealt'] += 1
+        self.casino_player.increase('Hands Dealt')
         self.delay(0, self.deal_card, (self.player_hand,))
         self.delay(700, self.deal_card, (self.player_hand,))
         self.delay(2000, self.deal_card, (self.dealer_hand,))
@@ -164,10 +167,10 @@ class Baccarat(TableGame):
 
     def count_naturals(self):
         if natural(self.player_hand):
-            self.stats['Player Naturals'] += 1
+            self.casino_player.increase('Player Naturals')
             self.delay(800, self.final_count_hands)
         elif natural(self.dealer_hand):
-            self.stats['Dealer Naturals'] += 1
+            self.casino_player.increase('Dealer Naturals')
             self.delay(800, self.final_count_hands)
         else:
             self.count_player_hand()
@@ -207,19 +210,19 @@ class Baccarat(TableGame):
         """Count the hands and process all bets on the table"""
         player_result = count_deck(self.player_hand)
         dealer_result = count_deck(self.dealer_hand)
-        stats = self.stats
+        stats = self.casino_player
 
         if player_result > dealer_result:
             winner = self.player_hand
-            stats['Player Wins'] += 1
+            stats.increase('Player Wins')
 
         elif player_result < dealer_result:
             winner = self.dealer_hand
-            stats['Dealer Wins'] += 1
+            stats.increase('Dealer Wins')
 
         else:
             winner = None
-            stats['Tie Result'] += 1
+            stats.increase('Tie Result')
 
         # process bets
         player_total = 0
@@ -297,7 +300,7 @@ class Baccarat(TableGame):
         player_natural = natural(self.player_hand)
         dealer_natural = natural(self.dealer_hand)
         is_player = bet.owner is self.player_chips
-        stats = self.stats
+        stats = self.casino_player
 
         winnings = bet.value
         if bet.result is winner:
@@ -321,16 +324,16 @@ class Baccarat(TableGame):
             if is_player:
                 pn_win = winner is self.player_hand and player_natural
                 bn_win = winner is self.dealer_hand and dealer_natural
-                record = stats['Largest Win']
-                stats['Largest Win'] = max(record, winnings)
-                stats['Earned'] += winnings
-                stats['Paid in Commission'] += fee
+                record = stats.get('Largest Win')
+                stats.set('Largest Win', max(record, winnings))
+                stats.increase('Earned', winnings)
+                stats.increase('Paid in Commission', fee)
                 if winner is None:
-                    stats['Bets Tied'] += 1
+                    stats.increase('Bets Tied')
                 else:
-                    stats['Bets Won'] += 1
+                    stats.increase('Bets Won')
                 if pn_win or bn_win:
-                    stats['Bets Won by Naturals'] += 1
+                    stats.increase('Bets Won by Naturals')
 
         else:
             self.house_chips.extend(bet.sprites())
@@ -339,12 +342,12 @@ class Baccarat(TableGame):
             if is_player:
                 pn_loss = bet.result is self.player_hand and dealer_natural
                 bn_loss = bet.result is self.dealer_hand and player_natural
-                record = stats['Largest Loss']
-                stats['Largest Loss'] = max(record, winnings)
-                stats['Bets Lost'] += 1
-                stats['Earned'] -= winnings
+                record = stats.get('Largest Loss')
+                stats.set('Largest Loss', max(record, winnings))
+                stats.increase('Bets Lost')
+                stats.decrease('Earned', winnings)
                 if pn_loss or bn_loss:
-                    stats['Bets Lost by Naturals'] += 1
+                    stats.increase('Bets Lost by Naturals')
 
             winnings = -winnings
 
@@ -417,7 +420,7 @@ class Baccarat(TableGame):
             self.deal_player_third_card()
 
         def f1(sprite):
-            self.stats['Declined Third Card'] += 1
+            self.casino_player.increase('Declined Third Card')
             b0.kill()
             b1.kill()
             self.count_dealer_hand()
@@ -3,10 +3,11 @@ from functools import partial
 from math import pi, cos
 
 import pygame
-from pygame.transform import smoothscale
 
 from .ui import Stacker, Sprite
 from data import prepare
+from data.components import card_images
+from data.components.shoe import Shoe, card_suit, card_value
 from data.components.animation import Animation
 
 __all__ = ('Card', 'Deck')
@@ -38,7 +39,6 @@ class Card(Sprite):
     """Enhanced components.cards.Card that is also pygame sprite
     """
 
-    face_cache = None
     card_suits = 'clubs', 'spades', 'hearts', 'diamonds'
     card_names = {
         1: "Ace",
@@ -60,8 +60,6 @@ class Card(Sprite):
         self.value = value
         self.suit = suit
         self.rect = pygame.Rect(rect)
-        if self.face_cache is None:
-            self.initialize_cache(self.rect.size)
         self._face_up = face_up
         self._rotation = 0 if self._face_up else 180
         self._needs_update = True
@@ -80,11 +78,8 @@ class Card(Sprite):
     def update_image(self):
         image = self.front_face if self._face_up else self.back_face
         if self._rotation:
-            width, height = image.get_size()
             value = 180 * cos(two_pi * self._rotation / 180.) + 180
-            width *= value / 360.0
-            width = int(round(max(1, abs(width)), 0))
-            image = smoothscale(image, (width, int(height)))
+            image = card_images.flip_frame(image, value / 360.0)
         rect = image.get_rect(center=self.rect.center)
         self._image = image
         self.rect.size = rect.size
@@ -93,47 +88,13 @@ class Card(Sprite):
 
     @classmethod
     def initialize_cache(cls, size):
-        cls.face_cache = dict()
-        for suit in cls.card_suits:
-            for value, name in cls.card_names.items():
-                Card(value, suit, ((0, 0), size))
+        card_images.prepare_deck(size)
 
     def get_front(self, name, size):
-        try:
-            return Card.face_cache[name]
-        except KeyError:
-            image = self.render_front(name, size)
-            Card.face_cache[size] = image
-            return image
+        return card_images.face(name, size)
 
     def get_back(self, size):
-        try:
-            return Card.face_cache["back"]
-        except KeyError:
-            image = self.render_back(size)
-            Card.face_cache["back"] = image
-            return image
-
-    @staticmethod
-    def render_front(name, size):
-        front = prepare.GFX[name.lower().replace(" ", "_")]
-        if not size == front.get_size():
-            front = smoothscale(front, size).convert_alpha()
-        return front
-
-    @staticmethod
-    def render_back(size):
-        snake = prepare.GFX["pysnakeicon"]
-        rect = pygame.Rect((0, 0), size)
-        back = pygame.Surface(size)
-        back.fill(pygame.Color("dodgerblue"))
-        s_rect = snake.get_rect().fit(rect)
-        s_rect.midbottom = rect.midbottom
-        snake = smoothscale(snake, s_rect.size)
-        back.blit(snake, s_rect)
-        pygame.draw.rect(back, pygame.Color("gray95"), rect, 4)
-        pygame.draw.rect(back, pygame.Color("gray20"), rect, 1)
-        return back
+        return card_images.back(size)
 
     @property
     def face_up(self):
@@ -187,10 +148,15 @@ class Deck(Stacker):
 
     If default_shuffle is True the deck will be
     shuffled upon creation.
+
+    A deck made with decks keeps them as numbers in a Shoe, and only
+    makes a Card for the top card, the one that is shown and dealt next.
+    The shoe is shuffled again by reshuffle once the cut card is reached,
+    penetration of the way through it.
     """
 
     def __init__(self, rect, card_size=prepare.CARD_SIZE, shuffle=True,
-                 decks=0, stacking=None):
+                 decks=0, stacking=None, penetration=.9, rng=None):
         rect = pygame.Rect(rect)
         if rect.size == (0, 0):
             rect = pygame.Rect(rect.topleft, card_size)
@@ -199,11 +165,57 @@ class Deck(Stacker):
         self.card_size = card_size
         self.shuffle = shuffle
         self.decks = decks
+        self.penetration = penetration
+        self.rng = rng
+        self.shoe = None
         self.add_decks(decks)
 
+    def __len__(self):
+        count = super(Deck, self).__len__()
+        if self.shoe is not None:
+            count += len(self.shoe)
+        return count
+
     def add_decks(self, decks):
-        cards = make_cards(decks, self.card_size, self.shuffle)
-        self.extend(cards)
+        if not decks:
+            return
+        if self.shoe is None:
+            self.shoe = Shoe(decks, self.rng, self.penetration, self.shuffle)
+        else:
+            self.shoe.decks += decks
+            self.shoe.reshuffle(self.shuffle)
+        self.show_top_card()
+
+    def show_top_card(self):
+        """Make a Card for the next card in the shoe if none is shown"""
+        if self.shoe is None or self.sprites():
+            return
+        code = self.shoe.deal()
+        if code is not None:
+            self.add(Card(card_value(code), card_suit(code), ((0, 0), self.card_size)))
+
+    def pop(self):
+        sprite = super(Deck, self).pop()
+        self.show_top_card()
+        return sprite
+
+    @property
+    def cut_card_reached(self):
+        return self.shoe is not None and self.shoe.cut_card_reached
+
+    def reshuffle(self):
+        """Put every card back in the shoe, shuffle and burn
+
+        As at the table, the first card is turned and as many cards as
+        it counts, with tens and pictures counting ten, are burnt.
+        """
+        for sprite in self.sprites():
+            sprite.kill()
+        self.shoe.reshuffle(self.shuffle)
+        code = self.shoe.deal()
+        self.shoe.discard(code)
+        self.shoe.burn(min(card_value(code), 10))
+        self.show_top_card()
 
     def draw_cards(self, cards=5):
         """Remove top cards and return them
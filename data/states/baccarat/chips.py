@@ -170,9 +170,6 @@ class ChipPile(Stacker):
         if value:
             self.add(*cash_to_chips(value))
 
-    def __del__(self):
-        B.unlinkEvent('DO_DROP_STACK', self.return_stack)
-
     def draw(self, surface):
         dirty0 = self._shadows.draw(surface)
         dirty1 = super(ChipPile, self).draw(surface)
@@ -69,7 +69,7 @@ def load_layout(state, filename):
         state.interested_events.append(
             ('CHIPS_VALUE_CHANGE', update_text))
 
-        text = TextSprite('', state.font)
+        text = BitmapTextSprite('', state.font)
         text.rect = get_rect(data)
         state.hud.add(text, layer=1)
 
@@ -10,7 +10,7 @@ from .ui import *
 from .chips import *
 from data import tools, prepare
 from data.components.advisor import Advisor
-from data.components.animation import Task, Animation
+from data.components.animation import Task, Animation, AnimationGroup
 from data.prepare import BROADCASTER as B
 
 __all__ = ('BettingArea', 'TableGame')
@@ -82,7 +82,7 @@ class TableGame(data.state.State):
         self.bets = MetaGroup()
         self.metagroup = MetaGroup()
         self.metagroup.add(self.bets)
-        self.animations = pg.sprite.Group()
+        self.animations = AnimationGroup()
 
         self._advisor = Advisor(self.hud, self.animations)
         self._advisor.queue_text('Welcome to Baccarat', 3000)
@@ -133,21 +133,12 @@ class TableGame(data.state.State):
         raise NotImplementedError
 
     def get_stats_from_casino_player(self):
-        """Get stats for game and set them.  Will set defaults if needed.
+        """Make this game the player's current game for stats
         """
-        self.stats = self.casino_player.stats.get(self.name, None)
-        if self.stats is None:
-            raise RuntimeError
-
-    def set_casino_player_states(self):
-        # to deal with the awkward new stats system
-        for key, value in self.stats.items():
-            print(key, value)
-            self.casino_player.set(key, value)
+        self.casino_player.current_game = self.name
 
     def cleanup(self):
         self.unlink_events()
-        self.set_casino_player_states()
         return super(TableGame, self).cleanup()
 
     def link_events(self):
@@ -469,8 +460,8 @@ class TableGame(data.state.State):
     def cash_in(self):
         """Change player's cash to chips
         """
-        chips = cash_to_chips(self.casino_player.stats['cash'])
-        self.casino_player.stats['cash'] = 0
+        chips = cash_to_chips(self.casino_player.cash)
+        self.casino_player.cash = 0
         self.player_chips.extend(chips)
 
     def cash_out(self):
@@ -482,7 +473,7 @@ class TableGame(data.state.State):
                 bet.kill_me = True
                 cash += bet.value
                 bet.empty()
-        self.casino_player.stats['cash'] = cash
+        self.casino_player.cash = cash
         self.player_chips.empty()
 
     def get_bet_totals(self):
@@ -508,8 +499,12 @@ class TableGame(data.state.State):
         """
         self._background = None
 
+    def time_to_next_update(self):
+        return self.animations.time_to_next()
+
     def update(self, surface, keys, current_time, dt, scale):
-        if self._background is None:
+        redraw = self._background is None
+        if redraw:
             image = self.render_background(surface.get_size())
             surface.blit(image, (0, 0))
             self._background = image
@@ -517,4 +512,5 @@ class TableGame(data.state.State):
         self.animations.update(dt)
         self.metagroup.update(dt)
         self.metagroup.clear(surface, self._background)
-        self.metagroup.draw(surface)
+        dirty = self.metagroup.draw(surface)
+        return None if redraw else dirty
@@ -21,6 +21,7 @@ from itertools import product, groupby
 import pygame
 
 from data import prepare
+from data.components import bitmap_font, text_cache
 from data.components.animation import *
 
 
@@ -33,6 +34,7 @@ __all__ = (
     'NeonButton',
     'TextSprite',
     'OutlineTextSprite',
+    'BitmapTextSprite',
     'remove_animations_of',
     'make_shadow_surface')
 
@@ -123,7 +125,7 @@ class SpriteGroup(pygame.sprite.LayeredUpdates):
         self._spritelist = []
         pygame.sprite.AbstractGroup.__init__(self)
         self._default_layer = kwargs.get('default_layer', 0)
-        self._animations = pygame.sprite.Group()
+        self._animations = AnimationGroup()
 
     def extend(self, sprites, **kwargs):
         """A a sequence of sprites to the SpriteGroup
@@ -473,18 +475,28 @@ class TextSprite(Sprite):
         if cache:
             self.update_image()
 
-    def draw(self, surface=None, rect=None):
+    def _cached(self, kind, make):
+        """Return a view of the surface made for this text, font and colors"""
+        key = (self._font, kind, self._text, text_cache.color_key(self._fg),
+               text_cache.color_key(self._bg), True)
+        return text_cache.view(text_cache.CACHE.fetch(key, make))
+
+    def render(self):
         if self._bg is None:
-            image = self._font.render(self._text, True, self._fg)
+            return self._font.render(self._text, True, self._fg)
         else:
-            image = self._font.render(self._text, True, self._fg, self._bg)
+            return self._font.render(self._text, True, self._fg, self._bg)
+
+    def draw(self, surface=None, rect=None):
+        image = self._cached(type(self).__name__, self.render)
         if surface is not None and rect is not None:
             surface.blit(image, rect)
         return image
 
     def update_image(self):
-        image = self.draw()
-        self.image = image.convert_alpha()
+        image = self._cached(type(self).__name__ + '.image',
+                             lambda: self.render().convert_alpha())
+        self.image = image
         self.rect = image.get_rect(topleft=self.rect.topleft)
         self.dirty = 1
 
@@ -498,8 +510,12 @@ class TextSprite(Sprite):
         self.update_image()
 
 
+class BitmapTextSprite(bitmap_font.BitmapTextMixin, TextSprite):
+    """TextSprite drawn from a glyph atlas, for text that changes often"""
+
+
 class OutlineTextSprite(TextSprite):
-    def draw(self, surface=None, rect=None):
+    def render(self):
         bg = self._bg
         if bg is None:
             bg = (0, 0, 0)
@@ -1,8 +1,10 @@
 """Events for the bingo game"""
 
-E_PLAYER_PICKED = 'player-picked'
-E_PLAYER_UNPICKED = 'player-unpicked'
-E_NUM_CARDS_CHANGED = 'number-of-cards-changed'
-E_SPEND_MONEY = 'spend-money'
-E_CARD_COMPLETE = 'card-complete'
-E_BONUS_REACHED = 'bonus-reached'
\ No newline at end of file
+from data.events import event_id
+
+E_PLAYER_PICKED = event_id('player-picked')
+E_PLAYER_UNPICKED = event_id('player-unpicked')
+E_NUM_CARDS_CHANGED = event_id('number-of-cards-changed')
+E_SPEND_MONEY = event_id('spend-money')
+E_CARD_COMPLETE = event_id('card-complete')
+E_BONUS_REACHED = event_id('bonus-reached')
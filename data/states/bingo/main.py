@@ -29,6 +29,7 @@ class Bingo(statemachine.StateMachine):
     """State to represent a bing game"""
     name = "bingo"
     show_in_lobby = True
+    reusable = True
 
     def __init__(self):
         """Initialise the bingo game"""
@@ -94,6 +95,15 @@ class Bingo(statemachine.StateMachine):
                              ("_last squares", [])])
         return stats
 
+    def reset(self):
+        """Start a new game on a pooled instance"""
+        super(Bingo, self).reset()
+        self.ball_machine.reset_machine(self.ball_machine.interval)
+        self.cards.reset()
+        self.dealer_cards.reset()
+        self.current_pick_sound = 0
+        self.last_pick_time = 0
+
     def startup(self, current_time, persistent):
         """This method will be called each time the state resumes."""
         self.persist = persistent
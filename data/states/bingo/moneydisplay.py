@@ -1,6 +1,6 @@
 """Classes to display the total amount of money that the player has"""
 
-from data.components import common, loggable
+from data.components import common, labels, loggable
 from .settings import SETTINGS as S
 
 
@@ -57,7 +57,7 @@ class MoneyDigit(common.DrawableGroup, loggable.Loggable):
             'digit-background', position, 'bingo-money-display',
         )
         self.text = common.getLabel(
-            'money-digit', position, value, S
+            'money-digit', position, value, S, labels.BitmapLabel
         )
         #
         self.append(self.background)
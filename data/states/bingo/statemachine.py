@@ -31,6 +31,9 @@ A - "yield": stops execution and returns to the same point next frame
 
 B - "yield <N>: stops execution and returns to the same point <N> ms later
 
+The generators are run by a data.components.coroutines.CoroutineScheduler, which
+only resumes the ones that are due each frame.
+
 
 For an example of usage, let's say the player does something and you want to
 move a card across the screen, flash it three times, then move it down the screen.
@@ -114,72 +117,13 @@ setting a property "card_selected" on the state.
 
 """
 
-import pygame
-
 from data.components import loggable
+from data.components.coroutines import Coroutine, CoroutineScheduler, NotFound
 import data.state
 
 
-class NotFound(Exception):
-    """Generator was not found"""
-
-
-class StateExecutor(loggable.Loggable):
-    """Executes a generator through a sequence with delays"""
-
-    def __init__(self, name, generator, delay=0):
-        """Initialise the executor"""
-        self.addLogger()
-        self.name = name
-        self.generator = generator
-        self.last_delay = self.delay = delay
-        self.done = False
-        self.verbose = False
-        self.paused = False
-        #
-        self.state_clock = pygame.time.Clock()
-
-    def update(self, dt):
-        """Update the state"""
-        self.state_clock.tick(dt)
-        if not self.paused:
-            self.delay -= self.state_clock.get_time()
-            if not self.done and self.delay < 0:
-                if self.verbose:
-                    self.log.debug('{0} {1} doing action'.format(self.name, id(self)))
-                try:
-                    self.last_delay = self.delay = next(self.generator)
-                except StopIteration:
-                    self.done = True
-
-    def next_step(self):
-        """Immediately make the generator go to the next step"""
-        self.delay = 0
-
-    def update_interval(self, interval):
-        """Update the interval we are waiting for
-
-        This behaves as though the last delay requested is
-        immediately changed to the specified value.
-
-        If we have already waited for the specified time
-        then immediately go to the next step
-
-        """
-        time_elapsed = self.last_delay - self.delay
-        time_to_go = interval - time_elapsed
-        self.delay = time_to_go
-
-    def stop(self):
-        """Stop this executor"""
-        self.done = True
-
-    def get_fraction_to_go(self):
-        """Return the fraction of our time to go"""
-        if self.last_delay == 0:
-            return 1
-        else:
-            return max(0, min(1, self.delay / self.last_delay))
+# The executors are now Coroutines, see data.components.coroutines
+StateExecutor = Coroutine
 
 
 class StateMachine(data.state.State, loggable.Loggable):
@@ -192,9 +136,7 @@ class StateMachine(data.state.State, loggable.Loggable):
         super(StateMachine, self).__init__()
         #
         self.addLogger()
-        self.generators = []
-        self.state_clock = pygame.time.Clock()
-        self.delay = 0.0
+        self.coroutines = CoroutineScheduler()
         self.verbose = True
         #
         self.initUI()
@@ -208,34 +150,28 @@ class StateMachine(data.state.State, loggable.Loggable):
         """Draw the user interface"""
         raise NotImplementedError('Need to implement drawUI')
 
+    def reset(self):
+        """Stop the generators left from the last time the state was used"""
+        super(StateMachine, self).reset()
+        self.coroutines.clear()
+
     def update(self, surface, keys, now, dt, scale):
         """Update the game state"""
         self.dt = dt
-        self.state_clock.tick(dt)
-        self.delay -= self.state_clock.get_time()
         #
-        # Process all states
-        for executor in list(self.generators):
-            executor.update(dt)
-            if executor.done:
-                self.generators.remove(executor)
+        # Process the states that are due
+        self.coroutines.update(dt)
         #
         # Draw the interface
         self.drawUI(surface, scale)
 
     def add_generator(self, name, generator):
         """Add a new generator to run"""
-        new_generator = StateExecutor(name, generator)
+        new_generator = self.coroutines.add(name, generator)
         self.log.debug('Adding new executor {0}, {1}'.format(name, id(new_generator)))
-        self.generators.append(new_generator)
         return new_generator
 
     def stop_generator(self, name):
         """Stop a generator with a specific name"""
-        for generator in self.generators[:]:
-            if generator.name == name:
-                self.generators.remove(generator)
-                self.log.debug('Removing executor {0}, {1}'.format(name, id(generator)))
-                break
-        else:
-            raise NotFound('A generator named {0} was not found'.format(name))
+        generator = self.coroutines.stop(name)
+        self.log.debug('Removing executor {0}, {1}'.format(name, id(generator)))
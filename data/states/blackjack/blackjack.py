@@ -80,10 +80,9 @@ class Blackjack(data.state.State):
             self.state.done = False
             self.state = self.states[self.state_name]
             if self.state_name == "Betting":
-                chips = self.game.player.chip_pile.all_chips()
                 chip_pile = self.game.player.chip_pile
                 quick_bet = self.game.quick_bet
-                self.new_game(0, chips, chip_pile)
+                self.new_game(0, chip_pile=chip_pile)
                 self.game.quick_bet = quick_bet
             self.state.startup(self.game)
         self.state.update(surface, keys, current_time, dt, scale)
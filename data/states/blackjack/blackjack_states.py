@@ -6,7 +6,7 @@ from data import tools, prepare
 from data.components.labels import NeonButton, ButtonGroup
 from data.components.labels import Label, Blinker
 from data.components.angles import get_distance
-from data.components.animation import Animation, Task
+from data.components.animation import Animation, AnimationGroup, Task
 from data.components.chips import BetPile, cash_to_chips
 from data.components.warning_window import WarningWindow
 from .blackjack_hand import Hand
@@ -19,7 +19,7 @@ class BlackjackState(object):
         self.done = False
         self.quit = False
         self.next = None
-        self.animations = pg.sprite.Group()
+        self.animations = AnimationGroup()
         self.window = None
 
     def leave_state(self):
@@ -201,7 +201,7 @@ class Dealing(BlackjackState):
 
     def make_card_animations(self):
         g = self.game
-        self.animations = pg.sprite.Group()
+        self.animations = AnimationGroup()
         deal_delay = 0
         for i in range(2):
             card = g.deck.draw_card()
@@ -386,7 +386,7 @@ class PlayerTurn(BlackjackState):
 
     def startup(self, game):
         self.game = game
-        self.animations = pg.sprite.Group()
+        self.animations = AnimationGroup()
 
     def get_event(self, event, scale):
         now = pg.time.get_ticks()
@@ -12,6 +12,7 @@ import data.state
 class Craps(data.state.State):
     show_in_lobby = True
     name = 'craps'
+    reusable = True
 
     def __init__(self):
         super(Craps, self).__init__()
@@ -110,6 +111,12 @@ class Craps(data.state.State):
         self.table = pg.transform.scale(self.table_orig, (self.table_x, self.table_y))
         self.table_rect = self.table.get_rect()
 
+    def reset(self):
+        super(Craps, self).reset()
+        self.point = 0
+        self.dice_total = 0
+        self.update_total_label()
+
     def startup(self, current_time, persistent):
         self.persist = persistent
         #This is the object that represents the user.
@@ -131,7 +138,7 @@ class Craps(data.state.State):
             widget.get_event(event, tools.scaled_mouse_pos(scale))
 
     def cash_out_player(self):
-        self.casino_player.stats["cash"] = self.player.get_chip_total()
+        self.casino_player.cash = self.player.get_chip_total()
 
     def update_total_label(self):
         self.dice_total_label = Label(self.font, self.font_size, str(self.dice_total), "gold3", {"center": (1165, 245)})
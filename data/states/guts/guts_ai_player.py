@@ -102,8 +102,7 @@ class AIPlayer(object):
         for card in self.cards:
             center = card.rect.center
             card.face_up = False
-            card.image = pg.transform.rotate(card.image, -90)
-            card.back_image = pg.transform.rotate(card.back_image, -90)
+            card.rotate(-90)
             card.rect = card.image.get_rect(center=center)
         self.cards[1].rect = self.cards[0].rect
 
@@ -158,11 +157,9 @@ class AIPlayer(object):
             center = card.rect.center
             if self.orientation == "left":
                 card.rect = pg.Rect(0,0,card.rect.height, card.rect.width)
-                card.image = pg.transform.rotate(card.image, -90)
-                card.back_image = pg.transform.rotate(card.back_image, -90)
+                card.rotate(-90)
             elif self.orientation == "right":
                 card.rect = pg.Rect(0,0,card.rect.height, card.rect.width)
-                card.image = pg.transform.rotate(card.image, 90)
-                card.back_image = pg.transform.rotate(card.back_image, 90)
+                card.rotate(90)
             card.rect.center = center
 
@@ -68,8 +68,7 @@ class GutsPlayer(object):
         for card in self.cards:
             center = card.rect.center
             card.face_up = False
-            card.image = pg.transform.rotate(card.image, -90)
-            card.back_image = pg.transform.rotate(card.back_image, -90)
+            card.rotate(-90)
             card.rect = card.image.get_rect(center=center)
         self.cards[1].rect = self.cards[0].rect
 
@@ -5,7 +5,7 @@ import pygame as pg
 from data import prepare, tools
 from data.components.labels import Label, NeonButton, ButtonGroup, MoneyIcon, Button, Blinker
 from data.components.labels import MultiLineLabel
-from data.components.animation import Animation, Task
+from data.components.animation import Animation, AnimationGroup, Task
 from data.components.advisor import Advisor
 from data.components.warning_window import WarningWindow, NoticeWindow
 
@@ -18,7 +18,7 @@ class GutsState(object):
     screen_rect = pg.Rect((0,0), prepare.RENDER_SIZE)
     money_icon = MoneyIcon((0, screen_rect.bottom - 75))
     draw_group = pg.sprite.Group()
-    move_animations = pg.sprite.Group()
+    move_animations = AnimationGroup()
     advisor = Advisor(draw_group, move_animations)
     advisor.active = True
     advisor_back = prepare.GFX["advisor_back"]
@@ -37,7 +37,7 @@ class GutsState(object):
         pos = (self.screen_rect.right-(NeonButton.width+10),
                self.screen_rect.bottom-(NeonButton.height+10))
         lobby_button = NeonButton(pos, "Lobby", self.back_to_lobby, None, self.buttons, bindings=[pg.K_ESCAPE])
-        self.animations = pg.sprite.Group()
+        self.animations = AnimationGroup()
 
     def warn(self, *args):
         warning = "Exiting the game will abandon the current pot!"
@@ -120,7 +120,7 @@ class Tutorial(GutsState):
 
 
     def make_labels(self):
-        self.animations = pg.sprite.Group()
+        self.animations = AnimationGroup()
         rules = [
                 "Players place their ante in the pot",
                 "Two cards are dealt to each player",
@@ -293,7 +293,7 @@ class Betting(GutsState):
         self.labels = []
         self.alpha = 255
         self.big_alpha = 255
-        self.animations = pg.sprite.Group()
+        self.animations = AnimationGroup()
         text = "Free Ride" if self.game.free_ride else "Ante Up"
         self.big_label = Label(self.font, 320, text, "gold3",
                            {"center": sr.center}, bg=prepare.FELT_GREEN)
@@ -388,7 +388,7 @@ class Dealing(GutsState):
             self.buttons.get_event(event)
 
     def make_dealing_animations(self):
-        self.animations = pg.sprite.Group()
+        self.animations = AnimationGroup()
         delay_time = 100
         for player in self.game.deal_queue:
             toggle = 0
@@ -441,7 +441,7 @@ class PlayerTurn(GutsState):
         self.game = game
         self.current_player = self.game.deal_queue[self.game.current_player_index]
         self.player_buttons = ButtonGroup()
-        self.animations = pg.sprite.Group()
+        self.animations = AnimationGroup()
         self.timer  = 0
         self.time_limit = 600
 
@@ -625,7 +625,7 @@ class ShowResults(GutsState):
         self.labels = []
         self.blinkers = []
         self.calculated = False
-        self.animations = pg.sprite.Group()
+        self.animations = AnimationGroup()
 
         stayers = [x for x in self.game.players if x.stayed]
         winners = self.game.get_winners()
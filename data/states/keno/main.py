@@ -1,4 +1,3 @@
-import os
 from collections import OrderedDict
 
 import pygame as pg
@@ -6,7 +5,7 @@ import pygame as pg
 from data import tools, prepare
 from data.components.loggable import getLogger
 from data.components.warning_window import NoticeWindow
-from data.components.labels import Label, ButtonGroup, NeonButton
+from data.components.labels import Label, BitmapLabel, ButtonGroup, NeonButton
 import data.state
 from .keno_card import KenoCard
 from .pay_table import PayTable
@@ -27,6 +26,7 @@ class Keno(data.state.State):
     """Class to represent a casino game."""
     show_in_lobby = True
     name = 'keno'
+    reusable = True
 
     def __init__(self):
         super(Keno, self).__init__()
@@ -47,8 +47,7 @@ class Keno(data.state.State):
         self.turns = 16
         self.play_max_active = False
 
-        ball_path = os.path.join('resources', 'keno', 'balls', '64x64', 'sheet.png')
-        ball_sheet = pg.image.load(ball_path).convert_alpha()
+        ball_sheet = prepare.GFX['keno_balls']
         self.balls = tools.strip_from_sheet(ball_sheet, (0,0), (64,64), 10, 8)
 
         self.keno_card = KenoCard(self.balls)
@@ -101,12 +100,16 @@ class Keno(data.state.State):
             'play_max'      : self.playing_max,
             'pay_table'     : self.pay_table,
             'round_history' : self.round_history,
-            'balance'       : None,
+            'balance'       : BitmapLabel(self.font, 48, '', "gold3",
+                                          {"topleft": (24, 760)}),
             'bet_action'    : None,
             'clear'         : None,
-            'bet'           : None,
-            'won'           : None,
-            'spot'          : None,
+            'bet'           : BitmapLabel(self.font, 48, '', "gold3",
+                                          {"topleft": (24, 760+48)}),
+            'won'           : BitmapLabel(self.font, 48, '', "gold3",
+                                          {"topleft": (24, 760+48+48)}),
+            'spot'          : BitmapLabel(self.font, 48, '', "gold3",
+                                          {"topleft": (1036, 760)}),
         }
 
     @staticmethod
@@ -247,6 +250,19 @@ class Keno(data.state.State):
         self.done = True
         self.next = "lobby"
 
+    def reset(self):
+        """Clear the card and history so a pooled Keno starts afresh."""
+        super(Keno, self).reset()
+        self.game_started = False
+        self.turns = 16
+        self.play_max_active = False
+        self.keno_card.reset()
+        self.keno_card.current_pick = []
+        self.prev_spot_count = 0
+        self.pay_table.update(0)
+        self.round_history.clear()
+        self.alert = None
+
     def startup(self, current_time, persistent):
         """This method will be called each time the state resumes."""
         self.persist = persistent
@@ -324,22 +340,17 @@ class Keno(data.state.State):
             self.play_game()
 
         total_text = "Balance:  ${}".format(self.wallet.balance)
-
-        self.gui_widgets['balance'] = Label(self.font, 48, total_text, "gold3",
-                               {"topleft": (24, 760)})
+        self.gui_widgets['balance'].set_text(total_text)
 
         bet_text = "Bet: ${}".format(self.pot._balance)
-        self.gui_widgets['bet'] = Label(self.font, 48, bet_text, "gold3",
-                               {"topleft": (24, 760+48)})
+        self.gui_widgets['bet'].set_text(bet_text)
 
         won_text = "Won: ${}".format(self.pot.won)
-        self.gui_widgets['won'] = Label(self.font, 48, won_text, "gold3",
-                               {"topleft": (24, 760+48+48)})
+        self.gui_widgets['won'].set_text(won_text)
 
         spot_count = self.keno_card.spot_count
         spot_text = "Spot: {}".format(spot_count)
-        self.gui_widgets['spot'] = Label(self.font, 48, spot_text, "gold3",
-                               {"topleft": (1036, 760)})
+        self.gui_widgets['spot'].set_text(spot_text)
 
         mouse_pos = tools.scaled_mouse_pos(scale)
         self.buttons.update(mouse_pos)
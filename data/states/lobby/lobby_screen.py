@@ -1,6 +1,4 @@
-import os
 import math
-import json
 from collections import OrderedDict
 
 import pygame as pg
@@ -9,7 +7,7 @@ from data import tools, prepare
 from data.components.labels import GameButton, NeonButton
 from data.components.labels import Button, ButtonGroup
 from data.components.flair_pieces import ChipCurtain
-from data.components.animation import Animation
+from data.components.animation import Animation, AnimationGroup
 import data.state
 
 CURTAIN_SETTINGS = {"single_color" : True,
@@ -33,7 +31,7 @@ class LobbyScreen(data.state.State):
         super(LobbyScreen, self).__init__()
         self.game = None
         self.chip_curtain = None  # Created on startup
-        self.animations = pg.sprite.Group()
+        self.animations = AnimationGroup()
 
     def collect_game_scenes(self):
         all_scenes = self.controller.query_all_states()
@@ -53,6 +51,8 @@ class LobbyScreen(data.state.State):
         self.buttons = ButtonGroup(nav_buttons, main_buttons)
 
     def make_game_pages(self, games, screen_rect, per):
+        icons = {name: getattr(scene, "icon", "image.png")
+                 for name, scene in games.items()}
         games = list(games.keys())
         groups = (games[i:i+per] for i in range(0,len(games),per))
         columns = 3
@@ -67,7 +67,8 @@ class LobbyScreen(data.state.State):
             for i,game in enumerate(group):
                 y,x = divmod(i, columns)
                 pos = (start_x+step_x*x+offset, start_y+step_y*y)
-                GameButton(pos, game, self.change_state, buttons)
+                GameButton(pos, game, self.change_state, buttons,
+                           icon=icons[game], hover_call=self.warm_game)
         return buttons
 
     def make_navigation_buttons(self, screen_rect):
@@ -128,10 +129,17 @@ class LobbyScreen(data.state.State):
         self.chip_curtain = ChipCurtain(None, **CURTAIN_SETTINGS)
         games = self.collect_game_scenes()
         self.update_screen_buttons(games)
+        for game in games:
+            self.controller.warm_state_assets(game)
+        self.controller.prefetch_states()
+        if self.controller.autosave is not None:
+            self.controller.autosave.compact()
+
+    def warm_game(self, game):
+        self.controller.warm_state_assets(game, urgent=True)
 
     def exit_game(self, *args):
-        with open(os.path.join("resources", "save_game.json"), "w") as f:
-            json.dump(self.persist["casino_player"].stats, f)
+        self.controller.save_stats(self.persist["casino_player"])
         self.done = True
         self.quit = True
 
@@ -5,7 +5,7 @@ import pygame as pg
 from data import tools, prepare
 from data.prepare import BROADCASTER as B
 import data.state
-from .playfield import Playfield
+from .playfield import Playfield, E_JACKPOT, E_GUTTER, E_TRAY
 from .ui import *
 
 __all__ = ['Pachinko']
@@ -18,6 +18,11 @@ class Pachinko(data.state.State):
     show_in_lobby = True
     name = 'pachinko'
 
+    # one physics step every 1/600 s keeps the speed the game was tuned at:
+    # ten steps of Playfield.step_amount per frame at 60 fps
+    fixed_timestep = 1000 / 600.
+    max_fixed_steps = 30
+
     # hack related to game states that do not finish
     did_startup = False
 
@@ -32,9 +37,9 @@ class Pachinko(data.state.State):
         self._power = .5
         self._should_autoplay = False
 
-        B.linkEvent('pachinko_jackpot', self.on_jackpot)
-        B.linkEvent('pachinko_gutter', self.on_gutter)
-        B.linkEvent('pachinko_tray', self.on_tray)
+        B.linkEvent(E_JACKPOT, self.on_jackpot)
+        B.linkEvent(E_GUTTER, self.on_gutter)
+        B.linkEvent(E_TRAY, self.on_tray)
 
         # hack related to game states that do not finish
         try:
@@ -60,7 +65,7 @@ class Pachinko(data.state.State):
         self.hud = pg.sprite.RenderUpdates()
 
         font = pg.font.Font(prepare.FONTS["Saniretro"], font_size)
-        self.tray_count = TextSprite('', font)
+        self.tray_count = BitmapTextSprite('', font)
         self.tray_count.rect.topleft = 960, 100
         self.hud.add(self.tray_count)
         self.on_tray()
@@ -95,16 +100,7 @@ class Pachinko(data.state.State):
         b = NeonButton('lobby', (1000, 920, 0, 0), self.goto_lobby)
         self.hud.add(b)
 
-        if 'Pachinko' not in self.casino_player.stats:
-            self.casino_player.stats['Pachinko'] = OrderedDict([
-                ('games played', 0),
-                ('total winnings', 0),
-                ('earned', 0),
-                ('jackpots', 0),
-                ('gutters', 0),
-            ])
-
-        self.casino_player.stats['Pachinko']['games played'] += 1
+        self.casino_player.increase('games played')
 
     @staticmethod
     def initialize_stats():
@@ -126,10 +122,10 @@ class Pachinko(data.state.State):
         self.next = 'lobby'
 
     def on_jackpot(self, *args):
-        self.casino_player.stats["Pachinko"]["jackpots"] += 1
+        self.casino_player.increase('jackpots')
 
     def on_gutter(self, *args):
-        self.casino_player.stats["Pachinko"]["gutters"] += 1
+        self.casino_player.increase('gutters')
 
     def on_tray(self, *args):
         self.tray_count.text = '{} balls in play'.format(
@@ -137,8 +133,8 @@ class Pachinko(data.state.State):
 
     def fill_tray(self):
         cost = 25
-        if self.casino_player.stats['cash'] >= cost:
-            self.casino_player.stats['cash'] -= cost
+        if self.casino_player.cash >= cost:
+            self.casino_player.cash -= cost
             self.playfield.ball_tray += cost
             self.on_tray()
 
@@ -150,12 +146,12 @@ class Pachinko(data.state.State):
     def cash_out(self):
         winnings = self.playfield.ball_tray
         self.playfield.ball_tray = 0
-        self.casino_player.stats['cash'] += winnings
+        self.casino_player.cash += winnings
 
     def cleanup(self):
-        B.unlinkEvent('pachinko_jackpot', self.on_jackpot)
-        B.unlinkEvent('pachinko_gutter', self.on_gutter)
-        B.unlinkEvent('pachinko_tray', self.on_tray)
+        B.unlinkEvent(E_JACKPOT, self.on_jackpot)
+        B.unlinkEvent(E_GUTTER, self.on_gutter)
+        B.unlinkEvent(E_TRAY, self.on_tray)
         return self.persist
 
     def get_event(self, event, scale=(1, 1)):
@@ -209,14 +205,21 @@ class Pachinko(data.state.State):
                     sprite.on_mouse_click(pos)
                 self._clicked_sprite = None
 
+    def fixed_update(self, keys, now, step):
+        self.playfield.step()
+
     def update(self, surface, keys, current_time, dt, scale):
-        if self._needs_clear:
+        redraw = self._needs_clear
+        if redraw:
             surface.fill(prepare.BACKGROUND_BASE)
             self._needs_clear = False
 
-        self.playfield.update(surface, dt)
+        dirty = self.playfield.update(surface, dt)
         self.hud.clear(surface, self._clear_surface)
-        self.hud.draw(surface)
+        hud_dirty = self.hud.draw(surface)
+        if redraw or dirty is None:
+            return None
+        return dirty + hud_dirty
 
     @staticmethod
     def _clear_surface(surface, rect):
@@ -19,6 +19,8 @@ from pygame.transform import rotozoom, smoothscale
 from .rect import *
 from data import prepare
 from data.prepare import BROADCASTER as B
+from data.events import event_id
+from data.components.animation import Task, TaskGroup
 
 __all__ = ['Playfield']
 
@@ -37,11 +39,10 @@ pocket_win_type = 104
 pocket_fail_type = 105
 pocket_return_type = 106
 
-
-def get_timers(group, callback):
-    for sprite in group.sprites():
-        if sprite.callback == callback:
-            yield sprite
+# Posted from collision handlers, so listeners run after the physics step
+E_JACKPOT = event_id('pachinko_jackpot')
+E_GUTTER = event_id('pachinko_gutter')
+E_TRAY = event_id('pachinko_tray')
 
 
 def rect_to_poly(rect):
@@ -119,30 +120,6 @@ def load_json(space, filename):
                 yield i
 
 
-class Task(pygame.sprite.Sprite):
-    def __init__(self, callback, interval=0, loops=1, args=None, kwargs=None):
-        assert (callable(callback))
-        assert (loops >= -1)
-        super(Task, self).__init__()
-        self.interval = interval
-        self.loops = loops
-        self.callback = callback
-        self._timer = 0
-        self._args = args if args else list()
-        self._kwargs = kwargs if kwargs else dict()
-        self._loops = loops
-
-    def update(self, delta):
-        self._timer += delta
-        if self._timer >= self.interval:
-            self._timer -= self.interval
-            self.callback(*self._args, **self._kwargs)
-            if not self._loops == -1:
-                self._loops -= 1
-                if self._loops <= 0:
-                    self.kill()
-
-
 class PhysicsSprite(pygame.sprite.DirtySprite):
     def __init__(self):
         super(PhysicsSprite, self).__init__()
@@ -354,8 +331,7 @@ class Playfield(pygame.sprite.LayeredDirty):
         self.ball_tray = 0
         self.background = None
         self.step_amount = 1 / 30. / 10
-        self.step_times = 10
-        self.timers = pygame.sprite.Group()
+        self.timers = TaskGroup()
 
         for item in load_json(self._space, 'default.json'):
             self.add(item)
@@ -367,21 +343,21 @@ class Playfield(pygame.sprite.LayeredDirty):
             ball, pocket = arbiter.shapes
             ball.needs_remove = True
             self.ball_tray += self.jackpot_amount + 1
-            B.processEvent(('pachinko_jackpot', self))
-            B.processEvent(('pachinko_tray', self))
+            B.post((E_JACKPOT, self))
+            B.post((E_TRAY, self))
             return True
 
         def on_ball_return(space, arbiter):
             ball, pocket = arbiter.shapes
             ball.needs_remove = True
             self.ball_tray += 1
-            B.processEvent(('pachinko_tray', self))
+            B.post((E_TRAY, self))
             return True
 
         def on_ball_fail(space, arbiter):
             ball, pocket = arbiter.shapes
             ball.needs_remove = True
-            B.processEvent(('pachinko_gutter', self))
+            B.post((E_GUTTER, self))
             return True
 
         f = self._space.add_collision_handler
@@ -400,7 +376,7 @@ class Playfield(pygame.sprite.LayeredDirty):
         if not self._plunger.chute_counter and self.ball_tray:
             self.add(Ball(space, self._plunger.ball_chute))
             self.ball_tray -= 1
-            B.processEvent(('pachinko_tray', self))
+            B.post((E_TRAY, self))
 
     def add(self, *items):
         for item in items:
@@ -430,23 +406,23 @@ class Playfield(pygame.sprite.LayeredDirty):
         d = self._plunger.get_plunger_distance()
         self.handle.shape.body.angle = (d / self._plunger.spring_length) * 3
 
-        step = self._space.step
-        dt = self.step_amount
-        for i in xrange(self.step_times):
-            step(dt)
-
-        if self.background is None:
+        redraw = self.background is None
+        if redraw:
             self.background = pygame.Surface(surface.get_size())
             self.background.fill(prepare.BACKGROUND_BASE)
-            image = pygame.image.load(
-                os.path.join('resources', 'pachinko', 'playfield.jpg'))
+            image = prepare.GFX['pachinko_playfield'].copy()
             image.scroll(0, -150)
             self.background.blit(image, (0, 0))
             surface.blit(self.background, (0, 0))
 
         super(Playfield, self).update(dt)
         self.clear(surface, self.background)
-        self.draw(surface)
+        dirty = self.draw(surface)
+        return None if redraw else dirty
+
+    def step(self):
+        """Advance the physics simulation by one step_amount."""
+        self._space.step(self.step_amount)
 
     def depress_plunger(self):
         self._plunger.spring.damping = 100
@@ -469,14 +445,10 @@ class Playfield(pygame.sprite.LayeredDirty):
 
     @property
     def auto_play(self):
-        return bool([get_timers(self.timers, self.auto_push_plunger)])
+        return bool(self.timers.scheduler.tasks_for(self.auto_push_plunger))
 
     @auto_play.setter
     def auto_play(self, value):
+        self.timers.cancel(self.auto_push_plunger)
         if bool(value):
-            for sprite in get_timers(self.timers, self.auto_push_plunger):
-                sprite.kill()
             self.timers.add(Task(self.auto_push_plunger, 500, -1))
-        else:
-            for sprite in get_timers(self.timers, self.auto_push_plunger):
-                sprite.kill()
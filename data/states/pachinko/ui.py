@@ -1,8 +1,9 @@
 import pygame
 
 from data import prepare
+from data.components import bitmap_font
 
-__all__ = ['TextSprite', 'Button', 'NeonButton']
+__all__ = ['TextSprite', 'BitmapTextSprite', 'Button', 'NeonButton']
 
 
 class TextSprite(pygame.sprite.DirtySprite):
@@ -43,6 +44,10 @@ class TextSprite(pygame.sprite.DirtySprite):
         self.update_image()
 
 
+class BitmapTextSprite(bitmap_font.BitmapTextMixin, TextSprite):
+    """TextSprite drawn from a glyph atlas, for text that changes often"""
+
+
 class EventButton(pygame.sprite.DirtySprite):
     def __init__(self, callback, args=None, kwargs=None):
         super(EventButton, self).__init__()
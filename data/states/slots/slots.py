@@ -66,7 +66,7 @@ class Slots(data.state.State):
         self.buttons.get_event(event)
 
     def cash_out_player(self):
-        self.casino_player.stats["cash"] = self.player.get_chip_total()
+        self.casino_player.cash = self.player.get_chip_total()
 
     def draw(self, surface):
         surface.fill(prepare.FELT_GREEN)
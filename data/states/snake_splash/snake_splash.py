@@ -15,7 +15,11 @@ class SnakeSplash(data.state.State):
         self.screen_rect = pg.Rect((0, 0), prepare.RENDER_SIZE)
         self.image = prepare.GFX["snakesign"]
         self.on = False
-        self.duration = 3000
+        self.min_duration = 1000
+        self.max_duration = 10000
+        self.elapsed = 0.0
+        self.progress = 0.0
+        self.bar_rect = pg.Rect(450, 1000, 500, 16)
         self.use_music_handler = False
 
     def startup(self, current_time, persistent):
@@ -38,6 +42,15 @@ class SnakeSplash(data.state.State):
         surface.fill(prepare.BACKGROUND_BASE)
         if self.on:
             surface.blit(self.image, (175, 0))
+        self.draw_progress(surface)
+
+    def draw_progress(self, surface):
+        """Draw a bar showing how much of the first loading is done."""
+        fill = self.bar_rect.inflate(-4, -4)
+        fill.w = int(fill.w*self.progress)
+        surface.fill(pg.Color("gold3"), self.bar_rect)
+        surface.fill(prepare.BACKGROUND_BASE, self.bar_rect.inflate(-2, -2))
+        surface.fill(pg.Color("gold3"), fill)
 
     def update(self, surface, keys, current_time, dt, scale):
         """
@@ -48,8 +61,12 @@ class SnakeSplash(data.state.State):
         since pygame was initialized. dt is the number of milliseconds since
         the last frame.
         """
-        self.duration -= dt
-        if self.duration <= 0:
+        loader = self.controller.loader
+        self.progress = loader.progress("first") if loader else 1.0
+        self.elapsed += dt
+        if self.elapsed >= self.min_duration and self.progress >= 1.0:
+            self.done = True
+        elif self.elapsed >= self.max_duration:
             self.done = True
         if randint(0, 100) < 20:
             self.on = not self.on
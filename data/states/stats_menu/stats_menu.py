@@ -3,6 +3,7 @@ import pygame as pg
 from data import tools, prepare
 from data.components.labels import Label, NeonButton, ButtonGroup
 import data.state
+from data.state import WAIT_FOR_INPUT
 
 
 class StatsMenu(data.state.State):
@@ -106,3 +107,6 @@ class StatsMenu(data.state.State):
         mouse_pos = tools.scaled_mouse_pos(scale)
         self.buttons.update(mouse_pos)
         self.draw(surface)
+
+    def idle_timeout(self):
+        return WAIT_FOR_INPUT
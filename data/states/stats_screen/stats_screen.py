@@ -3,6 +3,7 @@ import pygame as pg
 from data import tools, prepare
 from data.components.labels import GroupLabel, NeonButton, ButtonGroup
 import data.state
+from data.state import WAIT_FOR_INPUT
 
 
 class StatsScreen(data.state.State):
@@ -70,3 +71,6 @@ class StatsScreen(data.state.State):
         mouse_pos = tools.scaled_mouse_pos(scale)
         self.buttons.update(mouse_pos)
         self.draw(surface)
+
+    def idle_timeout(self):
+        return WAIT_FOR_INPUT
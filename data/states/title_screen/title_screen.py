@@ -84,6 +84,7 @@ class TitleScreen(data.state.State):
     def load_or_new(self, try_to_load_data):
         if try_to_load_data:
             self.persist = self.controller.load_persist_from_disk()
+        self.controller.start_autosave(self.persist["casino_player"])
         self.next = "lobby"
         self.done = True
 
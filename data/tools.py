@@ -39,11 +39,42 @@ def scaled_mouse_pos(scale, pos=None):
     """
     Return the mouse position adjusted for screen size if no pos argument is
     passed and returns pos adjusted for screen size if pos is passed.
+    A scale of (w_ratio, h_ratio, x_offset, y_offset) also removes the
+    offset of a letterboxed render surface.
     """
     x,y = pg.mouse.get_pos() if pos is None else pos
+    if len(scale) > 2:
+        x, y = x-scale[2], y-scale[3]
     return (int(x*scale[0]), int(y*scale[1]))
 
 
+### Event functions
+def coalesce_motion(events):
+    """
+    Return events with each run of consecutive MOUSEMOTION events replaced
+    by one motion event. It has the pos and buttons of the last event in
+    the run and the sum of their rels. All other events keep their order,
+    so a click is never moved before or after the motion leading up to it.
+    """
+    coalesced = []
+    run = []
+    for event in events + [None]:
+        if event is not None and event.type == pg.MOUSEMOTION:
+            run.append(event)
+            continue
+        if len(run) == 1:
+            coalesced.append(run[0])
+        elif run:
+            attributes = dict(run[-1].dict)
+            attributes["rel"] = (sum(motion.rel[0] for motion in run),
+                                 sum(motion.rel[1] for motion in run))
+            coalesced.append(pg.event.Event(pg.MOUSEMOTION, attributes))
+        run = []
+        if event is not None:
+            coalesced.append(event)
+    return coalesced
+
+
 ### Resource loading functions.
 def load_all_gfx(directory,colorkey=(0,0,0),accept=(".png",".jpg",".bmp")):
     """
@@ -56,16 +87,30 @@ def load_all_gfx(directory,colorkey=(0,0,0),accept=(".png",".jpg",".bmp")):
     for pic in os.listdir(directory):
         name,ext = os.path.splitext(pic)
         if ext.lower() in accept:
-            img = pg.image.load(os.path.join(directory, pic))
-            if img.get_alpha():
-                img = img.convert_alpha()
-            else:
-                img = img.convert()
-                img.set_colorkey(colorkey)
-            graphics[name]=img
+            graphics[name] = load_gfx(os.path.join(directory, pic), colorkey)
     return graphics
 
 
+def load_gfx(path, colorkey=(0,0,0)):
+    """
+    Load a single graphic, converted as described in load_all_gfx.
+    """
+    return convert_gfx(pg.image.load(path), colorkey)
+
+
+def convert_gfx(img, colorkey=(0,0,0)):
+    """
+    Convert a loaded graphic as described in load_all_gfx. Loading can
+    happen on any thread but this should be done on the main one.
+    """
+    if img.get_alpha():
+        img = img.convert_alpha()
+    else:
+        img = img.convert()
+        img.set_colorkey(colorkey)
+    return img
+
+
 def load_all_music(directory, accept=(".wav", ".mp3", ".ogg", ".mdi")):
     """
     Create a dictionary of paths to music files in given directory
@@ -185,6 +230,27 @@ def get_cli_args(caption, win_pos, start_size, money):
         help='enable test bots')
     parser.add_argument('-N', '--iterations', action='store', type=int,
         help='maximum number of iterations to run for (useful with profiling option')
+    parser.add_argument('-H', '--headless', action='store_true',
+        help='run with no window or audio using SDL dummy drivers')
+    parser.add_argument('-x', '--scaling', default='smooth',
+        choices=('smooth', 'fast', 'integer'),
+        help='how the game is scaled to the window, default is smooth')
+    parser.add_argument('-I', '--no_idle', action='store_true',
+        help='keep running at full frame rate on idle screens')
+    parser.add_argument('-T', '--timing', action='store', metavar='FILE',
+        help='write per-phase frame timings as CSV to FILE and print event counts on exit')
+    parser.add_argument('-D', '--dt', action='store', type=float, metavar='MS',
+        help='use a fixed time step of MS milliseconds instead of the clock')
+    parser.add_argument('-A', '--asset_budget', action='store', type=float,
+        metavar='MB', help='most MB of large images and of sounds to keep loaded')
+    parser.add_argument('-O', '--pool_budget', action='store', type=float,
+        metavar='MB', help='most MB of games kept to be reused (default 64)')
+    parser.add_argument('-K', '--text_budget', action='store', type=float,
+        metavar='MB', help='most MB of rendered text to keep cached (default 4)')
+    parser.add_argument('-E', '--eager', action='store_true',
+        help='import every game at startup instead of when first played')
+    parser.add_argument('-P', '--prefetch', action='store_true',
+        help='import games in the background while the lobby is shown')
     args = vars(parser.parse_args())
     #check each condition
     if not args['center'] or (args['winpos'] != win_pos): #if -c or -w options
@@ -194,4 +260,7 @@ def get_cli_args(caption, win_pos, start_size, money):
     if args['fullscreen']:
         args['center'] = False
         args['resizable'] = False
+    if args['headless']:
+        args['fullscreen'] = False
+        args['music_off'] = True
     return args
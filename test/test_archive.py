@@ -0,0 +1,73 @@
+"""Tests for the packed graphics archive"""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+import pygame as pg
+pg.init()
+if pg.display.get_surface() is None:
+    pg.display.set_mode((10, 10))
+
+
+# Make the tests work from the test directory
+import sys
+sys.path.append('..')
+try:
+    from data import archive
+except ImportError:
+    print('\n** ERROR ** Tests must be run from the test directory\n\n')
+    sys.exit(1)
+
+
+class TestArchive(unittest.TestCase):
+
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        self.path = os.path.join(self.folder, 'test.pack')
+        solid = pg.Surface((5, 3))
+        solid.fill((200, 10, 10))
+        solid.set_at((0, 0), (0, 0, 0))
+        clear = pg.Surface((4, 4), pg.SRCALPHA)
+        clear.fill((10, 20, 30, 128))
+        self.sources = {}
+        for name, image in (('solid', solid), ('clear', clear)):
+            source = os.path.join(self.folder, name + '.png')
+            pg.image.save(image, source)
+            self.sources[name] = (source, (0, 0, 0))
+        archive.build(self.sources, self.path)
+
+    def tearDown(self):
+        shutil.rmtree(self.folder)
+
+    def test_entries_match_sources(self):
+        packed = archive.Archive(self.path)
+        solid = packed.load('solid')
+        self.assertEqual((5, 3), solid.get_size())
+        self.assertEqual((200, 10, 10, 255), tuple(solid.get_at((1, 1))))
+        self.assertEqual((0, 0, 0, 255), tuple(solid.get_colorkey()))
+        clear = packed.load('clear')
+        self.assertTrue(clear.get_flags() & pg.SRCALPHA)
+        self.assertEqual((10, 20, 30, 128), tuple(clear.get_at((2, 2))))
+        self.assertEqual(None, packed.load('missing'))
+
+    def test_changed_source_is_stale(self):
+        packed = archive.Archive(self.path)
+        source = self.sources['solid'][0]
+        mtime = os.path.getmtime(source)
+        os.utime(source, (mtime+10, mtime+10))
+        self.assertNotEqual(None, packed.load('solid'))
+        pg.image.save(pg.Surface((2, 2)), source)
+        os.utime(source, (mtime+20, mtime+20))
+        self.assertEqual(None, packed.load('solid'))
+        self.assertEqual(1, packed.stale)
+
+    def test_not_an_archive(self):
+        source = self.sources['solid'][0]
+        self.assertEqual(None, archive.open_archive(source))
+        self.assertEqual(None, archive.open_archive(self.path + '.missing'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,97 @@
+"""Tests for the on-demand asset registry"""
+
+import unittest
+import pygame as pg
+
+
+# Make the tests work from the test directory
+import sys
+sys.path.append('..')
+try:
+    from data import assets, loader
+except ImportError:
+    print('\n** ERROR ** Tests must be run from the test directory\n\n')
+    sys.exit(1)
+
+
+class TestAssetRegistry(unittest.TestCase):
+
+    def setUp(self):
+        self.loads = []
+        self.registry = assets.AssetRegistry(large=1000)
+        for name, size in (('small', (10, 10)), ('big1', (100, 100)),
+                           ('big2', (100, 100)), ('big3', (100, 100))):
+            self.registry.register(name, self._loader(name, size))
+
+    def _loader(self, name, size):
+        def load():
+            self.loads.append(name)
+            return pg.Surface(size, 0, 32)
+        return load
+
+    def test_loads_on_first_use(self):
+        self.assertTrue('big1' in self.registry)
+        self.assertEqual([], self.loads)
+        image = self.registry['big1']
+        self.assertTrue(self.registry['big1'] is image)
+        self.assertEqual(['big1'], self.loads)
+        self.assertEqual((1, 1), (self.registry.hits, self.registry.misses))
+        self.assertEqual(40000, self.registry.resident)
+
+    def test_dict_interface(self):
+        self.assertEqual(4, len(self.registry))
+        self.assertEqual(None, self.registry.get('missing'))
+        self.assertRaises(KeyError, lambda: self.registry['missing'])
+        surface = pg.Surface((1, 1))
+        self.registry['extra'] = surface
+        self.assertTrue(self.registry['extra'] is surface)
+        del self.registry['extra']
+        self.assertFalse('extra' in self.registry)
+
+    def test_parts_share_parent(self):
+        self.registry.register_part('corner', 'big1', (0, 0, 10, 10))
+        corner = self.registry['corner']
+        self.assertTrue(corner.get_parent() is self.registry['big1'])
+        self.assertEqual(40000, self.registry.resident)
+        self.registry.discard('big1')
+        self.assertFalse(self.registry.is_loaded('corner'))
+
+    def test_least_recently_used_evicted(self):
+        self.registry.budget = 80000
+        self.registry.preload(['small', 'big1', 'big2'])
+        self.registry['big1']
+        self.registry['big3']
+        self.assertFalse(self.registry.is_loaded('big2'))
+        self.assertTrue(self.registry.is_loaded('big1'))
+        self.assertTrue(self.registry.is_loaded('small'))
+        self.assertEqual(1, self.registry.evictions)
+        self.assertEqual(80000, self.registry.resident)
+
+    def test_warming_stays_within_budget(self):
+        self.registry.budget = 80000
+        self.registry.warm(['big1', 'big2', 'big3'])
+        self.assertEqual(0, self.registry.warm_step(1000))
+        self.assertEqual(['big1', 'big2'], self.loads)
+        self.registry.warm(['big3'], urgent=True)
+        self.registry.warm_step(1000)
+        self.assertTrue(self.registry.is_loaded('big3'))
+        self.assertEqual(0, self.registry.warm_step(1000))
+
+    def test_load_in_background(self):
+        decoded = []
+        def decode():
+            decoded.append(1)
+            return pg.Surface((5, 5))
+        self.registry.register('split', None, decode, lambda image: image)
+        background = loader.BackgroundLoader()
+        self.registry.load_in_background(['split', 'small', 'missing'],
+                                         background)
+        while background.update(10):
+            pass
+        self.assertTrue(self.registry.is_loaded('split'))
+        self.assertTrue(self.registry.is_loaded('small'))
+        self.assertEqual([1], decoded)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,126 @@
+"""Tests for the journaled autosave"""
+
+import os
+import shutil
+import tempfile
+import time
+import unittest
+from collections import OrderedDict
+
+
+# Make the tests work from the test directory
+import sys
+sys.path.append('..')
+try:
+    from data import autosave, savefile
+    from data.components.casino_player import CasinoPlayer
+except ImportError:
+    print('\n** ERROR ** Tests must be run from the test directory\n\n')
+    sys.exit(1)
+
+
+class TestAutoSaver(unittest.TestCase):
+
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        self.path = os.path.join(self.folder, 'save.json')
+        self.stats = OrderedDict([('cash', 100),
+                                  ('keno', OrderedDict([('games played', 0)]))])
+        self.saver = autosave.AutoSaver(self.path)
+
+    def tearDown(self):
+        self.saver.close()
+        shutil.rmtree(self.folder)
+
+    def _wait(self):
+        self.saver.close()
+
+    def test_nothing_written_until_a_change(self):
+        self.saver.start(self.stats)
+        self.saver.compact()
+        self._wait()
+        self.assertFalse(os.path.exists(self.path))
+
+    def test_changes_replayed_from_journal(self):
+        self.saver.start(self.stats)
+        self.saver.record(None, 'cash', 90)
+        self.saver.record('keno', 'games played', 1)
+        for _ in range(200):
+            if self.saver.written == 2:
+                break
+            time.sleep(0.005)
+        self.assertEqual(100, savefile.load(self.path)['cash'])
+        stats = autosave.load_stats(self.path)
+        self.assertEqual(90, stats['cash'])
+        self.assertEqual(1, stats['keno']['games played'])
+
+    def test_close_compacts_journal(self):
+        self.saver.start(self.stats)
+        self.saver.record(None, 'cash', 50)
+        self._wait()
+        self.assertEqual(50, savefile.load(self.path)['cash'])
+        self.assertEqual(0, os.path.getsize(self.saver.journal_path))
+        self.assertEqual(2, self.saver.compactions)
+
+    def test_compact_every(self):
+        self.saver.compact_every = 2
+        self.saver.start(self.stats)
+        for cash in range(5):
+            self.saver.record(None, 'cash', cash)
+        self._wait()
+        self.assertEqual(5, self.saver.written)
+        self.assertEqual(4, autosave.load_stats(self.path)['cash'])
+
+    def test_save_without_changes(self):
+        self.saver.start(self.stats)
+        self.saver.save()
+        self._wait()
+        stats = autosave.load_stats(self.path)
+        self.assertEqual(100, stats['cash'])
+        self.assertEqual(self.stats['keno'], stats['keno'].load())
+
+    def test_stats_written_directly_saved_on_close(self):
+        player = CasinoPlayer(OrderedDict([('cash', 100), ('account balance', 0),
+                                           ('keno', OrderedDict([('games played', 0)]))]))
+        self.saver.start(player.get_all_stats())
+        player.journal = self.saver
+        player.stats['cash'] -= 40
+        player.stats['keno']['games played'] = 3
+        self.saver.close(savefile.freeze(player.get_all_stats()))
+        stats = autosave.load_stats(self.path)
+        self.assertEqual(60, stats['cash'])
+        self.assertEqual(3, stats['keno'].load()['games played'])
+
+    def test_player_helpers_journaled_without_close(self):
+        player = CasinoPlayer(OrderedDict([('cash', 100), ('account balance', 0),
+                                           ('keno', OrderedDict([('games played', 0)]))]))
+        self.saver.start(player.get_all_stats())
+        player.journal = self.saver
+        player.current_game = 'keno'
+        player.cash -= 40
+        player.increase('games played')
+        for _ in range(200):
+            if self.saver.written == 2:
+                break
+            time.sleep(0.005)
+        stats = autosave.load_stats(self.path)
+        self.assertEqual(60, stats['cash'])
+        self.assertEqual(1, stats['keno']['games played'])
+
+    def test_close_unchanged_writes_nothing(self):
+        self.saver.start(self.stats)
+        self.saver.close(savefile.freeze(self.stats))
+        self.assertFalse(os.path.exists(self.path))
+
+    def test_partial_journal_line_ignored(self):
+        savefile.write(self.stats, self.path)
+        with open(autosave.journal_path(self.path), 'w') as journal:
+            journal.write('[null, "cash", 7]\n[null, "cash", 8')
+        self.assertEqual(7, autosave.load_stats(self.path)['cash'])
+
+    def test_no_snapshot(self):
+        self.assertEqual(None, autosave.load_stats(self.path))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,104 @@
+"""Tests for the glyph atlas bitmap fonts"""
+
+import unittest
+import pygame as pg
+
+
+# Make the tests work from the test directory
+import sys
+sys.path.append('..')
+try:
+    from data import prepare
+    from data.components import bitmap_font, labels
+    from data.states.baccarat.ui import BitmapTextSprite
+except ImportError:
+    print('\n** ERROR ** Tests must be run from the test directory\n\n')
+    sys.exit(1)
+
+
+FONT = prepare.FONTS['Saniretro']
+
+
+def differences(first, second, compare_alpha=True):
+    """Return the number of pixels that differ between two surfaces"""
+    width, height = first.get_size()
+    count = 0
+    for x in range(width):
+        for y in range(height):
+            a, b = first.get_at((x, y)), second.get_at((x, y))
+            if compare_alpha and a.a == 0 and b.a == 0:
+                continue
+            if tuple(a)[:3] != tuple(b)[:3] or (compare_alpha and a.a != b.a):
+                count += 1
+    return count
+
+
+class TestBitmapText(unittest.TestCase):
+
+    def setUp(self):
+        pg.font.init()
+        self.font = pg.font.Font(FONT, 30)
+
+    def test_same_as_font(self):
+        text = bitmap_font.BitmapText(bitmap_font.GlyphAtlas(self.font, 'gold3'))
+        text.render('$1,234,567,890')
+        image = text.render('$42')
+        expected = self.font.render('$42', True, pg.Color('gold3'))
+        self.assertEqual(expected.get_size(), image.get_size())
+        self.assertEqual(0, differences(expected, image))
+
+    def test_same_as_font_with_bg(self):
+        atlas = bitmap_font.GlyphAtlas(self.font, (255, 255, 255), (0, 80, 0))
+        image = bitmap_font.BitmapText(atlas).render('Bet: $5')
+        expected = self.font.render('Bet: $5', True, (255, 255, 255), (0, 80, 0))
+        self.assertEqual(0, differences(expected, image, False))
+
+    def test_missing_glyph(self):
+        atlas = bitmap_font.GlyphAtlas(self.font, 'white', characters='0123456789')
+        self.assertEqual(0, atlas.missing)
+        bitmap_font.BitmapText(atlas).render('$10')
+        bitmap_font.BitmapText(atlas).render('$20')
+        self.assertEqual(1, atlas.missing)
+
+    def test_atlas_shared(self):
+        first = bitmap_font.get_atlas(self.font, 'white')
+        self.assertIs(first, bitmap_font.get_atlas(self.font, (255, 255, 255)))
+        self.assertIsNot(first, bitmap_font.get_atlas(self.font, 'white', 'black'))
+
+
+class TestBitmapLabel(unittest.TestCase):
+
+    def test_like_label(self):
+        label = labels.Label(FONT, 30, '$100', 'white', {'center': (50, 50)})
+        bitmap = labels.BitmapLabel(FONT, 30, '$100', 'white', {'center': (50, 50)})
+        self.assertEqual(label.rect, bitmap.rect)
+        bitmap.set_text('$99')
+        label.set_text('$99')
+        self.assertEqual(label.rect, bitmap.rect)
+        self.assertEqual('$99', bitmap.text)
+
+    def test_no_renders_for_new_text(self):
+        bitmap = labels.BitmapLabel(FONT, 30, '', 'white', {'topleft': (0, 0)})
+        atlas = bitmap._bitmap.atlas
+        for amount in range(0, 1000, 7):
+            bitmap.set_text('${0:,}'.format(amount))
+        self.assertEqual(0, atlas.missing)
+
+
+class TestBitmapTextMixin(unittest.TestCase):
+
+    def test_sprite_text(self):
+        pg.font.init()
+        font = pg.font.Font(FONT, 30)
+        sprite = BitmapTextSprite('$5', font)
+        sprite.rect.topleft = (40, 20)
+        sprite.text = '$1,250'
+        expected = font.render('$1,250', True, (255, 255, 255))
+        self.assertEqual(pg.Rect((40, 20), expected.get_size()), sprite.rect)
+        self.assertEqual(0, differences(expected, sprite.image))
+        self.assertIs(bitmap_font.get_atlas(font, (255, 255, 255)),
+                      sprite._bitmap.atlas)
+
+
+if __name__ == '__main__':
+    unittest.main()
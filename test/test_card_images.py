@@ -0,0 +1,94 @@
+"""Tests for the card images shared by the card games"""
+
+import unittest
+
+
+# Make the tests work from the test directory
+import sys
+sys.path.append('..')
+try:
+    from data.components import card_images, cards
+    from data.states.baccarat import cards as baccarat_cards
+except ImportError:
+    print('\n** ERROR ** Tests must be run from the test directory\n\n')
+    sys.exit(1)
+
+
+class TestCardImages(unittest.TestCase):
+
+    def setUp(self):
+        card_images.clear()
+
+    def test_decks_share_images(self):
+        first = cards.Deck((0, 0), card_size=(100, 150), default_shuffle=False)
+        second = cards.Deck((0, 0), card_size=(100, 150), default_shuffle=False)
+        first, second = first.make_hand(52), second.make_hand(52)
+        for one, other in zip(first, second):
+            self.assertIs(one.image, other.image)
+            self.assertIs(one.back_image, other.back_image)
+        self.assertEqual((100, 150), first[0].image.get_size())
+        self.assertEqual(52, len(set(card.image for card in first)))
+
+    def test_names(self):
+        self.assertEqual('ace_of_spades', card_images.card_name(1, 'Spades'))
+        self.assertEqual('7_of_hearts', card_images.card_name(7, 'Hearts'))
+        self.assertIs(card_images.face('Ace of Spades', (100, 150)),
+                      card_images.face('ace_of_spades', (100, 150)))
+
+    def test_rotate(self):
+        card = cards.Card(12, 'Hearts', (100, 150), 10)
+        upright = card.image
+        card.rotate(-90)
+        self.assertEqual((150, 100), card.image.get_size())
+        self.assertEqual((150, 100), card.back_image.get_size())
+        self.assertIs(card.image, card_images.face(card.name, (100, 150), 270))
+        card.rotate(90)
+        self.assertIs(upright, card.image)
+
+    def test_baccarat_fronts_by_name(self):
+        shoe = baccarat_cards.make_cards(1, (100, 150))
+        fronts = dict((card.name, card.front_face) for card in shoe)
+        self.assertEqual(52, len(set(fronts.values())))
+        for card in shoe:
+            self.assertIs(card_images.face(card.name, (100, 150)), card.front_face)
+
+    def test_flip_frames(self):
+        back = card_images.back((100, 150))
+        self.assertIs(back, card_images.flip_frame(back, 1.0))
+        half = card_images.flip_frame(back, 0.5)
+        self.assertIs(half, card_images.flip_frame(back, 0.51))
+        self.assertEqual(150, half.get_height())
+        self.assertAlmostEqual(50, half.get_width(), delta=100 / card_images.FLIP_FRAMES)
+        self.assertEqual(1, card_images.flip_frame(back, 0.0).get_width())
+        used = [used for name, size, made, used in card_images.strips()
+                if (name, size) == ('back', (100, 150))]
+        thinnest = card_images.flip_frame(back, 0.0)
+        self.assertEqual([(half.get_pitch() + thinnest.get_pitch()) * 150], used)
+
+    def test_strip_budget(self):
+        budget = card_images.STRIP_BUDGET
+        card_images.STRIP_BUDGET = 1
+        try:
+            first = card_images.face('Ace of Clubs', (100, 150))
+            second = card_images.face('2 of Clubs', (100, 150))
+            card_images.flip_frame(first, 0.5)
+            card_images.flip_frame(second, 0.5)
+            self.assertNotIn(first, card_images.STRIPS)
+            self.assertIn(second, card_images.STRIPS)
+        finally:
+            card_images.STRIP_BUDGET = budget
+
+    def test_baccarat_flip(self):
+        card = baccarat_cards.Card(5, 'Hearts', ((0, 0), (100, 150)))
+        card.rotation = 45
+        self.assertAlmostEqual(50, card.image.get_width(), delta=100 / card_images.FLIP_FRAMES)
+        card.rotation = 0
+        self.assertIs(card.front_face, card.image)
+
+    def test_memory(self):
+        card_images.back((33, 44))
+        self.assertGreaterEqual(card_images.memory()[(33, 44)], 33 * 44 * 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
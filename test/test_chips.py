@@ -0,0 +1,63 @@
+"""Tests for the chip piles kept as counts of each color"""
+
+import unittest
+
+
+# Make the tests work from the test directory
+import sys
+sys.path.append('..')
+try:
+    from data.components import chips
+except ImportError:
+    print('\n** ERROR ** Tests must be run from the test directory\n\n')
+    sys.exit(1)
+
+
+class TestCounts(unittest.TestCase):
+
+    def test_cash_to_counts(self):
+        counts = chips.cash_to_counts(287)
+        self.assertEqual(['black', 'blue', 'green', 'red', 'white'], list(counts))
+        self.assertEqual([2, 3, 1, 0, 2], list(counts.values()))
+        self.assertEqual(287, chips.counts_to_cash(counts))
+        self.assertEqual(counts, chips.chips_to_counts(chips.cash_to_chips(287)))
+        self.assertEqual(287, chips.chips_to_cash(chips.counts_to_chips(counts)))
+
+
+class TestChipPile(unittest.TestCase):
+
+    def setUp(self):
+        self.pile = chips.ChipPile((5, 1000), (48, 30), cash=1000000)
+
+    def test_large_bankroll_shows_limited_chips(self):
+        self.assertEqual(1000000, self.pile.get_chip_total())
+        self.assertEqual(10000, self.pile.counts['black'])
+        shown = sum(len(stack.chips) for stack in self.pile.stacks)
+        self.assertEqual(100, shown)
+
+    def test_withdraw_and_add(self):
+        bet = self.pile.withdraw_chips(37)
+        self.assertEqual(37, chips.chips_to_cash(bet))
+        self.assertEqual(999963, self.pile.get_chip_total())
+        self.pile.add_chips(bet)
+        self.assertEqual(1000000, self.pile.get_chip_total())
+        self.assertIsNone(self.pile.withdraw_chips(2000000))
+
+    def test_withdraw_makes_change(self):
+        pile = chips.ChipPile((5, 1000), (48, 30), chips=[chips.Chip('black')])
+        bet = pile.withdraw_chips(37)
+        self.assertEqual(37, chips.chips_to_cash(bet))
+        self.assertEqual(chips.cash_to_counts(63), pile.counts)
+
+    def test_grab_chips(self):
+        pile = chips.ChipPile((5, 1000), (48, 30), cash=30)
+        top = pile.stacks[-1].chips[-1]
+        stack = pile.grab_chips(top.rect.center)
+        self.assertEqual([top], stack.chips)
+        self.assertEqual(30 - top.value, pile.get_chip_total())
+        shown = [chip for pile_stack in pile.stacks for chip in pile_stack.chips]
+        self.assertNotIn(top, shown)
+
+
+if __name__ == '__main__':
+    unittest.main()
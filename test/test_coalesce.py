@@ -0,0 +1,98 @@
+"""Tests for merging the mouse motion events of a frame"""
+
+import unittest
+import pygame as pg
+
+
+# Make the tests work from the test directory
+import sys
+sys.path.append('..')
+try:
+    import data.control
+    import data.state
+    from data import tools
+except ImportError:
+    print('\n** ERROR ** Tests must be run from the test directory\n\n')
+    sys.exit(1)
+
+
+def motion(pos, rel):
+    return pg.event.Event(pg.MOUSEMOTION, pos=pos, rel=rel, buttons=(1, 0, 0))
+
+
+def click(pos):
+    return pg.event.Event(pg.MOUSEBUTTONDOWN, pos=pos, button=1)
+
+
+class RecordingState(data.state.State):
+    """A state keeping the events it is passed"""
+
+    def __init__(self):
+        super(RecordingState, self).__init__()
+        self.events = []
+
+    def get_event(self, event, scale=(1, 1)):
+        self.events.append(event)
+
+
+class EventLooper(object):
+    """Just the parts of Control used by event_loop"""
+    event_loop = data.control.Control.__dict__['event_loop']
+
+    def __init__(self, events):
+        self._waiting_events = events
+        self.state = RecordingState()
+        self.music_handler = None
+        self.scale = (1, 1)
+        self.coalesced_events = 0
+
+
+class TestCoalesceMotion(unittest.TestCase):
+
+    def test_run_merged(self):
+        events = tools.coalesce_motion([motion((1, 1), (1, 1)),
+                                        motion((3, 2), (2, 1)),
+                                        motion((6, 2), (3, 0))])
+        self.assertEqual(1, len(events))
+        self.assertEqual((6, 2), events[0].pos)
+        self.assertEqual((6, 2), events[0].rel)
+        self.assertEqual((1, 0, 0), events[0].buttons)
+
+    def test_clicks_keep_their_place(self):
+        down = click((3, 2))
+        events = tools.coalesce_motion([motion((1, 1), (1, 1)),
+                                        motion((3, 2), (2, 1)),
+                                        down,
+                                        motion((6, 2), (3, 0))])
+        self.assertEqual([pg.MOUSEMOTION, pg.MOUSEBUTTONDOWN, pg.MOUSEMOTION],
+                         [event.type for event in events])
+        self.assertEqual((3, 2), events[0].pos)
+        self.assertTrue(events[1] is down)
+        self.assertEqual((3, 0), events[2].rel)
+
+    def test_single_motion_unchanged(self):
+        event = motion((1, 1), (1, 1))
+        self.assertTrue(tools.coalesce_motion([event])[0] is event)
+
+
+class TestEventLoop(unittest.TestCase):
+
+    def setUp(self):
+        self.events = [motion((i, 0), (1, 0)) for i in range(5)] + [click((4, 0))]
+        self.c = EventLooper(list(self.events))
+        pg.event.clear()
+
+    def test_motion_coalesced(self):
+        self.c.event_loop()
+        self.assertEqual(2, len(self.c.state.events))
+        self.assertEqual(4, self.c.coalesced_events)
+
+    def test_state_can_opt_out(self):
+        self.c.state.coalesce_motion = False
+        self.c.event_loop()
+        self.assertEqual(self.events, self.c.state.events)
+        self.assertEqual(0, self.c.coalesced_events)
+
+
+if __name__ == '__main__':
+    unittest.main()
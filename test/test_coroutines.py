@@ -0,0 +1,103 @@
+"""Tests for running generators with the coroutine scheduler"""
+
+import unittest
+
+
+# Make the tests work from the test directory
+import sys
+sys.path.append('..')
+try:
+    from data.components import coroutines
+except ImportError:
+    print('\n** ERROR ** Tests must be run from the test directory\n\n')
+    sys.exit(1)
+
+
+class TestCoroutines(unittest.TestCase):
+
+    def setUp(self):
+        self.coroutines = coroutines.CoroutineScheduler()
+        self.steps = []
+
+    def sleeper(self, name, delay, times=3):
+        for step in range(times):
+            self.steps.append((name, step))
+            yield delay
+
+    def run_for(self, frames, dt=10):
+        for _ in range(frames):
+            self.coroutines.update(dt)
+
+    def test_first_step_on_next_update(self):
+        self.coroutines.add('a', self.sleeper('a', 100))
+        self.assertEqual([], self.steps)
+        self.run_for(1)
+        self.assertEqual([('a', 0)], self.steps)
+
+    def test_sleeps(self):
+        self.coroutines.add('a', self.sleeper('a', 100))
+        self.run_for(10)
+        self.assertEqual(1, len(self.steps))
+        self.run_for(1)
+        self.assertEqual(2, len(self.steps))
+        self.run_for(30)
+        self.assertEqual(3, len(self.steps))
+        self.assertEqual(0, len(self.coroutines))
+
+    def test_bare_yield_resumes_next_update(self):
+        self.coroutines.add('a', self.sleeper('a', None))
+        self.run_for(3)
+        self.assertEqual(3, len(self.steps))
+
+    def test_only_due_generators_resumed(self):
+        sleepers = [self.coroutines.add('sleeper', self.sleeper('s', 10000)) for _ in range(100)]
+        busy = self.coroutines.add('busy', self.sleeper('b', 0, 1000))
+        self.run_for(50)
+        self.assertEqual(50, busy.steps)
+        self.assertEqual([1] * 100, [sleeper.steps for sleeper in sleepers])
+
+    def test_pause(self):
+        coroutine = self.coroutines.add('a', self.sleeper('a', 100))
+        self.run_for(1)
+        self.run_for(5)
+        coroutine.paused = True
+        self.run_for(20)
+        self.assertEqual(1, len(self.steps))
+        self.assertEqual(50, coroutine.delay)
+        coroutine.paused = False
+        self.run_for(5)
+        self.assertEqual(2, len(self.steps))
+
+    def test_update_interval_and_next_step(self):
+        coroutine = self.coroutines.add('a', self.sleeper('a', 100))
+        self.run_for(3)
+        coroutine.update_interval(40)
+        self.assertEqual(20, coroutine.delay)
+        self.assertEqual(0.2, coroutine.get_fraction_to_go())
+        self.run_for(2)
+        self.assertEqual(2, len(self.steps))
+        coroutine.next_step()
+        self.run_for(1)
+        self.assertEqual(3, len(self.steps))
+
+    def test_stop_by_name(self):
+        first = self.coroutines.add('a', self.sleeper('a', 10))
+        second = self.coroutines.add('a', self.sleeper('a', 10))
+        self.assertTrue(self.coroutines.stop('a') is first)
+        self.assertTrue(first.done)
+        self.assertEqual([second], self.coroutines.find('a'))
+        self.coroutines.stop('a')
+        self.assertRaises(coroutines.NotFound, self.coroutines.stop, 'a')
+        self.run_for(5)
+        self.assertEqual([], self.steps)
+
+    def test_cpu_time(self):
+        self.coroutines.add('a', self.sleeper('a', 0))
+        self.run_for(2)
+        self.assertEqual(['a'], list(self.coroutines.cpu_times))
+        self.assertTrue(self.coroutines.cpu_times['a'] > 0)
+        self.assertTrue('a' in self.coroutines.report())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,103 @@
+"""Tests for the event broadcaster"""
+
+import gc
+import unittest
+
+
+# Make the tests work from the test directory
+import sys
+sys.path.append('..')
+try:
+    from data import events
+except ImportError:
+    print('\n** ERROR ** Tests must be run from the test directory\n\n')
+    sys.exit(1)
+
+
+class Listener(object):
+
+    def __init__(self):
+        self.heard = []
+
+    def hear(self, obj, arg):
+        self.heard.append((obj, arg))
+
+
+class TestBroadcaster(unittest.TestCase):
+
+    def setUp(self):
+        self.broadcaster = events.Broadcaster()
+
+    def test_event_ids_are_interned(self):
+        event = events.event_id('test-interned')
+        self.assertTrue(isinstance(event, int))
+        self.assertEqual(event, events.event_id('test-interned'))
+        self.assertEqual(event, events.event_id(event))
+        self.assertEqual('test-interned', events.event_name(event))
+
+    def test_names_and_ids_are_the_same_event(self):
+        listener = Listener()
+        self.broadcaster.linkEvent('test-same', listener.hear, 1)
+        self.broadcaster.processEvent((events.event_id('test-same'), 'a'))
+        self.broadcaster.processEvent(('test-same', 'b'))
+        self.assertEqual([('a', 1), ('b', 1)], listener.heard)
+
+    def test_methods_linked_weakly(self):
+        listener = Listener()
+        self.broadcaster.linkEvent('test-weak', listener.hear)
+        self.assertEqual(1, self.broadcaster.listener_count('test-weak'))
+        del listener
+        gc.collect()
+        self.assertEqual(0, self.broadcaster.listener_count('test-weak'))
+        self.assertEqual(set(), self.broadcaster.processEvent(('test-weak', None)))
+
+    def test_strong_links(self):
+        heard = []
+        self.broadcaster.linkEvent('test-strong', lambda obj, arg: heard.append(obj))
+        self.broadcaster.linkEvent('test-strong', Listener().hear, weak=False)
+        gc.collect()
+        self.assertEqual(2, self.broadcaster.listener_count('test-strong'))
+        self.broadcaster.processEvent(('test-strong', 1))
+        self.assertEqual([1], heard)
+
+    def test_unlink_while_processing(self):
+        listener = Listener()
+
+        def unlink(obj, arg):
+            self.broadcaster.unlinkEvent('test-unlink')
+        self.broadcaster.linkEvent('test-unlink', unlink)
+        self.broadcaster.linkEvent('test-unlink', listener.hear)
+        self.broadcaster.processEvent(('test-unlink', 1))
+        self.broadcaster.processEvent(('test-unlink', 2))
+        self.assertEqual([(1, None)], listener.heard)
+        self.assertRaises(events.EventNotLinked, self.broadcaster.unlinkEvent,
+                          'test-unlink', listener.hear)
+
+    def test_inhibits_returned(self):
+        self.broadcaster.linkEvent('test-inhibit', lambda obj, arg: 'stop')
+        self.assertEqual({'stop'}, self.broadcaster.processEvent(('test-inhibit', None)))
+
+    def test_posted_events_wait_for_flush(self):
+        listener = Listener()
+        self.broadcaster.linkEvent('test-post', listener.hear)
+        self.broadcaster.post(('test-post', 1))
+        self.broadcaster.post(('test-post', 2))
+        self.assertEqual([], listener.heard)
+        self.assertEqual(2, self.broadcaster.flush())
+        self.assertEqual([(1, None), (2, None)], listener.heard)
+        self.assertEqual(0, self.broadcaster.flush())
+
+    def test_instrumented_report(self):
+        self.broadcaster.instrument = True
+        self.broadcaster.linkEvent('test-report', lambda obj, arg: None)
+        self.broadcaster.processEvent(('test-report', None))
+        self.broadcaster.processEvent(('test-report', None))
+        event = events.event_id('test-report')
+        self.assertEqual(2, self.broadcaster.dispatches[event][0])
+        line = [l for l in self.broadcaster.report().splitlines()
+                if l.startswith('test-report')][0]
+        self.assertEqual(['1', '2'], line.split()[1:3])
+
+
+if __name__ == '__main__':
+    unittest.main()
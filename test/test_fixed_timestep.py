@@ -0,0 +1,103 @@
+"""Tests for running fixed timestep states"""
+
+import unittest
+
+
+# Make the tests work from the test directory
+import sys
+sys.path.append('..')
+try:
+    import data.control
+    import data.state
+    from data import prepare
+except ImportError:
+    print('\n** ERROR ** Tests must be run from the test directory\n\n')
+    sys.exit(1)
+
+
+class SteppedState(data.state.State):
+    """A state counting its fixed updates"""
+    fixed_timestep = 10.0
+    max_fixed_steps = 4
+
+    def __init__(self):
+        super(SteppedState, self).__init__()
+        self.steps = []
+
+    def fixed_update(self, keys, now, step):
+        self.steps.append(step)
+
+
+class TimedState(data.state.State):
+    """A state recording the dt and time of each update"""
+
+    def __init__(self):
+        super(TimedState, self).__init__()
+        self.updates = []
+
+    def update(self, surface, keys, now, dt, scale):
+        self.updates.append((dt, now))
+
+
+class Stepper(object):
+    """Just the parts of Control used by step_simulation"""
+    step_simulation = data.control.Control.__dict__['step_simulation']
+
+    def __init__(self):
+        self.state = SteppedState()
+        self.keys = ()
+        self.now = 0.0
+        self.accumulator = 0.0
+        self.fixed_steps = 0
+
+
+class TestFixedTimestep(unittest.TestCase):
+
+    def setUp(self):
+        self.c = Stepper()
+
+    def test_whole_steps_are_run(self):
+        self.c.step_simulation(25.0)
+        self.assertEqual([10.0, 10.0], self.c.state.steps)
+        self.assertAlmostEqual(0.5, self.c.state.alpha)
+
+    def test_remainder_carries_over(self):
+        self.c.step_simulation(5.0)
+        self.assertEqual(0, self.c.fixed_steps)
+        self.c.step_simulation(5.0)
+        self.assertEqual(1, self.c.fixed_steps)
+        self.assertAlmostEqual(0.0, self.c.state.alpha)
+
+    def test_catch_up_is_capped(self):
+        self.c.step_simulation(1000.0)
+        self.assertEqual(4, len(self.c.state.steps))
+        self.assertTrue(self.c.accumulator < 10.0)
+        self.c.step_simulation(10.0)
+        self.assertEqual(5, len(self.c.state.steps))
+
+
+class TestMain(unittest.TestCase):
+
+    def setUp(self):
+        self.control = data.control.Control('caption', prepare.RENDER_SIZE,
+                                            prepare.RESOLUTIONS)
+        self.control.state_name = 'timed'
+        self.control.state = TimedState()
+        self.control.fixed_dt = 16.0
+        self.control.max_iterations = 5
+
+    def test_dt_fixed(self):
+        self.control.main()
+        self.assertEqual([(16.0, 16.0), (16.0, 32.0), (16.0, 48.0), (16.0, 64.0), (16.0, 80.0)],
+                         self.control.state.updates)
+
+    def test_stops_after_max_iterations(self):
+        self.control.main()
+        self.assertEqual(5, self.control.iterations)
+        self.assertEqual(5, len(self.control.state.updates))
+        self.assertFalse(self.control.done)
+        self.assertTrue(self.control.throughput() > 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
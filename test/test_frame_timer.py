@@ -0,0 +1,149 @@
+"""Tests for the frame timing instrumentation"""
+
+import os
+import tempfile
+import unittest
+import pygame as pg
+
+
+# Make the tests work from the test directory
+import sys
+sys.path.append('..')
+try:
+    import data.control
+    import data.state
+    from data import prepare
+    from data.components import frame_timer
+    from data.scaling import Scaler
+except ImportError:
+    print('\n** ERROR ** Tests must be run from the test directory\n\n')
+    sys.exit(1)
+
+
+class TestRollingHistogram(unittest.TestCase):
+
+    def test_percentiles(self):
+        hist = frame_timer.RollingHistogram(window=100)
+        for i in range(100):
+            hist.add(i / 10.)
+        # Results are only as precise as the bucket width
+        self.assertAlmostEqual(5.0, hist.percentile(50), delta=0.15)
+        self.assertAlmostEqual(9.5, hist.percentile(95), delta=0.15)
+        self.assertAlmostEqual(9.9, hist.percentile(99), delta=0.15)
+
+    def test_window_drops_old_samples(self):
+        hist = frame_timer.RollingHistogram(window=10)
+        for i in range(10):
+            hist.add(50.0)
+        for i in range(10):
+            hist.add(1.0)
+        self.assertEqual(10, len(hist))
+        self.assertAlmostEqual(1.0, hist.percentile(99), delta=0.15)
+
+    def test_overflow_is_clamped(self):
+        hist = frame_timer.RollingHistogram(max_ms=10.0)
+        hist.add(500.0)
+        self.assertEqual(500.0, hist.max_seen)
+        self.assertEqual(500.0, hist.percentile(50))
+
+
+class TestFrameTimer(unittest.TestCase):
+
+    def test_laps_are_grouped_by_state(self):
+        timer = frame_timer.FrameTimer()
+        for name in ('one', 'two', 'two'):
+            timer.begin()
+            timer.lap('event_loop')
+            timer.lap('update')
+            timer.end(name)
+        self.assertEqual(['one', 'two'], list(timer.histograms))
+        phases = [row[0] for row in timer.summary('two')]
+        self.assertEqual(['event_loop', 'update', 'frame'], phases)
+        self.assertEqual(2, timer.summary('two')[0][1])
+
+    def test_write_csv(self):
+        timer = frame_timer.FrameTimer()
+        timer.begin()
+        timer.lap('render')
+        timer.end('lobby')
+        handle, path = tempfile.mkstemp(suffix='.csv')
+        os.close(handle)
+        try:
+            timer.write_csv(path)
+            with open(path) as csv_file:
+                lines = csv_file.read().splitlines()
+        finally:
+            os.remove(path)
+        self.assertEqual('state,phase,samples,p50_ms,p95_ms,p99_ms,max_ms', lines[0])
+        self.assertEqual(['lobby,render', 'lobby,frame'], [l.rsplit(',', 5)[0] for l in lines[1:]])
+
+
+class Renderer(object):
+    """Just the parts of Control used by render"""
+    render = data.control.Control.__dict__['render']
+
+    def __init__(self):
+        self.render_surf = pg.Surface((400, 300))
+        self.render_surf.fill((0, 0, 255))
+        self.screen = pg.Surface((400, 300))
+        self.scaler = Scaler((400, 300), (400, 300))
+        self.frame_timer = frame_timer.FrameTimer()
+        self.state_name = 'test'
+        self.frame_dt = 16.0
+        self.dirty_rects = None
+
+
+class TestOverlay(unittest.TestCase):
+
+    def test_overlay_left_off_render_surface(self):
+        control = Renderer()
+        control.frame_timer.toggle_overlay()
+        control.dirty_rects = []
+        self.assertEqual([control.frame_timer.rect], control.render())
+        point = control.frame_timer.rect.move(2, 2).topleft
+        self.assertEqual((0, 0, 255, 255), tuple(control.render_surf.get_at(point)))
+        self.assertNotEqual((0, 0, 255, 255), tuple(control.screen.get_at(point)))
+        control.frame_timer.toggle_overlay()
+        control.dirty_rects = None
+        self.assertEqual(None, control.render())
+        self.assertEqual((0, 0, 255, 255), tuple(control.screen.get_at(point)))
+
+
+class DirtyState(data.state.State):
+    """A state that reports one changed rect each frame"""
+
+    def update(self, surface, keys, now, dt, scale):
+        return [pg.Rect(10, 10, 20, 20)]
+
+
+class TestDirtyRects(unittest.TestCase):
+
+    def test_only_dirty_rects_presented(self):
+        control = Renderer()
+        control.dirty_rects = [pg.Rect(10, 10, 20, 20), pg.Rect(200, 100, 30, 40)]
+        self.assertEqual(control.dirty_rects, control.render())
+        self.assertEqual((0, 0, 255, 255), tuple(control.screen.get_at((15, 15))))
+        self.assertEqual((0, 0, 255, 255), tuple(control.screen.get_at((229, 139))))
+        self.assertEqual((0, 0, 0, 255), tuple(control.screen.get_at((100, 100))))
+        self.assertEqual((0, 0, 0, 255), tuple(control.screen.get_at((30, 30))))
+
+    def test_none_presents_whole_frame(self):
+        control = Renderer()
+        self.assertEqual(None, control.render())
+        self.assertEqual((0, 0, 255, 255), tuple(control.screen.get_at((100, 100))))
+        self.assertEqual((0, 0, 255, 255), tuple(control.screen.get_at((399, 299))))
+
+    def test_state_rects_used_after_first_frame(self):
+        control = data.control.Control('caption', prepare.RENDER_SIZE, prepare.RESOLUTIONS)
+        control.state_name = 'dirty'
+        control.state = DirtyState()
+        control.fixed_dt = 16.0
+        control.max_iterations = 1
+        control.main()
+        self.assertEqual(None, control.dirty_rects)
+        control.main()
+        self.assertEqual([pg.Rect(10, 10, 20, 20)], control.dirty_rects)
+
+
+if __name__ == '__main__':
+    unittest.main()
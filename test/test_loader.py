@@ -0,0 +1,66 @@
+"""Tests for the background loader"""
+
+import threading
+import time
+import unittest
+
+
+# Make the tests work from the test directory
+import sys
+sys.path.append('..')
+try:
+    from data import loader
+except ImportError:
+    print('\n** ERROR ** Tests must be run from the test directory\n\n')
+    sys.exit(1)
+
+
+class TestBackgroundLoader(unittest.TestCase):
+
+    def setUp(self):
+        self.loader = loader.BackgroundLoader()
+        self.finished = []
+
+    def _finish_all(self):
+        for _ in range(200):
+            if self.loader.update(10) == 0:
+                return
+            time.sleep(0.005)
+        self.fail('loader did not finish')
+
+    def test_work_off_main_thread_finish_on_it(self):
+        main = threading.current_thread()
+        def work():
+            return threading.current_thread() is main
+        def finish(on_main):
+            self.finished.append((on_main, threading.current_thread() is main))
+        self.loader.add(work, finish)
+        self._finish_all()
+        self.assertEqual([(False, True)], self.finished)
+
+    def test_nothing_finishes_without_update(self):
+        self.loader.add(lambda: 1, self.finished.append)
+        time.sleep(0.05)
+        self.assertEqual([], self.finished)
+        self.assertEqual(0.0, self.loader.progress())
+
+    def test_groups(self):
+        self.loader.add(lambda: 1, self.finished.append, 'first')
+        self.loader.add(None, self.finished.append, 'first')
+        self.loader.add(lambda: 3, self.finished.append, 'rest')
+        self.assertEqual(2, self.loader.remaining('first'))
+        self._finish_all()
+        self.assertEqual(1.0, self.loader.progress('first'))
+        self.assertEqual(1.0, self.loader.progress('missing'))
+        self.assertEqual([1, 3, None], sorted(self.finished, key=str))
+
+    def test_failures_are_counted(self):
+        self.loader.add(lambda: 1/0, self.finished.append)
+        self.loader.add(lambda: 1, lambda result: 1/0)
+        self._finish_all()
+        self.assertEqual(2, self.loader.failed)
+        self.assertEqual([], self.finished)
+
+
+if __name__ == '__main__':
+    unittest.main()
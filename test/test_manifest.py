@@ -0,0 +1,112 @@
+"""Tests for state manifests and lazily imported states"""
+
+import os
+import sys
+import threading
+import time
+import unittest
+from importlib import import_module
+
+
+# Make the tests work from the test directory
+sys.path.append('..')
+try:
+    from data import loader, manifest, prepare
+    from data.control import Control
+except ImportError:
+    print('\n** ERROR ** Tests must be run from the test directory\n\n')
+    sys.exit(1)
+
+
+STATES_FOLDER = os.path.join('data', 'states')
+
+
+class TestManifests(unittest.TestCase):
+
+    def test_manifests_match_states(self):
+        """every manifest should agree with the state it describes"""
+        for folder in os.listdir(STATES_FOLDER):
+            path = os.path.join(STATES_FOLDER, folder)
+            info = manifest.read_manifest(path)
+            if info is None:
+                continue
+            scene = import_module('data.states.' + folder).Scene
+            self.assertEqual(folder, info['name'])
+            self.assertEqual(hasattr(scene, 'show_in_lobby'),
+                             info['show_in_lobby'], folder)
+            if hasattr(scene, 'initialize_stats'):
+                self.assertEqual(scene.initialize_stats(), info['stats'],
+                                 folder)
+            else:
+                self.assertEqual(None, info['stats'], folder)
+
+    def test_missing_manifest(self):
+        self.assertEqual(None, manifest.read_manifest(STATES_FOLDER))
+
+
+class TestLazyState(unittest.TestCase):
+
+    def setUp(self):
+        info = manifest.read_manifest(os.path.join(STATES_FOLDER, 'credits'))
+        self.state = manifest.LazyState('data.states.credits', info)
+
+    def test_manifest_attributes_do_not_import(self):
+        self.assertFalse(hasattr(self.state, 'show_in_lobby'))
+        self.assertFalse(hasattr(self.state, 'initialize_stats'))
+        self.assertFalse(self.state.loaded)
+
+    def test_stats_are_copies(self):
+        info = manifest.read_manifest(os.path.join(STATES_FOLDER, 'bingo'))
+        state = manifest.LazyState('data.states.bingo', info)
+        stats = state.initialize_stats()
+        stats['_last squares'].append(1)
+        self.assertEqual([], state.initialize_stats()['_last squares'])
+        self.assertFalse(state.loaded)
+
+    def test_other_attributes_load_the_scene(self):
+        scene = import_module('data.states.credits').Scene
+        self.assertEqual(scene.get_event, self.state.get_event)
+        self.assertTrue(self.state.loaded)
+        self.assertTrue(self.state.load() is scene)
+
+    def test_prefetch(self):
+        background = loader.BackgroundLoader()
+        self.assertEqual(1, manifest.prefetch([self.state], background))
+        self.assertFalse(self.state.loaded)
+        background.update(1000)
+        self.assertTrue(self.state.loaded)
+        self.assertEqual(0, manifest.prefetch([self.state], background))
+
+
+class RecordingState(manifest.LazyState):
+    """A LazyState that notes the thread it was loaded on"""
+
+    def __init__(self, name, loads):
+        manifest.LazyState.__init__(self, 'data.states.' + name, {'name': name})
+        self._loads = loads
+
+    def load(self):
+        self._loads.append((self.name, threading.current_thread()))
+        return None
+
+
+class TestStartLoading(unittest.TestCase):
+
+    def test_states_imported_on_main_thread(self):
+        loads = []
+        control = Control('caption', prepare.RENDER_SIZE, prepare.RESOLUTIONS)
+        for name in ('lobby', 'keno', 'title_screen'):
+            control.state_dict[name] = RecordingState(name, loads)
+        control.start_loading()
+        for _ in range(200):
+            if control.loader.update(1000) == 0:
+                break
+            time.sleep(0.005)
+        self.assertEqual(['title_screen', 'lobby', 'keno'],
+                         [name for name, thread in loads])
+        for name, thread in loads:
+            self.assertIs(threading.current_thread(), thread)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,79 @@
+"""Tests for the save file format"""
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from collections import OrderedDict
+
+
+# Make the tests work from the test directory
+import sys
+sys.path.append('..')
+try:
+    from data import savefile
+except ImportError:
+    print('\n** ERROR ** Tests must be run from the test directory\n\n')
+    sys.exit(1)
+
+
+class TestSaveFile(unittest.TestCase):
+
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        self.path = os.path.join(self.folder, 'save.json')
+        self.stats = OrderedDict([
+            ('cash', 100),
+            ('account balance', 5),
+            ('keno', OrderedDict([('games played', 3)])),
+            ('bingo', OrderedDict([('cards won', 1), ('_last squares', [1, 2])]))])
+
+    def tearDown(self):
+        shutil.rmtree(self.folder)
+
+    def test_sections_loaded_lazily(self):
+        savefile.write(self.stats, self.path)
+        stats = savefile.load(self.path)
+        self.assertEqual(['cash', 'account balance', 'keno', 'bingo'],
+                         list(stats))
+        self.assertEqual(100, stats['cash'])
+        self.assertTrue(isinstance(stats['keno'], savefile.Section))
+        self.assertEqual(self.stats['bingo'], stats['bingo'].load())
+
+    def test_header_read_without_body(self):
+        savefile.write(self.stats, self.path)
+        with open(self.path, 'a') as save_file:
+            save_file.write('not json')
+        header = savefile.read_header(self.path)
+        self.assertEqual(savefile.VERSION, header['version'])
+        self.assertEqual(100, header['player']['cash'])
+        self.assertEqual(['keno', 'bingo'], list(header['sections']))
+
+    def test_old_save_migrated(self):
+        with open(self.path, 'w') as save_file:
+            json.dump(self.stats, save_file)
+        self.assertEqual(1, savefile.read_header(self.path)['version'])
+        stats = savefile.load(self.path)
+        self.assertEqual(self.stats['keno'], stats['keno'].load())
+        self.assertEqual(savefile.VERSION,
+                         savefile.read_header(self.path)['version'])
+
+    def test_no_save(self):
+        self.assertEqual(None, savefile.read_header(self.path))
+        self.assertEqual(None, savefile.load(self.path))
+        with open(self.path, 'w') as save_file:
+            save_file.write('rubbish')
+        self.assertEqual(None, savefile.read_header(self.path))
+        self.assertEqual(None, savefile.load(self.path))
+
+    def test_newer_version_not_loaded(self):
+        header = {'format': savefile.FORMAT, 'version': savefile.VERSION+1,
+                  'player': {}, 'sections': {}}
+        with open(self.path, 'w') as save_file:
+            save_file.write(json.dumps(header)+'\n')
+        self.assertEqual(None, savefile.load(self.path))
+
+
+if __name__ == '__main__':
+    unittest.main()
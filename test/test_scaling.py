@@ -0,0 +1,110 @@
+"""Tests for the render surface scaler"""
+
+import unittest
+import pygame as pg
+
+
+# Make the tests work from the test directory
+import sys
+sys.path.append('..')
+try:
+    import data.control
+    from data import scaling
+except ImportError:
+    print('\n** ERROR ** Tests must be run from the test directory\n\n')
+    sys.exit(1)
+
+
+RENDER_SIZE = (140, 105)
+
+
+class TestScaler(unittest.TestCase):
+
+    def setUp(self):
+        self.source = pg.Surface(RENDER_SIZE)
+        self.source.fill((255, 0, 0))
+
+    def test_bad_mode(self):
+        self.assertRaises(ValueError, scaling.Scaler, RENDER_SIZE, (10, 10), 'bad')
+
+    def test_integer_factor(self):
+        factor = scaling.Scaler.get_integer_factor
+        self.assertEqual(1.0, factor(RENDER_SIZE, RENDER_SIZE))
+        self.assertEqual(0.5, factor(RENDER_SIZE, (92, 69)))
+        self.assertEqual(2.0, factor(RENDER_SIZE, (300, 250)))
+
+    def test_integer_mode_offsets_scale(self):
+        scaler = scaling.Scaler(RENDER_SIZE, (92, 69), 'integer')
+        self.assertEqual(pg.Rect(11, 8, 70, 52), scaler.image_rect)
+        self.assertEqual((2.0, 105 / 52., 11, 8), scaler.scale)
+
+    def test_full_frame(self):
+        for mode in scaling.MODES:
+            scaler = scaling.Scaler(RENDER_SIZE, (70, 50), mode)
+            screen = pg.Surface((70, 50))
+            self.assertEqual(None, scaler.present(self.source, screen))
+            red, green, blue, alpha = screen.get_at((35, 25))
+            self.assertTrue(red > 250 and green < 5 and blue < 5, mode)
+
+    def test_no_dirty_rects_skips_scaling(self):
+        scaler = scaling.Scaler(RENDER_SIZE, (70, 50))
+        screen = pg.Surface((70, 50))
+        self.assertEqual([], scaler.present(self.source, screen, []))
+        self.assertEqual((0, 0, 0, 255), tuple(screen.get_at((35, 25))))
+        self.assertEqual(1, scaler.frames_skipped)
+
+    def test_unchanged_frame_is_skipped(self):
+        scaler = scaling.Scaler(RENDER_SIZE, (70, 50))
+        scaler.skip_unchanged = True
+        screen = pg.Surface((70, 50))
+        self.assertEqual(None, scaler.present(self.source, screen))
+        self.assertEqual([], scaler.present(self.source, screen))
+        self.source.fill((0, 255, 0), (0, 0, 10, 10))
+        self.assertEqual(None, scaler.present(self.source, screen))
+
+    def test_changing_frames_checked_less_often(self):
+        scaler = scaling.Scaler(RENDER_SIZE, (70, 50))
+        scaler.skip_unchanged = True
+        screen = pg.Surface((70, 50))
+        for i in range(scaler.miss_limit + 2):
+            self.source.fill((i, 0, 0), (0, 0, 10, 10))
+            scaler.present(self.source, screen)
+        skipped = [scaler.present(self.source, screen) == []
+                   for _ in range(scaler.check_every)]
+        self.assertEqual(scaler.check_every - 1, skipped.index(True))
+        self.assertEqual([], scaler.present(self.source, screen))
+
+    def test_dirty_rects_only_touch_their_area(self):
+        scaler = scaling.Scaler(RENDER_SIZE, (70, 50), 'fast')
+        screen = pg.Surface((70, 50))
+        updated = scaler.present(self.source, screen, [pg.Rect(0, 0, 20, 20)])
+        self.assertEqual([pg.Rect(0, 0, 10, 10)], updated)
+        self.assertEqual((255, 0, 0, 255), tuple(screen.get_at((5, 5))))
+        self.assertEqual((0, 0, 0, 255), tuple(screen.get_at((30, 30))))
+
+
+class DirtyChecker(object):
+    """Just the parts of Control used by check_dirty_rects"""
+    check_dirty_rects = data.control.Control.__dict__['check_dirty_rects']
+
+    def __init__(self):
+        self.scaler = scaling.Scaler(RENDER_SIZE, (70, 50))
+        self.render_surf = pg.Surface(RENDER_SIZE)
+        self.max_dirty_fraction = 0.5
+        self._full_redraw = True
+
+
+class TestSkipUnchanged(unittest.TestCase):
+
+    def test_only_for_whole_frames(self):
+        control = DirtyChecker()
+        self.assertEqual(None, control.check_dirty_rects(None))
+        self.assertFalse(control.scaler.skip_unchanged)
+        self.assertEqual(None, control.check_dirty_rects(None))
+        self.assertTrue(control.scaler.skip_unchanged)
+        self.assertEqual([], control.check_dirty_rects([]))
+        self.assertFalse(control.scaler.skip_unchanged)
+
+
+if __name__ == '__main__':
+    unittest.main()
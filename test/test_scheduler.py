@@ -0,0 +1,175 @@
+"""Tests for calling tasks from a heap of due times"""
+
+import unittest
+import pygame as pg
+
+
+# Make the tests work from the test directory
+import sys
+sys.path.append('..')
+try:
+    import data.control
+    import data.state
+    from data.components.animation import Animation, AnimationGroup, Task, TaskGroup
+    from data.components.scheduler import Scheduler
+except ImportError:
+    print('\n** ERROR ** Tests must be run from the test directory\n\n')
+    sys.exit(1)
+
+
+class TestScheduler(unittest.TestCase):
+
+    def setUp(self):
+        self.group = TaskGroup()
+        self.calls = []
+
+    def call(self, value='call'):
+        self.calls.append(value)
+
+    def test_delay(self):
+        self.group.add(Task(self.call, 100))
+        self.group.update(60)
+        self.assertEqual([], self.calls)
+        self.group.update(60)
+        self.assertEqual(['call'], self.calls)
+        self.assertEqual(0, len(self.group))
+        self.assertEqual(0, len(self.group.scheduler))
+
+    def test_loops_fire_once_per_update(self):
+        self.group.add(Task(self.call, 10, 3))
+        self.group.update(25)
+        self.assertEqual(1, len(self.calls))
+        self.group.update(5)
+        self.group.update(5)
+        self.assertEqual(3, len(self.calls))
+        self.assertEqual(0, len(self.group))
+
+    def test_matches_plain_group(self):
+        plain = pg.sprite.Group()
+        plain_calls = []
+        plain.add(Task(plain_calls.append, 30, 4, args=(1,)))
+        self.group.add(Task(self.call, 30, 4, args=(1,)))
+        for dt in (10, 25, 40, 5, 70, 16, 16):
+            plain.update(dt)
+            self.group.update(dt)
+            self.assertEqual(plain_calls, self.calls)
+
+    def test_chain_waits_for_next_update(self):
+        task = Task(self.call, 10, args=('first',))
+        task.chain(Task(self.call, 0, args=('second',)))
+        self.group.add(task)
+        self.group.update(10)
+        self.assertEqual(['first'], self.calls)
+        self.group.update(1)
+        self.assertEqual(['first', 'second'], self.calls)
+
+    def test_cancel_by_callback(self):
+        self.group.add(Task(self.call, 100, -1), Task(self.call, 200),
+                       Task(self.calls.append, 100, args=('other',)))
+        self.assertEqual(2, self.group.cancel(self.call))
+        self.group.update(300)
+        self.assertEqual(['other'], self.calls)
+        self.assertEqual(0, len(self.group))
+
+    def test_cancel_from_callback(self):
+        def stop():
+            self.group.cancel(stop)
+        self.group.add(Task(stop, 10, -1))
+        self.group.update(10)
+        self.assertEqual(0, len(self.group.scheduler))
+
+    def test_removed_task_keeps_progress(self):
+        task = Task(self.call, 100)
+        self.group.add(task)
+        self.group.update(70)
+        task.remove(self.group)
+        task.update(30)
+        self.assertEqual(['call'], self.calls)
+
+    def test_dead_entries_tidied(self):
+        scheduler = Scheduler()
+        tasks = [Task(self.call, 100) for _ in range(200)]
+        for task in tasks:
+            scheduler.schedule(task)
+        for task in tasks[:150]:
+            self.assertEqual(100, scheduler.cancel(task))
+        self.assertEqual(50, len(scheduler))
+        self.assertTrue(len(scheduler._heap) < 200)
+
+    def test_time_to_next(self):
+        self.assertEqual(None, self.group.time_to_next())
+        task = Task(self.call, 500)
+        self.group.add(Task(self.call, 800), task)
+        self.group.update(200)
+        self.assertEqual(300, self.group.time_to_next())
+        task.kill()
+        self.assertEqual(600, self.group.time_to_next())
+
+    def test_animating_group_has_work_now(self):
+        group = AnimationGroup(Task(self.call, 500))
+        self.assertEqual(500, group.time_to_next())
+        target = pg.Rect(0, 0, 10, 10)
+        animation = Animation(x=100, duration=100)
+        animation.start(target)
+        group.add(animation)
+        self.assertEqual(0, group.time_to_next())
+        group.update(150)
+        self.assertEqual(350, group.time_to_next())
+
+
+class TimedState(data.state.State):
+    """A state with a Task pending"""
+
+    def __init__(self, group):
+        super(TimedState, self).__init__()
+        self.group = group
+
+    def time_to_next_update(self):
+        return self.group.time_to_next()
+
+
+class IdleChecker(object):
+    """Just the parts of Control used by get_idle_wait"""
+    get_idle_wait = data.control.Control.__dict__['get_idle_wait']
+
+    def __init__(self, state):
+        self.state = state
+        self.idle_pacing = True
+        self.fixed_dt = None
+        self.idle_fps = 10.0
+        self.max_idle_wait = 1000.0
+
+
+class TestIdleWait(unittest.TestCase):
+
+    def test_wait_ends_when_task_due(self):
+        group = TaskGroup()
+        control = IdleChecker(TimedState(group))
+        self.assertEqual(100, control.get_idle_wait([]))
+        group.add(Task(lambda: None, 30))
+        self.assertEqual(30, control.get_idle_wait([]))
+        group.update(30)
+        self.assertEqual(100, control.get_idle_wait([]))
+        self.assertEqual(None, control.get_idle_wait(None))
+
+    def test_no_wait_when_done_or_quitting(self):
+        state = TimedState(TaskGroup())
+        state.idle_timeout = lambda: data.state.WAIT_FOR_INPUT
+        control = IdleChecker(state)
+        self.assertEqual(1000.0, control.get_idle_wait(None))
+        state.done = True
+        self.assertEqual(None, control.get_idle_wait(None))
+        state.done, state.quit = False, True
+        self.assertEqual(None, control.get_idle_wait(None))
+
+    def test_no_wait_while_animating(self):
+        group = AnimationGroup()
+        animation = Animation(x=100, duration=100)
+        animation.start(pg.Rect(0, 0, 10, 10))
+        group.add(animation)
+        control = IdleChecker(TimedState(group))
+        self.assertEqual(None, control.get_idle_wait([]))
+
+
+if __name__ == '__main__':
+    unittest.main()
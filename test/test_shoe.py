@@ -0,0 +1,112 @@
+"""Tests for the shoe of cards kept as numbers"""
+
+import random
+import unittest
+from collections import Counter
+
+
+# Make the tests work from the test directory
+import sys
+sys.path.append('..')
+try:
+    from data.components import cards, shoe
+    from data.states.baccarat import cards as baccarat_cards
+except ImportError:
+    print('\n** ERROR ** Tests must be run from the test directory\n\n')
+    sys.exit(1)
+
+
+class TestShoe(unittest.TestCase):
+
+    def test_codes(self):
+        for code in range(52):
+            value, suit = shoe.card_value(code), shoe.card_suit(code)
+            self.assertEqual(code, shoe.card_code(value, suit))
+        self.assertEqual((1, 'Clubs'), (shoe.card_value(0), shoe.card_suit(0)))
+        self.assertEqual((13, 'Spades'), (shoe.card_value(51), shoe.card_suit(51)))
+
+    def test_deal_every_card(self):
+        cards_shoe = shoe.Shoe(2, random.Random(1))
+        dealt = []
+        while True:
+            code = cards_shoe.deal()
+            if code is None:
+                break
+            dealt.append(code)
+        self.assertEqual(104, len(dealt))
+        self.assertEqual(set([2]), set(Counter(dealt).values()))
+        self.assertEqual(0, len(cards_shoe))
+
+    def test_rng_replays(self):
+        first = shoe.Shoe(4, random.Random(7))
+        second = shoe.Shoe(4, random.Random(7))
+        self.assertEqual(list(first), list(second))
+        self.assertNotEqual(list(range(52)) * 4, list(first))
+        self.assertEqual(list(range(52)), list(shoe.Shoe(shuffle=False)))
+
+    def test_burn_and_discards(self):
+        cards_shoe = shoe.Shoe(shuffle=False)
+        cards_shoe.burn(3)
+        self.assertEqual(bytearray([0, 1, 2]), cards_shoe.discards)
+        self.assertEqual(3, cards_shoe.burned)
+        self.assertEqual(49, len(cards_shoe))
+        cards_shoe.discard(cards_shoe.deal(), cards_shoe.deal())
+        cards_shoe.return_discards(False)
+        self.assertEqual(list(range(5, 52)) + [0, 1, 2, 3, 4], list(cards_shoe))
+
+    def test_cut_card(self):
+        cards_shoe = shoe.Shoe(1, penetration=.75)
+        for _ in range(38):
+            cards_shoe.deal()
+            self.assertFalse(cards_shoe.cut_card_reached)
+        cards_shoe.deal()
+        self.assertTrue(cards_shoe.cut_card_reached)
+        cards_shoe.reshuffle()
+        self.assertEqual(52, len(cards_shoe))
+        self.assertFalse(cards_shoe.cut_card_reached)
+
+
+class TestDecks(unittest.TestCase):
+
+    def test_deck_reuses_discards(self):
+        deck = cards.Deck((0, 0), card_size=(100, 150))
+        hand = deck.make_hand(52)
+        self.assertEqual(0, len(deck))
+        for card in hand[:10]:
+            deck.discard(card)
+        names = set(card.name for card in deck.make_hand(10))
+        self.assertEqual(set(card.name for card in hand[:10]), names)
+        self.assertIsNone(deck.draw_card())
+
+    def test_infinite_deck(self):
+        deck = cards.Deck((0, 0), card_size=(100, 150), reuse_discards=False,
+                          infinite=True)
+        self.assertEqual(104, len([card for card in deck.make_hand(104) if card]))
+
+    def test_multideck(self):
+        deck = cards.MultiDeck(3, card_size=(100, 150))
+        self.assertEqual(156, len(deck))
+
+    def test_baccarat_shoe_makes_top_card(self):
+        deck = baccarat_cards.Deck(((0, 0), (100, 150)), (100, 150), decks=8)
+        self.assertEqual(1, len(deck.sprites()))
+        self.assertEqual(416, len(deck))
+        dealt = [deck.pop() for _ in range(6)]
+        self.assertEqual(410, len(deck))
+        self.assertEqual(1, len(deck.sprites()))
+        self.assertNotIn(deck.sprites()[0], dealt)
+
+    def test_baccarat_reshuffle_burns(self):
+        deck = baccarat_cards.Deck(((0, 0), (100, 150)), (100, 150), decks=1,
+                                   penetration=.5)
+        while not deck.cut_card_reached:
+            deck.pop()
+        deck.reshuffle()
+        burned = deck.shoe.discards
+        self.assertEqual(min(shoe.card_value(burned[0]), 10) + 1, len(burned))
+        self.assertEqual(52 - len(burned), len(deck))
+        self.assertFalse(deck.cut_card_reached)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,142 @@
+"""Tests for the spatial index used to find clickables under the mouse"""
+
+import unittest
+import pygame as pg
+
+
+# Make the tests work from the test directory
+import sys
+sys.path.append('..')
+try:
+    from data.components import common, spatial
+except ImportError:
+    print('\n** ERROR ** Tests must be run from the test directory\n\n')
+    sys.exit(1)
+
+
+class Item(object):
+
+    def __init__(self, rect):
+        self.rect = pg.Rect(rect)
+
+
+class Counter(common.Clickable):
+    """A clickable that counts the events it is passed"""
+
+    def __init__(self, name, rect):
+        super(Counter, self).__init__(name, pg.Rect(rect))
+        self.events = 0
+        self.left = 0
+
+    def process_events(self, event, scale=(1, 1)):
+        self.events += 1
+        super(Counter, self).process_events(event, scale)
+
+    def handle_mouse_leave(self):
+        self.left += 1
+
+
+class Square(common.Clickable):
+    """A clickable using the standard event handling"""
+
+    def __init__(self, name, rect):
+        super(Square, self).__init__(name, pg.Rect(rect))
+        self.entered = self.left = 0
+
+    def handle_mouse_enter(self):
+        self.entered += 1
+
+    def handle_mouse_leave(self):
+        self.left += 1
+
+
+def motion(pos):
+    return pg.event.Event(pg.MOUSEMOTION, pos=pos, rel=(0, 0), buttons=(0, 0, 0))
+
+
+class TestGridIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.index = spatial.GridIndex(cell_size=100)
+        self.small = Item((10, 10, 20, 20))
+        self.large = Item((50, 50, 200, 200))
+        self.index.add(self.small)
+        self.index.add(self.large)
+
+    def test_at(self):
+        self.assertEqual([self.small], self.index.at((15, 15)))
+        self.assertEqual([self.large], self.index.at((240, 240)))
+        self.assertEqual([], self.index.at((40, 40)))
+        self.assertEqual([], self.index.at((500, 500)))
+
+    def test_update(self):
+        self.small.rect.topleft = (300, 300)
+        self.assertEqual([self.small], self.index.at((15, 15)))
+        self.index.update(self.small)
+        self.assertEqual([], self.index.at((15, 15)))
+        self.assertEqual([self.small], self.index.at((305, 305)))
+
+    def test_refresh(self):
+        self.large.rect.topleft = (400, 400)
+        self.index.refresh()
+        self.assertEqual([], self.index.at((240, 240)))
+        self.assertEqual([self.large], self.index.at((450, 450)))
+
+    def test_remove(self):
+        self.index.remove(self.large)
+        self.assertFalse(self.large in self.index)
+        self.assertEqual(1, len(self.index))
+        self.assertEqual([], self.index.at((240, 240)))
+        self.assertEqual([(0, 0)], list(self.index._cells))
+
+
+class TestClickableGroup(unittest.TestCase):
+
+    def setUp(self):
+        self.squares = [Square('square %d' % i, (i * 50, 0, 50, 50)) for i in range(20)]
+        self.counter = Counter('counter', (0, 100, 50, 50))
+        self.group = common.ClickableGroup(self.squares + [self.counter])
+
+    def test_only_squares_under_mouse_see_events(self):
+        self.group.process_events(motion((75, 25)))
+        self.assertEqual([0, 1, 0], [square.entered for square in self.squares[:3]])
+        self.group.process_events(motion((125, 25)))
+        self.assertEqual([0, 1, 1], [square.entered for square in self.squares[:3]])
+        self.assertEqual(1, self.squares[1].left)
+
+    def test_overridden_process_events_sees_every_event(self):
+        self.group.process_events(motion((25, 125)))
+        self.group.process_events(motion((500, 25)))
+        self.assertEqual(2, self.counter.events)
+        self.assertEqual(1, self.counter.left)
+
+    def test_index_rebuilt_when_items_added(self):
+        self.group.process_events(motion((25, 25)))
+        extra = Square('extra', (0, 200, 50, 50))
+        self.group.append(extra)
+        self.group.process_events(motion((25, 225)))
+        self.assertEqual(1, extra.entered)
+
+    def test_moved_items_found(self):
+        self.group.process_events(motion((25, 25)))
+        self.squares[5].rect.topleft = (0, 300)
+        self.squares[6].rect = pg.Rect(0, 400, 50, 50)
+        self.group.process_events(motion((25, 325)))
+        self.assertEqual(1, self.squares[5].entered)
+        self.group.process_events(motion((25, 425)))
+        self.assertEqual(1, self.squares[6].entered)
+        self.group.process_events(motion((325, 25)))
+        self.assertFalse(self.squares[6].mouse_over)
+
+    def test_without_index(self):
+        common.ClickableGroup.use_index = False
+        try:
+            self.group.process_events(motion((75, 25)))
+        finally:
+            common.ClickableGroup.use_index = True
+        self.assertEqual(1, self.squares[1].entered)
+        self.assertEqual(1, self.counter.events)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+"""Tests for the pool of reusable state instances"""
+
+import unittest
+import pygame as pg
+
+
+# Make the tests work from the test directory
+import sys
+sys.path.append('..')
+try:
+    from data import state, state_pool
+except ImportError:
+    print('\n** ERROR ** Tests must be run from the test directory\n\n')
+    sys.exit(1)
+
+
+class Game(state.State):
+    reusable = True
+
+    def __init__(self, shared=None):
+        super(Game, self).__init__()
+        self.table = pg.Surface((10, 10), 0, 32)
+        self.corner = self.table.subsurface((0, 0, 5, 5))
+        self.sprites = {'logo': [pg.Surface((5, 2), 0, 32)]}
+        self.shared = shared
+
+
+class TestInstanceSize(unittest.TestCase):
+
+    def test_counts_owned_surfaces_once(self):
+        self.assertEqual(440, state_pool.instance_size(Game()))
+
+    def test_shared_surfaces_not_counted(self):
+        shared = pg.Surface((100, 100), 0, 32)
+        game = Game(shared)
+        self.assertEqual(440, state_pool.instance_size(game, [id(shared)]))
+        self.assertEqual(40440, state_pool.instance_size(game))
+
+    def test_other_states_not_followed(self):
+        game = Game()
+        game.previous_game = Game()
+        self.assertEqual(440, state_pool.instance_size(game))
+
+
+class TestStatePool(unittest.TestCase):
+
+    def setUp(self):
+        self.pool = state_pool.StatePool(max_states=2, budget=1000)
+
+    def test_take_returns_pooled_instance_once(self):
+        game = Game()
+        self.pool.put('game', game, 440)
+        self.assertTrue(self.pool.take('game') is game)
+        self.assertEqual(None, self.pool.take('game'))
+        self.assertEqual((1, 1), (self.pool.hits, self.pool.misses))
+        self.assertEqual(0, self.pool.resident)
+
+    def test_least_recently_pooled_evicted_by_count(self):
+        for name in ('one', 'two', 'three'):
+            self.pool.put(name, Game(), 100)
+        self.assertFalse('one' in self.pool)
+        self.assertTrue('three' in self.pool)
+        self.assertEqual(1, self.pool.evictions)
+
+    def test_least_recently_pooled_evicted_by_budget(self):
+        self.pool.put('one', Game(), 600)
+        self.pool.put('two', Game(), 600)
+        self.assertEqual(['two'], list(self.pool._states))
+        self.assertEqual(600, self.pool.resident)
+        self.pool.put('huge', Game(), 2000)
+        self.assertEqual(0, len(self.pool))
+        self.assertEqual(0, self.pool.resident)
+
+    def test_reset(self):
+        game = Game()
+        game.done = game.quit = True
+        game.next = 'lobby'
+        game.reset()
+        self.assertEqual((False, False, None), (game.done, game.quit, game.next))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,99 @@
+"""Tests for the cache of rendered text surfaces"""
+
+import unittest
+import pygame as pg
+
+
+# Make the tests work from the test directory
+import sys
+sys.path.append('..')
+try:
+    from data.components import labels, text_cache
+except ImportError:
+    print('\n** ERROR ** Tests must be run from the test directory\n\n')
+    sys.exit(1)
+
+
+class TestTextCache(unittest.TestCase):
+
+    def setUp(self):
+        pg.font.init()
+        self.font = pg.font.Font(None, 24)
+        self.cache = text_cache.TextCache()
+
+    def test_render_once(self):
+        first = self.cache.render(self.font, 'Bet', (255, 255, 255))
+        second = self.cache.render(self.font, 'Bet', pg.Color('white'))
+        self.assertEqual(1, self.cache.misses)
+        self.assertEqual(1, self.cache.hits)
+        self.assertIs(first.get_parent(), second.get_parent())
+
+    def test_key_includes_colors(self):
+        self.cache.render(self.font, 'Bet', (255, 255, 255))
+        self.cache.render(self.font, 'Bet', (255, 0, 0))
+        self.cache.render(self.font, 'Bet', (255, 255, 255), (0, 0, 0))
+        self.cache.render(self.font, 'Bet', (255, 255, 255), antialias=False)
+        self.assertEqual(4, self.cache.misses)
+        self.assertEqual(4, len(self.cache))
+
+    def test_views_have_own_alpha(self):
+        first = self.cache.render(self.font, 'Bet', (255, 255, 255))
+        second = self.cache.render(self.font, 'Bet', (255, 255, 255))
+        first.set_alpha(10)
+        first.set_colorkey((1, 2, 3))
+        self.assertEqual(255, second.get_alpha())
+        self.assertEqual(None, second.get_colorkey())
+
+    def test_least_recently_used_dropped(self):
+        self.cache.fetch('a', lambda: pg.Surface((10, 10), 0, 32))
+        self.cache.fetch('b', lambda: pg.Surface((10, 10), 0, 32))
+        self.cache.budget = self.cache.size
+        self.cache.fetch('a', lambda: None)
+        self.cache.fetch('c', lambda: pg.Surface((10, 10), 0, 32))
+        self.assertIn('a', self.cache)
+        self.assertNotIn('b', self.cache)
+        self.assertEqual(self.cache.budget, self.cache.size)
+
+    def test_too_large_not_kept(self):
+        self.cache.budget = 100
+        surface = self.cache.fetch('a', lambda: pg.Surface((10, 10), 0, 32))
+        self.assertEqual((10, 10), surface.get_size())
+        self.assertEqual(0, len(self.cache))
+        self.assertEqual(0, self.cache.size)
+
+    def test_sections(self):
+        self.cache.section = 'keno'
+        self.cache.render(self.font, '1', (255, 255, 255))
+        self.cache.render(self.font, '1', (255, 255, 255))
+        self.cache.section = 'craps'
+        self.cache.render(self.font, '1', (255, 255, 255))
+        self.assertEqual([1, 1], self.cache.sections['keno'])
+        self.assertEqual([1, 0], self.cache.sections['craps'])
+        self.assertIn('craps', self.cache.report())
+
+
+class TestLabel(unittest.TestCase):
+
+    def test_labels_share_pixels(self):
+        first = labels.Label(None, 30, 'Pass', 'white', {'center': (50, 50)})
+        second = labels.Label(None, 30, 'Pass', 'white', {'topleft': (0, 0)})
+        self.assertIs(first.image.get_parent(), second.image.get_parent())
+        self.assertEqual((50, 50), first.rect.center)
+
+    def test_fading_one_label(self):
+        first = labels.Label(None, 30, 'Fade', 'white', {'topleft': (0, 0)})
+        second = labels.Label(None, 30, 'Fade', 'white', {'topleft': (0, 0)})
+        first.image.set_alpha(0)
+        surface = pg.Surface(second.rect.size)
+        first.draw(surface)
+        self.assertEqual(0, max(surface.get_at((x, y)).r
+                                for x in range(surface.get_width())
+                                for y in range(surface.get_height())))
+        second.draw(surface)
+        self.assertEqual(255, max(surface.get_at((x, y)).r
+                                  for x in range(surface.get_width())
+                                  for y in range(surface.get_height())))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,127 @@
+"""Tests for running animations with the batch tween engine"""
+
+import unittest
+import pygame as pg
+
+
+# Make the tests work from the test directory
+import sys
+sys.path.append('..')
+try:
+    from data.components import tween
+    from data.components.animation import Animation, AnimationGroup, AnimationTransition, Task
+except ImportError:
+    print('\n** ERROR ** Tests must be run from the test directory\n\n')
+    sys.exit(1)
+
+
+class Target(object):
+
+    def __init__(self):
+        self.x = 0
+        self.y = 10
+        self.values = []
+
+    def set_value(self, value):
+        self.values.append(value)
+
+
+@unittest.skipIf(tween.numpy is None, 'NumPy is not installed')
+class TestTweenEngine(unittest.TestCase):
+
+    def test_vector_transitions_match(self):
+        progress = tween.numpy.linspace(0.0, 1.0, 41)
+        for name, vector in tween.VECTOR_TRANSITIONS.items():
+            scalar = getattr(AnimationTransition, name)
+            for p, value in zip(progress.tolist(), vector(progress).tolist()):
+                self.assertAlmostEqual(scalar(p), value, msg=name)
+
+    def test_other_transitions_per_row(self):
+        engine = tween.TweenEngine()
+        target = Target()
+        engine.add('owner', target, 'x', 0, 100, 100,
+                   transition=AnimationTransition.out_bounce)
+        engine.step(50)
+        self.assertAlmostEqual(100 * AnimationTransition.out_bounce(0.5), target.x)
+
+    def test_rows_grow_and_reuse(self):
+        engine = tween.TweenEngine(capacity=2)
+        targets = [Target() for _ in range(5)]
+        for index, target in enumerate(targets):
+            engine.add(index, target, 'x', 0, 10, 100)
+        engine.remove(0)
+        engine.add('new', targets[0], 'y', 10, 20, 100)
+        self.assertEqual(8, engine._capacity)
+        self.assertEqual(5, len(engine))
+        self.assertEqual(['new', 1, 2, 3, 4], engine.step(100))
+        self.assertEqual(20, targets[0].y)
+
+
+class TestAnimationGroup(unittest.TestCase):
+
+    def setUp(self):
+        self.group = AnimationGroup()
+        self.group.batch_size = 1
+
+    def test_matches_plain_group(self):
+        plain = pg.sprite.Group()
+        targets = []
+        for group in (plain, self.group):
+            target = Target()
+            animation = Animation(x=100, y=-30, duration=200, delay=50,
+                                  transition='in_out_quint', round_values=True)
+            animation.start(target)
+            group.add(animation)
+            targets.append(target)
+        for _ in range(10):
+            plain.update(20)
+            self.group.update(20)
+            self.assertEqual((targets[0].x, targets[0].y), (targets[1].x, targets[1].y))
+            self.assertTrue(isinstance(targets[1].x, int))
+
+    def test_finish_and_callbacks(self):
+        target = Target()
+        calls = []
+        animation = Animation(set_value=10, initial=0, duration=100)
+        animation.update_callback = lambda: calls.append('update')
+        animation.callback = lambda: calls.append('done')
+        animation.start(target)
+        self.group.add(animation)
+        self.group.update(60)
+        self.group.update(60)
+        self.assertEqual([6.0, 10.0, 10], target.values)
+        self.assertEqual(['update', 'update', 'update', 'done'], calls)
+        self.assertEqual(0, len(self.group))
+        self.assertEqual(0, len(self.group.engine or ()))
+
+    def test_tasks_still_run(self):
+        calls = []
+        self.group.add(Task(lambda: calls.append(1), 50))
+        animation = Animation(x=10, duration=100)
+        animation.start(Target())
+        self.group.add(animation)
+        self.group.update(50)
+        self.assertEqual([1], calls)
+
+    def test_removed_animation_keeps_progress(self):
+        target = Target()
+        animation = Animation(x=100, duration=100, delay=20)
+        animation.start(target)
+        self.group.add(animation)
+        self.group.update(40)
+        animation.remove(self.group)
+        animation.update(30)
+        self.assertAlmostEqual(50, target.x)
+
+    def test_few_animations_updated_one_at_a_time(self):
+        self.group.batch_size = 2
+        animation = Animation(x=10, duration=100)
+        animation.start(Target())
+        self.group.add(animation)
+        self.group.update(10)
+        self.assertEqual(10, animation._elapsed)
+        self.assertEqual(0, len(self.group.engine or ()))
+
+
+if __name__ == '__main__':
+    unittest.main()